@@ -33,6 +33,18 @@ class PipelineDAG:
             self.reverse_adj[node] = []
             logger.info(f"Added node: {node}")
     
+    def add_node_unchecked(self, node: str) -> None:
+        """
+        Add a node without the duplicate check or logging done by add_node.
+        
+        Intended for internal, construction-heavy paths (short-lived probe DAGs
+        or bulk building of large graphs) where the caller guarantees the node
+        is new. Call validate() afterwards if the invariants need confirming.
+        """
+        self.nodes.append(node)
+        self.adj_list[node] = []
+        self.reverse_adj[node] = []
+    
     def add_edge(self, src: str, dst: str) -> None:
         """Add a directed edge from src to dst."""
         # Ensure both nodes exist
@@ -49,6 +61,21 @@ class PipelineDAG:
             self.reverse_adj[dst].append(src)
             logger.info(f"Added edge: {src} -> {dst}")
 
+    def validate(self) -> None:
+        """
+        Check the structural invariants of the DAG.
+        
+        Raises:
+            ValueError: If nodes are duplicated, an edge references an unknown
+                node, or the graph contains a cycle
+        """
+        if len(set(self.nodes)) != len(self.nodes):
+            raise ValueError("DAG contains duplicate nodes")
+        for src, dst in self.edges:
+            if src not in self.adj_list or dst not in self.adj_list:
+                raise ValueError(f"Edge {src} -> {dst} references an unknown node")
+        self.topological_sort()
+
     def get_dependencies(self, node: str) -> List[str]:
         """Return immediate dependencies (parents) of a node."""
         return self.reverse_adj.get(node, [])
@@ -56,9 +83,8 @@ class PipelineDAG:
     def topological_sort(self) -> List[str]:
         """Return nodes in topological order."""
         
-        in_degree = {n: 0 for n in self.nodes}
-        for src, dst in self.edges:
-            in_degree[dst] += 1
+        # In-degrees come from the reverse adjacency list, no extra pass over edges
+        in_degree = {n: len(self.reverse_adj[n]) for n in self.nodes}
 
         queue = deque([n for n in self.nodes if in_degree[n] == 0])
         order = []
@@ -5,23 +5,27 @@ This assembler leverages the specification-based dependency resolution system
 to intelligently connect steps and build complete SageMaker pipelines.
 """
 
-from typing import Dict, List, Any, Optional, Type, Set, Tuple
+from typing import Dict, List, Any, Optional, Type, Set, Tuple, NamedTuple
 from sagemaker.workflow.pipeline import Pipeline
 from sagemaker.workflow.steps import Step
 from sagemaker.workflow.parameters import ParameterString
 from sagemaker.workflow.pipeline_context import PipelineSession
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import os
 import time
 import traceback
-from collections import defaultdict
+from collections import defaultdict, deque
+from functools import lru_cache
+from operator import itemgetter
 
 from ..base import BasePipelineConfig, StepBuilderBase
 from ..deps.registry_manager import RegistryManager
 from ..deps.dependency_resolver import UnifiedDependencyResolver, create_dependency_resolver
 from ..deps.factory import create_pipeline_components
 from ..deps.property_reference import PropertyReference
-from ..base import OutputSpec
+from ..base import OutputSpec, DependencySpec, StepSpecification
 from ...steps.registry.step_names import CONFIG_STEP_REGISTRY
 
 from ...api.dag.base_dag import PipelineDAG
@@ -30,6 +34,37 @@ from ...api.dag.base_dag import PipelineDAG
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _resolve_step_type(config_class_name: str) -> str:
+    """
+    Resolve the canonical step type for a config class name.
+    
+    Results are cached per class name, so the fallback warning is logged
+    once per config class rather than once per config instance.
+    
+    Args:
+        config_class_name: Name of the config class
+        
+    Returns:
+        Canonical step type
+    """
+    # Use the centralized registry to get the canonical step type
+    step_type = CONFIG_STEP_REGISTRY.get(config_class_name)
+    if not step_type:
+        # Fall back to old method if not in registry
+        step_type = BasePipelineConfig.get_step_name(config_class_name)
+        logger.warning(f"Config class {config_class_name} not found in registry, using derived name: {step_type}")
+    return step_type
+
+
+class StepMessage(NamedTuple):
+    """Connection from a source step output to a destination step dependency."""
+    source_step: str
+    source_output: str
+    match_type: str
+    compatibility: float
+
+
 class PipelineAssembler:
     """
     Assembles pipeline steps using a DAG and step builders with specification-based dependency resolution.
@@ -39,7 +74,7 @@ class PipelineAssembler:
     the code and improve maintainability.
     
     The assembler follows these steps to build a pipeline:
-    1. Initialize step builders for all steps in the DAG
+    1. Initialize step builders for the steps in the DAG on first use
     2. Determine the build order using topological sort
     3. Propagate messages between steps using the dependency resolver
     4. Instantiate steps in topological order, delegating input/output handling to builders
@@ -84,6 +119,9 @@ class PipelineAssembler:
         self.notebook_root = notebook_root or Path.cwd()
         self.pipeline_parameters = pipeline_parameters or []
         
+        # Opt-in concurrent instantiation of independent steps
+        self._parallel = os.getenv('CURSUS_PARALLEL_STEP_CREATION', 'false').lower() == 'true'
+        
         # Store or create dependency components
         context_name = None
         for cfg in config_map.values():
@@ -98,80 +136,305 @@ class PipelineAssembler:
 
         self.step_instances: Dict[str, Step] = {}
         self.step_builders: Dict[str, StepBuilderBase] = {}
+        # Specification of each step builder, None if the builder has none
+        self._specs: Dict[str, Optional[StepSpecification]] = {}
+        # Snapshot of each specification's outputs and dependencies
+        self._spec_outputs: Dict[str, Tuple[Tuple[str, OutputSpec], ...]] = {}
+        self._spec_dependencies: Dict[str, Tuple[Tuple[str, DependencySpec], ...]] = {}
+        
+        # Store connections between steps, keyed by (destination step, dependency name)
+        self.step_messages: Dict[Tuple[str, str], StepMessage] = {}
+        
+        # Runtime properties keyed by (source step, id of output spec), shared by
+        # all downstream steps consuming the same output; reset with step_instances
+        self._runtime_prop_cache: Dict[Tuple[str, int], Any] = {}
+        
+        # Validate inputs, resolve builder classes and reject cyclic DAGs
+        # before any step builder is instantiated
+        self._validate_inputs()
+        
+        # Build order and step connections cached across generate_pipeline calls
+        self._build_order: Optional[List[str]] = None
+        self._dag_signature: Optional[Tuple[Any, ...]] = self._current_dag_signature()
         
-        # Store connections between steps
-        self.step_messages = defaultdict(dict)
+        # Step builders are instantiated on first use, see _get_builder()
+
+
+    def _validate_inputs(self) -> None:
+        """
+        Validate the DAG against the config map and step builder map.
+        
+        Resolves the step type and builder class of each step, builds the
+        adjacency maps and checks the DAG for cycles.
         
-        # Validate inputs
+        Raises:
+            ValueError: If a node has no config, a config has no step builder,
+                an edge references an unknown node or the DAG contains a cycle
+        """
         # Check that all nodes in the DAG have a corresponding config
         missing_configs = [node for node in self.dag.nodes if node not in self.config_map]
         if missing_configs:
             raise ValueError(f"Missing configs for nodes: {missing_configs}")
         
+        # Resolve the canonical step type for each config once; reused by
+        # builder initialization and step instantiation
+        self._step_types: Dict[str, str] = {}
+        
         # Check that all configs have a corresponding step builder
         for step_name, config in self.config_map.items():
-            config_class_name = type(config).__name__
-            # Use the centralized registry to get the canonical step type
-            step_type = CONFIG_STEP_REGISTRY.get(config_class_name)
-            if not step_type:
-                # Fall back to old method if not in registry
-                step_type = BasePipelineConfig.get_step_name(config_class_name)
-                logger.warning(f"Config class {config_class_name} not found in registry, using derived name: {step_type}")
-            
+            step_type = _resolve_step_type(type(config).__name__)
             if step_type not in self.step_builder_map:
                 raise ValueError(f"Missing step builder for step type: {step_type}")
+            self._step_types[step_name] = step_type
+        
+        # Builder class for each DAG node
+        self._builder_classes: Dict[str, Type[StepBuilderBase]] = {
+            step_name: self.step_builder_map[self._step_types[step_name]]
+            for step_name in self.dag.nodes
+        }
         
         # Check that all edges in the DAG connect nodes that exist in the DAG
+        node_set = set(self.dag.nodes)
         for src, dst in self.dag.edges:
-            if src not in self.dag.nodes:
+            if src not in node_set:
                 raise ValueError(f"Edge source node not in DAG: {src}")
-            if dst not in self.dag.nodes:
+            if dst not in node_set:
                 raise ValueError(f"Edge destination node not in DAG: {dst}")
         
         logger.info("Input validation successful")
         
-        # Initialize step builders
-        self._initialize_step_builders()
+        # Immediate predecessors and successors of each step, built once from the DAG edges
+        self._predecessors: Dict[str, List[str]] = defaultdict(list)
+        self._successors: Dict[str, List[str]] = defaultdict(list)
+        self._build_adjacency()
+        
+        # Reject cyclic DAGs
+        cycle = self._find_cycle()
+        if cycle:
+            raise ValueError(f"DAG contains a cycle: {' -> '.join(cycle)}")
+
+    def _build_adjacency(self) -> None:
+        """Build the step predecessor and successor maps from the DAG edges."""
+        self._predecessors = defaultdict(list)
+        self._successors = defaultdict(list)
+        for src, dst in self.dag.edges:
+            self._predecessors[dst].append(src)
+            self._successors[src].append(dst)
+
+    def _find_cycle(self) -> Optional[List[str]]:
+        """
+        Find a cycle in the DAG using Tarjan's strongly connected components.
+        
+        Runs iteratively in O(V+E) over the successor map. The first strongly
+        connected component that contains a cycle is walked to recover the
+        offending cycle.
+        
+        Returns:
+            Cycle as a list of step names starting and ending with the same
+            step, or None if the DAG is acyclic
+        """
+        index_of: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        stack: List[str] = []
+        on_stack: Set[str] = set()
+        
+        for root in self.dag.nodes:
+            if root in index_of:
+                continue
+            index_of[root] = lowlink[root] = len(index_of)
+            stack.append(root)
+            on_stack.add(root)
+            work = [(root, iter(self._successors.get(root, ())))]
+            
+            while work:
+                node, successors = work[-1]
+                descended = False
+                for successor in successors:
+                    if successor not in index_of:
+                        index_of[successor] = lowlink[successor] = len(index_of)
+                        stack.append(successor)
+                        on_stack.add(successor)
+                        work.append((successor, iter(self._successors.get(successor, ()))))
+                        descended = True
+                        break
+                    if successor in on_stack:
+                        lowlink[node] = min(lowlink[node], index_of[successor])
+                if descended:
+                    continue
+                
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                
+                if lowlink[node] == index_of[node]:
+                    # Node is the root of a strongly connected component
+                    component = set()
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.add(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in self._successors.get(node, ()):
+                        return self._walk_cycle(node, component)
+        return None
+
+    def _walk_cycle(self, start: str, component: Set[str]) -> List[str]:
+        """
+        Recover a cycle from a strongly connected component.
+        
+        Every step in the component has a successor inside it, so following
+        successors from start must eventually revisit a step.
+        """
+        path = [start]
+        position = {start: 0}
+        node = start
+        while True:
+            node = next(s for s in self._successors[node] if s in component)
+            if node in position:
+                return path[position[node]:] + [node]
+            position[node] = len(path)
+            path.append(node)
+
+    def _kahn_sort(self) -> List[str]:
+        """
+        Topologically sort the DAG using Kahn's algorithm.
+        
+        Uses the precomputed adjacency maps, so in-degrees come straight from
+        the predecessor lists instead of another scan over the edges. The order
+        matches PipelineDAG.topological_sort.
+        
+        Returns:
+            Step names in topological order
+            
+        Raises:
+            ValueError: If the DAG contains a cycle
+        """
+        in_degree = {node: len(self._predecessors.get(node, ())) for node in self.dag.nodes}
+        queue = deque(node for node in self.dag.nodes if in_degree[node] == 0)
+        order = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for successor in self._successors.get(node, ()):
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    queue.append(successor)
+        if len(order) != len(in_degree):
+            raise ValueError("DAG has cycles or disconnected nodes")
+        return order
+
+    def _topological_sort(self) -> List[str]:
+        """
+        Determine the build order for the DAG.
+        
+        DAG types that override topological_sort keep their own ordering;
+        otherwise the sort runs on the assembler's adjacency maps.
+        """
+        if getattr(type(self.dag), 'topological_sort', None) is PipelineDAG.topological_sort:
+            return self._kahn_sort()
+        return self.dag.topological_sort()
+
+    def _current_dag_signature(self) -> Tuple[Any, ...]:
+        """
+        Get a signature identifying the current DAG structure and config map.
+        
+        PipelineDAG only grows through add_node/add_edge, so the DAG identity
+        together with its node and edge counts changes whenever it is mutated.
+        The config map identity and the identity of each config entry are
+        included so that replacing the config map, or adding or replacing
+        configs in it, is detected as well.
+        """
+        return (
+            id(self.dag), len(self.dag.nodes), len(self.dag.edges),
+            id(self.config_map),
+            tuple((step_name, id(config)) for step_name, config in self.config_map.items())
+        )
+
+    def invalidate_cache(self) -> None:
+        """
+        Discard the cached build order and step connections.
+        
+        The next generate_pipeline call recomputes them. Call this after
+        changing the DAG or step specifications in place. Replacing entries of
+        the config map is detected by generate_pipeline, which then also
+        rebuilds the step builders; configs modified in place are not.
+        """
+        self._build_order = None
+        self._dag_signature = None
+        self.step_messages = {}
+        for step_name, builder in self.step_builders.items():
+            self._cache_spec(step_name, builder)
+
+    def _cache_spec(self, step_name: str, builder: StepBuilderBase) -> None:
+        """Cache a builder's specification and its output/dependency items."""
+        spec = getattr(builder, 'spec', None) or None
+        self._specs[step_name] = spec
+        if spec is not None:
+            self._spec_outputs[step_name] = tuple(spec.outputs.items())
+            self._spec_dependencies[step_name] = tuple(spec.dependencies.items())
+        else:
+            self._spec_outputs[step_name] = ()
+            self._spec_dependencies[step_name] = ()
+
+    def _get_builder(self, step_name: str) -> StepBuilderBase:
+        """
+        Get the step builder for a step, instantiating it on first access.
+        
+        The builder is created from the config in config_map and the builder
+        class resolved for the step during validation.
+        
+        Args:
+            step_name: Name of the step
+            
+        Returns:
+            Step builder instance for the step
+        """
+        builder = self.step_builders.get(step_name)
+        if builder is not None:
+            return builder
+        
+        try:
+            config = self.config_map[step_name]
+            step_type = self._step_types[step_name]
+            builder_cls = self._builder_classes[step_name]
+            
+            # Initialize the builder with dependency components
+            builder = builder_cls(
+                config=config,
+                sagemaker_session=self.sagemaker_session,
+                role=self.role,
+                notebook_root=self.notebook_root,
+                registry_manager=self._registry_manager,       # Pass component
+                dependency_resolver=self._dependency_resolver,  # Pass component
+            )
+            self.step_builders[step_name] = builder
+            self._cache_spec(step_name, builder)
+            logger.info(f"Initialized builder for step {step_name} of type {step_type}")
+            return builder
+        except Exception as e:
+            logger.error(f"Error initializing builder for step {step_name}: {e}")
+            raise ValueError(f"Failed to initialize step builder for {step_name}: {e}") from e
 
+    def _get_spec(self, step_name: str) -> Optional[StepSpecification]:
+        """Get the specification of a step's builder, instantiating the builder if needed."""
+        if step_name not in self._specs:
+            self._get_builder(step_name)
+        return self._specs[step_name]
 
     def _initialize_step_builders(self) -> None:
         """
         Initialize step builders for all steps in the DAG.
         
-        This method creates a step builder instance for each step in the DAG,
-        using the corresponding config from config_map and the appropriate
-        builder class from step_builder_map.
+        Builders are otherwise created lazily as steps are connected and
+        instantiated; this method creates any that do not exist yet.
         """
         logger.info("Initializing step builders")
         start_time = time.time()
         
         for step_name in self.dag.nodes:
-            try:
-                config = self.config_map[step_name]
-                config_class_name = type(config).__name__
-                # Use the centralized registry to get the canonical step type
-                step_type = CONFIG_STEP_REGISTRY.get(config_class_name)
-                if not step_type:
-                    # Fall back to old method if not in registry
-                    step_type = BasePipelineConfig.get_step_name(config_class_name)
-                    logger.warning(f"Config class {config_class_name} not found in registry, using derived name: {step_type}")
-                    
-                builder_cls = self.step_builder_map[step_type]
-                
-                # Initialize the builder with dependency components
-                builder = builder_cls(
-                    config=config,
-                    sagemaker_session=self.sagemaker_session,
-                    role=self.role,
-                    notebook_root=self.notebook_root,
-                    registry_manager=self._registry_manager,       # Pass component
-                    dependency_resolver=self._dependency_resolver,  # Pass component
-                )
-                self.step_builders[step_name] = builder
-                logger.info(f"Initialized builder for step {step_name} of type {step_type}")
-            except Exception as e:
-                logger.error(f"Error initializing builder for step {step_name}: {e}")
-                raise ValueError(f"Failed to initialize step builder for {step_name}: {e}") from e
+            self._get_builder(step_name)
         
         elapsed_time = time.time() - start_time
         logger.info(f"Initialized {len(self.step_builders)} step builders in {elapsed_time:.2f} seconds")
@@ -185,60 +448,96 @@ class PipelineAssembler:
         to intelligently match inputs to outputs based on specifications.
         """
         logger.info("Initializing step connections using specifications")
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
         # Get dependency resolver
         resolver = self._get_dependency_resolver()
         
+        # Compatibility scores keyed by (dependency, output, provider) spec identity.
+        # Edges between steps that share specifications reuse the same scores.
+        compatibility_cache: Dict[Tuple[int, int, int], float] = {}
+        
+        # Provider outputs indexed by output type, keyed by provider spec identity.
+        # An output whose type is incompatible with a dependency always scores 0.0,
+        # so only outputs of compatible types are scored.
+        output_index: Dict[int, Dict[Any, List[Tuple[int, str, OutputSpec]]]] = {}
+        type_compatibility: Dict[Tuple[Any, Any], bool] = {}
+        
         # Process each edge in the DAG
         for src_step, dst_step in self.dag.edges:
-            # Skip if builders don't exist
-            if src_step not in self.step_builders or dst_step not in self.step_builders:
+            # Skip if specifications don't exist
+            src_spec = self._get_spec(src_step)
+            if src_spec is None:
                 continue
-                
-            # Get specs
-            src_builder = self.step_builders[src_step]
-            dst_builder = self.step_builders[dst_step]
-            
-            # Skip if no specifications
-            if not hasattr(src_builder, 'spec') or not src_builder.spec or \
-               not hasattr(dst_builder, 'spec') or not dst_builder.spec:
+            dst_spec = self._get_spec(dst_step)
+            if dst_spec is None:
                 continue
                 
+            outputs_by_type = output_index.get(id(src_spec))
+            if outputs_by_type is None:
+                outputs_by_type = defaultdict(list)
+                for position, (out_name, out_spec) in enumerate(self._spec_outputs[src_step]):
+                    outputs_by_type[out_spec.output_type].append((position, out_name, out_spec))
+                output_index[id(src_spec)] = outputs_by_type
+                
             # Let resolver match outputs to inputs
-            for dep_name, dep_spec in dst_builder.spec.dependencies.items():
-                matches = []
+            for dep_name, dep_spec in self._spec_dependencies[dst_step]:
+                # Collect outputs of compatible types, keeping declaration order
+                candidates = []
+                for out_type, typed_outputs in outputs_by_type.items():
+                    type_key = (dep_spec.dependency_type, out_type)
+                    compatible = type_compatibility.get(type_key)
+                    if compatible is None:
+                        compatible = bool(
+                            dep_spec.dependency_type == out_type or
+                            resolver._are_types_compatible(dep_spec.dependency_type, out_type)
+                        )
+                        type_compatibility[type_key] = compatible
+                    if compatible:
+                        candidates.extend(typed_outputs)
+                if len(outputs_by_type) > 1:
+                    candidates.sort(key=itemgetter(0))
                 
-                # Check if source step can provide this dependency
-                for out_name, out_spec in src_builder.spec.outputs.items():
-                    compatibility = resolver._calculate_compatibility(dep_spec, out_spec, src_builder.spec)
-                    if compatibility > 0.5:  # Same threshold as resolver
-                        matches.append((out_name, out_spec, compatibility))
+                # Check if source step can provide this dependency, keeping the
+                # first output with the highest score
+                best_match = None
+                for _, out_name, out_spec in candidates:
+                    cache_key = (id(dep_spec), id(out_spec), id(src_spec))
+                    compatibility = compatibility_cache.get(cache_key)
+                    if compatibility is None:
+                        compatibility = resolver._calculate_compatibility(dep_spec, out_spec, src_spec)
+                        compatibility_cache[cache_key] = compatibility
+                    if compatibility > 0.5 and (best_match is None or compatibility > best_match[2]):  # Same threshold as resolver
+                        best_match = (out_name, out_spec, compatibility)
+                        # Scores are capped at 1.0, later outputs can only tie
+                        if compatibility > 0.999:
+                            break
                 
                 # Use best match if found
-                if matches:
-                    # Sort by compatibility score
-                    matches.sort(key=lambda x: x[2], reverse=True)
-                    best_match = matches[0]
-                    
+                if best_match:
                     # Check if there's already a better match
-                    existing_match = self.step_messages.get(dst_step, {}).get(dep_name)
+                    existing_match = self.step_messages.get((dst_step, dep_name))
                     should_update = True
 
                     if existing_match:
-                        existing_score = existing_match.get('compatibility', 0)
+                        existing_score = existing_match.compatibility
                         if existing_score >= best_match[2]:
                             should_update = False
-                            logger.debug(f"Skipping lower-scoring match for {dst_step}.{dep_name}: {src_step}.{best_match[0]} (score: {best_match[2]:.2f} < existing: {existing_score:.2f})")
+                            if debug_enabled:
+                                logger.debug(f"Skipping lower-scoring match for {dst_step}.{dep_name}: {src_step}.{best_match[0]} (score: {best_match[2]:.2f} < existing: {existing_score:.2f})")
 
                     if should_update:
                         # Store in step_messages
-                        self.step_messages[dst_step][dep_name] = {
-                            'source_step': src_step,
-                            'source_output': best_match[0],
-                            'match_type': 'specification_match',
-                            'compatibility': best_match[2]
-                        }
-                        logger.info(f"Matched {dst_step}.{dep_name} to {src_step}.{best_match[0]} (score: {best_match[2]:.2f})")
+                        self.step_messages[(dst_step, dep_name)] = StepMessage(
+                            source_step=src_step,
+                            source_output=best_match[0],
+                            match_type='specification_match',
+                            compatibility=best_match[2]
+                        )
+                        if debug_enabled:
+                            logger.debug(f"Matched {dst_step}.{dep_name} to {src_step}.{best_match[0]} (score: {best_match[2]:.2f})")
+        
+        logger.info(f"Matched {len(self.step_messages)} step dependencies using specifications")
 
     def _generate_outputs(self, step_name: str) -> Dict[str, Any]:
         """
@@ -253,28 +552,27 @@ class PipelineAssembler:
         Returns:
             Dictionary with output paths based on specification
         """
-        builder = self.step_builders[step_name]
+        spec = self._get_spec(step_name)
         config = self.config_map[step_name]
         
         # If builder has no specification, return empty dict
-        if not hasattr(builder, 'spec') or not builder.spec:
+        if spec is None:
             logger.warning(f"Step {step_name} has no specification, returning empty outputs")
             return {}
         
         # Get base S3 location - single source of truth
         base_s3_loc = getattr(config, 'pipeline_s3_loc', 's3://default-bucket/pipeline')
         
-        # Generate outputs dictionary based on specification
-        outputs = {}
-        step_type = builder.spec.step_type.lower()
+        # Standard path pattern: {base_s3_loc}/{step_type}/{logical_name}
+        prefix = f"{base_s3_loc}/{spec.step_type.lower()}/"
         
         # Use each output specification to generate standard output path
-        for logical_name, output_spec in builder.spec.outputs.items():
-            # Standard path pattern: {base_s3_loc}/{step_type}/{logical_name}
-            outputs[logical_name] = f"{base_s3_loc}/{step_type}/{logical_name}"
-            
-            # Add debug log
-            logger.debug(f"Generated output for {step_name}.{logical_name}: {outputs[logical_name]}")
+        outputs = {logical_name: prefix + logical_name for logical_name, _ in self._spec_outputs[step_name]}
+        
+        # Add debug log
+        if logger.isEnabledFor(logging.DEBUG):
+            for logical_name, output_path in outputs.items():
+                logger.debug(f"Generated output for {step_name}.{logical_name}: {output_path}")
             
         return outputs
     
@@ -293,31 +591,35 @@ class PipelineAssembler:
         Returns:
             Instantiated SageMaker Pipeline Step
         """
-        builder = self.step_builders[step_name]
+        builder = self._get_builder(step_name)
         
         # Get dependency steps
         dependencies = []
-        for dep_name in self.dag.get_dependencies(step_name):
+        for dep_name in self._predecessors.get(step_name, ()):
             if dep_name in self.step_instances:
                 dependencies.append(self.step_instances[dep_name])
         
-        # Extract parameters from message dictionaries for backward compatibility
+        # Extract parameters from step messages; messages only exist for
+        # dependencies declared in the step's specification
         inputs = {}
-        if step_name in self.step_messages:
-            for input_name, message in self.step_messages[step_name].items():
-                src_step = message['source_step']
-                src_output = message['source_output']
-                if src_step in self.step_instances:
-                    # Try to get the source step's builder to access its specifications
-                    src_builder = self.step_builders.get(src_step)
-                    output_spec = None
-                    
-                    # Try to find the output spec for this output name
-                    if src_builder and hasattr(src_builder, 'spec') and src_builder.spec:
-                        output_spec = src_builder.spec.get_output_by_name_or_alias(src_output)
-                    
-                    if output_spec:
-                        try:
+        for input_name, _ in self._spec_dependencies.get(step_name, ()):
+            message = self.step_messages.get((step_name, input_name))
+            if message is None:
+                continue
+            src_step = message.source_step
+            src_output = message.source_output
+            if src_step in self.step_instances:
+                # Try to find the output spec for this output name in the source step's specification
+                src_spec = self._get_spec(src_step)
+                output_spec = None
+                if src_spec is not None:
+                    output_spec = src_spec.get_output_by_name_or_alias(src_output)
+                
+                if output_spec:
+                    try:
+                        cache_key = (src_step, id(output_spec))
+                        runtime_prop = self._runtime_prop_cache.get(cache_key)
+                        if runtime_prop is None:
                             # Create a PropertyReference object
                             prop_ref = PropertyReference(
                                 step_name=src_step,
@@ -326,20 +628,22 @@ class PipelineAssembler:
                             
                             # Use the enhanced to_runtime_property method to get an actual SageMaker Properties object
                             runtime_prop = prop_ref.to_runtime_property(self.step_instances)
-                            inputs[input_name] = runtime_prop
-                            
+                            self._runtime_prop_cache[cache_key] = runtime_prop
+                        inputs[input_name] = runtime_prop
+                        
+                        if logger.isEnabledFor(logging.DEBUG):
                             logger.debug(f"Created runtime property reference for {step_name}.{input_name} -> {src_step}.{output_spec.property_path}")
-                        except Exception as e:
-                            # Log the error and fall back to a safe string
-                            logger.warning(f"Error creating runtime property reference: {str(e)}")
-                            s3_uri = f"s3://pipeline-reference/{src_step}/{src_output}"
-                            inputs[input_name] = s3_uri
-                            logger.warning(f"Using S3 URI fallback: {s3_uri}")
-                    else:
-                        # Create a safe string reference as a fallback
+                    except Exception as e:
+                        # Log the error and fall back to a safe string
+                        logger.warning(f"Error creating runtime property reference: {str(e)}")
                         s3_uri = f"s3://pipeline-reference/{src_step}/{src_output}"
                         inputs[input_name] = s3_uri
-                        logger.warning(f"Could not find output spec for {src_step}.{src_output}, using S3 URI placeholder: {s3_uri}")
+                        logger.warning(f"Using S3 URI fallback: {s3_uri}")
+                else:
+                    # Create a safe string reference as a fallback
+                    s3_uri = f"s3://pipeline-reference/{src_step}/{src_output}"
+                    inputs[input_name] = s3_uri
+                    logger.warning(f"Could not find output spec for {src_step}.{src_output}, using S3 URI placeholder: {s3_uri}")
         
         # Generate outputs using the specification
         outputs = self._generate_outputs(step_name)
@@ -357,8 +661,7 @@ class PipelineAssembler:
             logger.info(f"Built step {step_name}")
             
             # Special case for CradleDataLoading steps - store request dict for execution document
-            config = self.config_map[step_name]
-            step_type = BasePipelineConfig.get_step_name(type(config).__name__)
+            step_type = self._step_types[step_name]
             if step_type == "CradleDataLoading" and hasattr(builder, "get_request_dict"):
                 self.cradle_loading_requests[step.name] = builder.get_request_dict()
                 logger.info(f"Stored Cradle data loading request for step: {step.name}")
@@ -369,6 +672,55 @@ class PipelineAssembler:
             raise ValueError(f"Failed to build step {step_name}: {e}") from e
 
 
+    def _topological_levels(self, build_order: List[str]) -> List[List[str]]:
+        """
+        Group steps into levels that only depend on steps in earlier levels.
+        
+        Args:
+            build_order: Step names in topological order
+            
+        Returns:
+            Levels of step names, each level in build order
+        """
+        level_of: Dict[str, int] = {}
+        levels: List[List[str]] = []
+        for step_name in build_order:
+            level = max((level_of[dep] + 1 for dep in self._predecessors.get(step_name, ())), default=0)
+            level_of[step_name] = level
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(step_name)
+        return levels
+
+    def _instantiate_steps_by_level(self, build_order: List[str]) -> List[Step]:
+        """
+        Instantiate steps level by level, creating the steps of a level concurrently.
+        
+        Steps within a level are independent, so their builders can run in
+        parallel while the SageMaker SDK waits on I/O. A level is complete
+        before the next one starts, so every step sees its dependencies in
+        step_instances.
+        
+        Args:
+            build_order: Step names in topological order
+            
+        Returns:
+            Instantiated steps, level by level
+        """
+        steps: List[Step] = []
+        with ThreadPoolExecutor() as executor:
+            for level in self._topological_levels(build_order):
+                futures = [(step_name, executor.submit(self._instantiate_step, step_name)) for step_name in level]
+                for step_name, future in futures:
+                    try:
+                        step = future.result()
+                    except Exception as e:
+                        logger.error(f"Error instantiating step {step_name}: {e}")
+                        raise ValueError(f"Failed to instantiate step {step_name}: {e}") from e
+                    self.step_instances[step_name] = step
+                    steps.append(step)
+        return steps
+
     @classmethod
     def create_with_components(cls, 
                              dag: PipelineDAG,
@@ -432,29 +784,56 @@ class PipelineAssembler:
         if self.step_instances:
             logger.info("Clearing existing step instances for pipeline regeneration")
             self.step_instances = {}
-        
-        # Propagate messages between steps
-        self._propagate_messages()
-        
-        # Topological sort to determine build order
-        try:
-            build_order = self.dag.topological_sort()
-            logger.info(f"Build order: {build_order}")
-        except ValueError as e:
-            logger.error(f"Error in topological sort: {e}")
-            raise ValueError(f"Failed to determine build order: {e}") from e
+        self._runtime_prop_cache = {}
+        
+        # Revalidate and recompute build order and connections only if the
+        # DAG or config map changed
+        signature = self._current_dag_signature()
+        if signature != self._dag_signature:
+            if self._dag_signature is None or signature[3:] != self._dag_signature[3:]:
+                # Builders were created from the previous configs
+                self.step_builders = {}
+                self._specs = {}
+                self._spec_outputs = {}
+                self._spec_dependencies = {}
+            try:
+                self._validate_inputs()
+            except ValueError as e:
+                logger.error(f"Changed DAG failed validation: {e}")
+                raise ValueError(f"Failed to determine build order: {e}") from e
+            self.invalidate_cache()
+            self._dag_signature = signature
+        
+        if self._build_order is None:
+            # Propagate messages between steps
+            self._propagate_messages()
+            
+            # Topological sort to determine build order
+            try:
+                self._build_order = self._topological_sort()
+                logger.info(f"Build order: {self._build_order}")
+            except ValueError as e:
+                logger.error(f"Error in topological sort: {e}")
+                raise ValueError(f"Failed to determine build order: {e}") from e
+        else:
+            logger.info("Reusing cached build order and step connections")
+        build_order = self._build_order
         
         # Instantiate steps in topological order
-        for step_name in build_order:
-            try:
-                step = self._instantiate_step(step_name)
-                self.step_instances[step_name] = step
-            except Exception as e:
-                logger.error(f"Error instantiating step {step_name}: {e}")
-                raise ValueError(f"Failed to instantiate step {step_name}: {e}") from e
+        if self._parallel:
+            steps = self._instantiate_steps_by_level(build_order)
+        else:
+            steps = []
+            for step_name in build_order:
+                try:
+                    step = self._instantiate_step(step_name)
+                    self.step_instances[step_name] = step
+                    steps.append(step)
+                except Exception as e:
+                    logger.error(f"Error instantiating step {step_name}: {e}")
+                    raise ValueError(f"Failed to instantiate step {step_name}: {e}") from e
 
         # Create the pipeline
-        steps = [self.step_instances[name] for name in build_order]
         pipeline = Pipeline(
             name=pipeline_name,
             parameters=self.pipeline_parameters,
@@ -9,9 +9,12 @@ and best practices across different pipeline templates.
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional, Type, Set, Tuple
 from pathlib import Path
+from functools import lru_cache
 import logging
 import json
+import os
 
+from pydantic import BaseModel
 from sagemaker.workflow.pipeline import Pipeline
 from sagemaker.workflow.parameters import ParameterString
 from sagemaker.workflow.pipeline_context import PipelineSession
@@ -30,6 +33,39 @@ from ...api.dag.base_dag import PipelineDAG
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _load_configs_cached(
+    config_path: str,
+    mtime_ns: int,
+    size: int,
+    config_classes: Tuple[Tuple[str, Type[BasePipelineConfig]], ...]
+) -> Dict[str, BasePipelineConfig]:
+    """
+    Parse a configuration file once per (path, mtime, size, classes) key.
+    
+    The mtime and size are part of the key only so that edits to the file
+    invalidate the cached entry.
+    
+    Args:
+        config_path: Path to configuration file
+        mtime_ns: Modification time of the file in nanoseconds
+        size: Size of the file in bytes
+        config_classes: Sorted (class name, class) pairs used for loading
+        
+    Returns:
+        Dictionary of configurations
+    """
+    # Import here to avoid circular imports
+    from ...steps.configs.utils import load_configs
+    
+    return load_configs(config_path, dict(config_classes))
+
+
+def _clear_config_cache() -> None:
+    """Drop all parsed configuration files memoized by _load_configs_cached."""
+    _load_configs_cached.cache_clear()
+
+
 class PipelineTemplateBase(ABC):
     """
     Base class for all pipeline templates.
@@ -111,6 +147,10 @@ class PipelineTemplateBase(ABC):
         """
         Load configurations from file.
         
+        Parsed configurations are memoized per file path, modification time
+        and size, so templates created repeatedly for the same unchanged file
+        skip re-reading and re-validating it.
+        
         Args:
             config_path: Path to configuration file
             
@@ -130,8 +170,23 @@ class PipelineTemplateBase(ABC):
         # This ensures that template-specific classes override any defaults
         for class_name, class_type in self.CONFIG_CLASSES.items():
             complete_classes[class_name] = class_type
-            
-        return load_configs(config_path, complete_classes)
+        
+        try:
+            stat = os.stat(config_path)
+        except OSError:
+            # Let load_configs report unreadable paths as before
+            return load_configs(config_path, complete_classes)
+        
+        configs = _load_configs_cached(
+            str(config_path), stat.st_mtime_ns, stat.st_size,
+            tuple(sorted(complete_classes.items()))
+        )
+        # Return copies of the mapping and the config objects, so that changes a
+        # template makes to its configs never reach the cache or other templates
+        return {
+            name: config.model_copy(deep=True) if isinstance(config, BaseModel) else config
+            for name, config in configs.items()
+        }
         
     def _get_base_config(self) -> BasePipelineConfig:
         """
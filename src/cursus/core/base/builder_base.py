@@ -388,6 +388,9 @@ class StepBuilderBase(ABC):
             message: The log message
             *args, **kwargs: Values to format into the message
         """
+        # Skip the safe-value conversion entirely when INFO is filtered out
+        if not logger.isEnabledFor(logging.INFO):
+            return
         try:
             # Convert args and kwargs to safe strings
             safe_args = [safe_value_for_logging(arg) for arg in args]
@@ -400,6 +403,8 @@ class StepBuilderBase(ABC):
     
     def log_debug(self, message, *args, **kwargs):
         """Debug version of safe logging"""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         try:
             safe_args = [safe_value_for_logging(arg) for arg in args]
             safe_kwargs = {k: safe_value_for_logging(v) for k, v in kwargs.items()}
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field, model_validator, PrivateAttr
-from typing import List, Union, Dict, Any, Optional, ClassVar
+from typing import List, Union, Dict, Any, Optional, ClassVar, FrozenSet
 import json
 from io import StringIO
 
@@ -91,6 +91,7 @@ class ModelHyperparameters(BaseModel):
     _input_tab_dim: Optional[int] = PrivateAttr(default=None)
     _is_binary: Optional[bool] = PrivateAttr(default=None)
     _num_classes: Optional[int] = PrivateAttr(default=None)
+    _full_field_set: Optional[FrozenSet[str]] = PrivateAttr(default=None)
 
     class Config:
         arbitrary_types_allowed = True
@@ -128,6 +129,8 @@ class ModelHyperparameters(BaseModel):
         self._input_tab_dim = len(self.tab_field_list)
         self._num_classes = len(self.multiclass_categories)
         self._is_binary = (self._num_classes == 2)
+        # Rebuilt lazily; assignment re-runs this validator so the set never goes stale
+        self._full_field_set = None
         
         # Set default class_weights if not provided
         if self.class_weights is None:
@@ -143,6 +146,17 @@ class ModelHyperparameters(BaseModel):
             
         return self
     
+    def get_full_field_set(self) -> FrozenSet[str]:
+        """
+        Get full_field_list as a frozenset for repeated membership checks.
+        
+        A method rather than a property so it stays out of the derived-field tier
+        reported by categorize_fields() and printed by __str__().
+        """
+        if self._full_field_set is None:
+            self._full_field_set = frozenset(self.full_field_list)
+        return self._full_field_set
+    
     def categorize_fields(self) -> Dict[str, List[str]]:
         """
         Categorize all fields into three tiers:
@@ -9,6 +9,7 @@ configuration variants.
 from typing import Dict, List, Optional, Any, Tuple, Set
 import re
 import logging
+import threading
 from difflib import SequenceMatcher
 
 from ..base import BasePipelineConfig
@@ -60,8 +61,47 @@ class StepConfigResolver:
         """
         self.confidence_threshold = confidence_threshold
         self.logger = logging.getLogger(__name__)
-        self._metadata_mapping = {}  # Step name to config mapping from metadata
-        self._config_cache = {}      # Cache for parsed node names
+        # Per-resolution state lives in thread-local storage so that one
+        # resolver can serve concurrent resolutions (e.g. compile_many)
+        self._session = threading.local()
+    
+    @property
+    def _metadata_mapping(self) -> Dict[str, str]:
+        """Step name to config mapping from metadata for the current thread's resolution."""
+        try:
+            return self._session.metadata_mapping
+        except AttributeError:
+            self._session.metadata_mapping = {}
+            return self._session.metadata_mapping
+    
+    @_metadata_mapping.setter
+    def _metadata_mapping(self, value: Dict[str, str]) -> None:
+        self._session.metadata_mapping = value
+    
+    @property
+    def _config_cache(self) -> Dict[str, Dict[str, str]]:
+        """Cache for parsed node names of the current thread's resolution."""
+        try:
+            return self._session.config_cache
+        except AttributeError:
+            self._session.config_cache = {}
+            return self._session.config_cache
+    
+    @_config_cache.setter
+    def _config_cache(self, value: Dict[str, Dict[str, str]]) -> None:
+        self._session.config_cache = value
+    
+    def get_last_resolution_scores(self) -> Dict[str, Tuple[float, str, int]]:
+        """
+        Get the scores of the last successful resolve_config_map call in this thread.
+        
+        Returns:
+            Dictionary mapping node names to (confidence, method, similar_candidates)
+            tuples, where similar_candidates counts the configs that matched the
+            node within 0.1 of the chosen confidence (including the chosen one).
+            Empty if no resolution has completed in this thread.
+        """
+        return dict(getattr(self._session, 'resolution_scores', {}))
     
     def resolve_config_map(
         self, 
@@ -85,7 +125,8 @@ class StepConfigResolver:
             metadata: Optional metadata from configuration file
             
         Returns:
-            Dictionary mapping node names to configuration instances
+            Dictionary mapping node names to configuration instances. The scores
+            of the resolution are available from get_last_resolution_scores()
             
         Raises:
             ConfigurationError: If nodes cannot be resolved
@@ -97,18 +138,23 @@ class StepConfigResolver:
             self._metadata_mapping = metadata["config_types"]
             self.logger.info(f"Using metadata.config_types mapping with {len(self._metadata_mapping)} entries")
         
-        # Clear cache for this resolution session
+        # Clear cache and scores for this resolution session
         self._config_cache = {}
+        self._session.resolution_scores = {}
         
         # Proceed with node resolution
         resolved_configs = {}
+        resolution_scores = {}
         unresolved_nodes = []
         ambiguous_nodes = []
         
         for node_name in dag_nodes:
             try:
-                config, confidence, method = self._resolve_single_node(node_name, available_configs)
+                config, confidence, method, similar = self._resolve_single_node_ranked(
+                    node_name, available_configs
+                )
                 resolved_configs[node_name] = config
+                resolution_scores[node_name] = (confidence, method, similar)
                 self.logger.info(f"Resolved node '{node_name}' to {type(config).__name__} "
                                 f"(job_type='{getattr(config, 'job_type', 'N/A')}') "
                                 f"with confidence {confidence:.2f} using {method} matching")
@@ -152,6 +198,7 @@ class StepConfigResolver:
                 } for c in candidates]
             )
         
+        self._session.resolution_scores = resolution_scores
         return resolved_configs
     
     def _resolve_single_node(
@@ -172,6 +219,44 @@ class StepConfigResolver:
         Returns:
             Tuple of (config, confidence_score, resolution_method)
             
+        Raises:
+            ResolutionError: If no suitable config found
+            AmbiguityError: If multiple configs match with similar confidence
+        """
+        return self._resolve_single_node_ranked(node_name, available_configs)[:3]
+    
+    @staticmethod
+    def _count_similar_candidates(
+        candidates: List[Tuple[BasePipelineConfig, float, str]],
+        best_confidence: float
+    ) -> int:
+        """
+        Count the distinct configs whose confidence is within 0.1 of the best one.
+        
+        Args:
+            candidates: (config, confidence, method) tuples
+            best_confidence: Confidence of the chosen candidate
+            
+        Returns:
+            Number of distinct similar configs, including the chosen one
+        """
+        return len({id(c[0]) for c in candidates if best_confidence - c[1] < 0.1})
+    
+    def _resolve_single_node_ranked(
+        self,
+        node_name: str,
+        available_configs: Dict[str, BasePipelineConfig]
+    ) -> Tuple[BasePipelineConfig, float, str, int]:
+        """
+        Resolve a single DAG node and count the similar candidates it was chosen from.
+        
+        Args:
+            node_name: DAG node name
+            available_configs: Available configuration instances
+            
+        Returns:
+            Tuple of (config, confidence_score, resolution_method, similar_candidates)
+            
         Raises:
             ResolutionError: If no suitable config found
             AmbiguityError: If multiple configs match with similar confidence
@@ -179,7 +264,7 @@ class StepConfigResolver:
         # Tier 1: Try direct name matching - if successful, return immediately with highest confidence
         direct_match = self._direct_name_matching(node_name, available_configs)
         if direct_match:
-            return direct_match, 1.0, 'direct_name'
+            return direct_match, 1.0, 'direct_name', 1
         
         # Tier 2: Parse node name for information
         parsed_info = self._parse_node_name(node_name)
@@ -195,7 +280,8 @@ class StepConfigResolver:
             # If we found matches, use the best one
             if job_type_matches:
                 best_match = max(job_type_matches, key=lambda x: x[1])
-                return best_match[0], best_match[1], 'job_type_enhanced'
+                similar = self._count_similar_candidates(job_type_matches, best_match[1])
+                return best_match[0], best_match[1], 'job_type_enhanced', similar
         
         # Tier 4: Fall back to traditional matching strategies
         candidates = []
@@ -219,10 +305,11 @@ class StepConfigResolver:
         # Sort by confidence and return the best match
         candidates.sort(key=lambda x: x[1], reverse=True)
         best_match = candidates[0]
+        similar = self._count_similar_candidates(candidates, best_match[1])
         
         # Check if confidence is above threshold
         if best_match[1] >= self.confidence_threshold:
-            return best_match
+            return (*best_match, similar)
         
         # If multiple matches with similar confidence, report ambiguity
         close_matches = [c for c in candidates if c[1] >= best_match[1] - 0.05]
@@ -236,7 +323,7 @@ class StepConfigResolver:
         self.logger.warning(
             f"Using best match for '{node_name}' with below-threshold confidence {best_match[1]:.2f}"
         )
-        return best_match
+        return (*best_match, similar)
     
     def _direct_name_matching(
         self,
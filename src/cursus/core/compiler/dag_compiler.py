@@ -5,12 +5,15 @@ This module provides the main API functions for compiling PipelineDAG structures
 into executable SageMaker pipelines.
 """
 
-from typing import Optional, Dict, Any, Tuple
+from typing import Optional, Dict, Any, Tuple, List, Callable, ClassVar, Sequence, TYPE_CHECKING
+import copy
 import logging
-from pathlib import Path
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
-from sagemaker.workflow.pipeline import Pipeline
-from sagemaker.workflow.pipeline_context import PipelineSession
+import numpy as np
 
 from ...api.dag.base_dag import PipelineDAG
 from .config_resolver import StepConfigResolver
@@ -19,17 +22,24 @@ from .validation import ValidationResult, ResolutionPreview, ConversionReport, V
 from .exceptions import PipelineAPIError, ConfigurationError, ValidationError
 from ...steps.registry.exceptions import RegistryError
 
+# SageMaker types are only needed for annotations; importing them lazily keeps
+# the SDK off the import path of this module
+if TYPE_CHECKING:
+    from sagemaker.workflow.pipeline import Pipeline
+    from sagemaker.workflow.pipeline_context import PipelineSession
+    from .dynamic_template import DynamicPipelineTemplate
+
 logger = logging.getLogger(__name__)
 
 
 def compile_dag_to_pipeline(
     dag: PipelineDAG,
     config_path: str,
-    sagemaker_session: Optional[PipelineSession] = None,
+    sagemaker_session: Optional["PipelineSession"] = None,
     role: Optional[str] = None,
     pipeline_name: Optional[str] = None,
     **kwargs
-) -> Pipeline:
+) -> "Pipeline":
     """
     Compile a PipelineDAG into a complete SageMaker Pipeline.
     
@@ -74,10 +84,9 @@ def compile_dag_to_pipeline(
         if not dag.nodes:
             raise ValueError("DAG must contain at least one node")
             
-        logger.info(f"Compiling DAG with {len(dag.nodes)} nodes to pipeline")
+        logger.info("Compiling DAG with %d nodes to pipeline", len(dag.nodes))
         
-        config_path_obj = Path(config_path)
-        if not config_path_obj.exists():
+        if not os.path.exists(config_path):
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
         
         # Create compiler
@@ -91,11 +100,13 @@ def compile_dag_to_pipeline(
         # Use compile method which uses our create_template method
         pipeline = compiler.compile(dag, pipeline_name=pipeline_name)
         
-        logger.info(f"Successfully compiled DAG to pipeline: {pipeline.name}")
+        logger.info("Successfully compiled DAG to pipeline: %s", pipeline.name)
         return pipeline
         
+    except PipelineAPIError:
+        raise
     except Exception as e:
-        logger.error(f"Failed to compile DAG to pipeline: {e}")
+        logger.error("Failed to compile DAG to pipeline: %s", e)
         raise PipelineAPIError(f"DAG compilation failed: {e}") from e
 
 
@@ -107,10 +118,16 @@ class PipelineDAGCompiler:
     validation, debugging, and customization options.
     """
     
+    # Maximum number of templates kept in the per-compiler template cache
+    _TEMPLATE_CACHE_SIZE = 8
+    
+    # One-node DAG shared by all validate_config_file probes; built on first use
+    _PROBE_DAG: ClassVar[Optional[PipelineDAG]] = None
+    
     def __init__(
         self,
         config_path: str,
-        sagemaker_session: Optional[PipelineSession] = None,
+        sagemaker_session: Optional["PipelineSession"] = None,
         role: Optional[str] = None,
         config_resolver: Optional[StepConfigResolver] = None,
         builder_registry: Optional[StepBuilderRegistry] = None,
@@ -142,9 +159,25 @@ class PipelineDAGCompiler:
         # Store the last template created during compilation
         self._last_template = None
         
+        # Template of each thread's last compilation, so a report describes the
+        # template its own compile() used even while other threads compile
+        self._thread_state = threading.local()
+        
+        # Templates keyed by DAG identity, template kwargs and config file mtime
+        self._template_cache: Dict[tuple, "DynamicPipelineTemplate"] = {}
+        self._template_cache_lock = threading.Lock()
+        
+        # Locks serializing pipeline generation on templates shared between threads
+        self._template_locks = weakref.WeakKeyDictionary()
+        
+        # Last successful validate_config_file result with the config mtime it was computed for
+        self._cfg_validation_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        
+        # Registry-derived results stored with the registry and version they came from
+        self._registry_info_cache: Dict[str, Tuple[Any, Any, Any]] = {}
+        
         # Validate config file exists
-        config_path_obj = Path(config_path)
-        if not config_path_obj.exists():
+        if not os.path.exists(config_path):
             raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
     def validate_dag_compatibility(self, dag: PipelineDAG) -> ValidationResult:
@@ -164,22 +197,39 @@ class PipelineDAGCompiler:
             ValidationResult with detailed validation information
         """
         try:
-            self.logger.info(f"Validating DAG compatibility for {len(dag.nodes)} nodes")
+            self.logger.info("Validating DAG compatibility for %d nodes", len(dag.nodes))
+            
+            # Structural check first: a cyclic DAG fails before any config work
+            cycle = self.detect_cycle(dag)
+            if cycle:
+                return ValidationResult(
+                    is_valid=False,
+                    missing_configs=[],
+                    unresolvable_builders=[],
+                    config_errors={},
+                    dependency_issues=[f"DAG contains a cycle: {' -> '.join(cycle)}"],
+                    warnings=[]
+                )
             
             # Create a template using our create_template method
             temp_template = self.create_template(dag)
             
             # Get resolved mappings
-            dag_nodes = list(dag.nodes)
             available_configs = temp_template.configs
             
+            # Builder lookup overlaps with config resolution; the template shares
+            # one resolved config map between the two tasks
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                config_future = executor.submit(temp_template._create_config_map)
+                builder_future = executor.submit(temp_template._create_step_builder_map)
+            
             try:
-                config_map = temp_template._create_config_map()
+                config_map = config_future.result()
             except Exception as e:
                 # If config resolution fails, create partial validation result
                 return ValidationResult(
                     is_valid=False,
-                    missing_configs=dag_nodes,
+                    missing_configs=list(dag.nodes),
                     unresolvable_builders=[],
                     config_errors={'resolution': [str(e)]},
                     dependency_issues=[],
@@ -187,7 +237,7 @@ class PipelineDAGCompiler:
                 )
             
             try:
-                builder_map = temp_template._create_step_builder_map()
+                builder_map = builder_future.result()
             except Exception as e:
                 # If builder resolution fails, create partial validation result
                 return ValidationResult(
@@ -201,17 +251,18 @@ class PipelineDAGCompiler:
             
             # Run comprehensive validation
             validation_result = self.validation_engine.validate_dag_compatibility(
-                dag_nodes=dag_nodes,
+                dag_nodes=dag.nodes,
                 available_configs=available_configs,
                 config_map=config_map,
                 builder_registry=builder_map
             )
             
-            self.logger.info(f"Validation completed: {validation_result.summary()}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Validation completed: %s", validation_result.summary())
             return validation_result
             
         except Exception as e:
-            self.logger.error(f"Validation failed with error: {e}")
+            self.logger.error("Validation failed with error: %s", e)
             return ValidationResult(
                 is_valid=False,
                 missing_configs=[],
@@ -221,6 +272,52 @@ class PipelineDAGCompiler:
                 warnings=[]
             )
     
+    def detect_cycle(self, dag: PipelineDAG) -> Optional[List[str]]:
+        """
+        Detect a cycle in the DAG structure without loading any configuration.
+        
+        Uses an iterative depth-first search with white/gray/black node colors,
+        so it is cheap enough to gate expensive validation or compilation work.
+        
+        Args:
+            dag: PipelineDAG instance to check
+            
+        Returns:
+            List of node names forming the cycle (first node repeated at the
+            end), or None if the DAG is acyclic
+        """
+        adjacency = getattr(dag, 'adj_list', None)
+        if adjacency is None:
+            adjacency = {}
+            for src, dst in dag.edges:
+                adjacency.setdefault(src, []).append(dst)
+        
+        white, gray, black = 0, 1, 2
+        color = dict.fromkeys(dag.nodes, white)
+        
+        for root in dag.nodes:
+            if color[root] != white:
+                continue
+            color[root] = gray
+            path = [root]
+            stack = [iter(adjacency.get(root, ()))]
+            while stack:
+                for successor in stack[-1]:
+                    state = color.get(successor, white)
+                    if state == gray:
+                        return path[path.index(successor):] + [successor]
+                    if state == white:
+                        color[successor] = gray
+                        path.append(successor)
+                        stack.append(iter(adjacency.get(successor, ())))
+                        break
+                else:
+                    # All successors explored
+                    color[path.pop()] = black
+                    stack.pop()
+        
+        return None
+    
     def preview_resolution(self, dag: PipelineDAG) -> ResolutionPreview:
         """
         Preview how DAG nodes will be resolved to configs and builders.
@@ -238,76 +335,18 @@ class PipelineDAGCompiler:
             ResolutionPreview with detailed resolution information
         """
         try:
-            self.logger.info(f"Previewing resolution for {len(dag.nodes)} DAG nodes")
+            self.logger.info("Previewing resolution for %d DAG nodes", len(dag.nodes))
             
             # Create a template using our create_template method
             temp_template = self.create_template(dag)
             
-            # Get preview data
-            dag_nodes = list(dag.nodes)
-            available_configs = temp_template.configs
-            
-            # Get metadata from template if available
-            metadata = None
-            if hasattr(temp_template, '_loaded_metadata'):
-                metadata = temp_template._loaded_metadata
-            
-            # Get resolution candidates
-            preview_data = self.config_resolver.preview_resolution(
-                dag_nodes=dag_nodes,
-                available_configs=available_configs,
-                metadata=metadata
-            )
-            
-            # Build preview result
-            node_config_map = {}
-            config_builder_map = {}
-            resolution_confidence = {}
-            ambiguous_resolutions = []
-            recommendations = []
-            
-            for node, candidates in preview_data.items():
-                if candidates:
-                    best_candidate = candidates[0]
-                    config_type = best_candidate['config_type']
-                    confidence = best_candidate['confidence']
-                    
-                    node_config_map[node] = config_type
-                    resolution_confidence[node] = confidence
-                    
-                    # Get builder for this config type
-                    try:
-                        step_type = self.builder_registry._config_class_to_step_type(config_type)
-                        builder_class = self.builder_registry.get_builder_for_step_type(step_type)
-                        config_builder_map[config_type] = builder_class.__name__
-                    except Exception:
-                        config_builder_map[config_type] = "UNKNOWN"
-                    
-                    # Check for ambiguity
-                    if len(candidates) > 1 and abs(candidates[0]['confidence'] - candidates[1]['confidence']) < 0.1:
-                        ambiguous_resolutions.append(f"{node} has {len(candidates)} similar candidates")
-                    
-                    # Add recommendations for low confidence
-                    if confidence < 0.8:
-                        recommendations.append(f"Consider renaming '{node}' for better matching")
-                else:
-                    node_config_map[node] = "UNRESOLVED"
-                    resolution_confidence[node] = 0.0
-                    recommendations.append(f"Add configuration for node '{node}'")
-            
-            preview = ResolutionPreview(
-                node_config_map=node_config_map,
-                config_builder_map=config_builder_map,
-                resolution_confidence=resolution_confidence,
-                ambiguous_resolutions=ambiguous_resolutions,
-                recommendations=recommendations
-            )
+            preview = self._preview_from_template(dag, temp_template)
             
             self.logger.info("Resolution preview completed successfully")
             return preview
             
         except Exception as e:
-            self.logger.error(f"Failed to generate resolution preview: {e}")
+            self.logger.error("Failed to generate resolution preview: %s", e)
             # Return empty preview with error
             return ResolutionPreview(
                 node_config_map={},
@@ -317,7 +356,152 @@ class PipelineDAGCompiler:
                 recommendations=[f"Preview failed: {str(e)}"]
             )
     
-    def compile(self, dag: PipelineDAG, pipeline_name: Optional[str] = None, **kwargs) -> Pipeline:
+    def _preview_from_template(self, dag: PipelineDAG, template: "DynamicPipelineTemplate") -> ResolutionPreview:
+        """
+        Build the resolution preview for a DAG from an existing template.
+        
+        The preview is stored on the template, so later calls with the same
+        template (for example from compile_with_report after compile) reuse it.
+        
+        Args:
+            dag: PipelineDAG instance to preview
+            template: Template already created for the DAG
+            
+        Returns:
+            ResolutionPreview with detailed resolution information
+        """
+        cached_preview = getattr(template, '_resolution_preview', None)
+        if isinstance(cached_preview, ResolutionPreview):
+            return cached_preview
+        
+        # Get preview data
+        available_configs = template.configs
+        
+        # Get metadata from template if available
+        metadata = None
+        if hasattr(template, '_loaded_metadata'):
+            metadata = template._loaded_metadata
+        
+        # Get resolution candidates
+        preview_data = self.config_resolver.preview_resolution(
+            dag_nodes=dag.nodes,
+            available_configs=available_configs,
+            metadata=metadata
+        )
+        
+        # Build preview result
+        node_config_map = {}
+        config_builder_map = {}
+        resolution_confidence = {}
+        ambiguous_resolutions = []
+        recommendations = []
+        
+        nodes = list(preview_data.keys())
+        candidate_lists = list(preview_data.values())
+        
+        # Registered config types resolve through the registry's precomputed
+        # mapping; anything else is looked up once per config type
+        builder_cache: Dict[str, str] = {}
+        precomputed = getattr(self.builder_registry, 'config_to_builder_name', None)
+        if isinstance(precomputed, dict):
+            builder_cache.update(precomputed)
+        config_class_to_step_type = self.builder_registry._config_class_to_step_type
+        get_builder_for_step_type = self.builder_registry.get_builder_for_step_type
+        
+        # Best and runner-up confidences are read once per node here and reused
+        # by the vectorized score checks below
+        best_confidences: List[float] = []
+        second_confidences: List[float] = []
+        
+        for node, candidates in zip(nodes, candidate_lists):
+            if not candidates:
+                node_config_map[node] = "UNRESOLVED"
+                resolution_confidence[node] = 0.0
+                best_confidences.append(0.0)
+                second_confidences.append(np.nan)
+                continue
+            
+            best_candidate = candidates[0]
+            config_type = best_candidate['config_type']
+            conf0 = best_candidate['confidence']
+            
+            node_config_map[node] = config_type
+            resolution_confidence[node] = conf0
+            best_confidences.append(conf0)
+            second_confidences.append(candidates[1]['confidence'] if len(candidates) > 1 else np.nan)
+            
+            # Get builder for this config type
+            if config_type not in builder_cache:
+                try:
+                    step_type = config_class_to_step_type(config_type)
+                    builder_cache[config_type] = get_builder_for_step_type(step_type).__name__
+                except Exception:
+                    builder_cache[config_type] = "UNKNOWN"
+            config_builder_map[config_type] = builder_cache[config_type]
+        
+        # Score checks run as vector operations over all nodes at once; a missing
+        # runner-up confidence is NaN, which never counts as ambiguous
+        resolved = np.fromiter((bool(c) for c in candidate_lists), dtype=bool, count=len(nodes))
+        best = np.asarray(best_confidences, dtype=np.float64)
+        diff = best - np.asarray(second_confidences, dtype=np.float64)
+        ambiguous_mask = (diff > -0.1) & (diff < 0.1)
+        needs_recommendation = ~resolved | (best < 0.8)
+        
+        for i in np.flatnonzero(ambiguous_mask):
+            ambiguous_resolutions.append(f"{nodes[i]} has {len(candidate_lists[i])} similar candidates")
+        
+        for i in np.flatnonzero(needs_recommendation):
+            if resolved[i]:
+                # Add recommendations for low confidence
+                recommendations.append(f"Consider renaming '{nodes[i]}' for better matching")
+            else:
+                recommendations.append(f"Add configuration for node '{nodes[i]}'")
+        
+        preview = ResolutionPreview(
+            node_config_map=node_config_map,
+            config_builder_map=config_builder_map,
+            resolution_confidence=resolution_confidence,
+            ambiguous_resolutions=ambiguous_resolutions,
+            recommendations=recommendations
+        )
+        
+        template._resolution_preview = preview
+        return preview
+    
+    def _resolution_details_from_template(
+        self,
+        template: Optional["DynamicPipelineTemplate"],
+        dag_nodes: List[str]
+    ) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Get report resolution details from a template's already resolved mappings.
+        
+        Args:
+            template: Template used for compilation, if any
+            dag_nodes: DAG node names the report covers
+            
+        Returns:
+            Per-node details with a confidence score for every node, or None if
+            the template cannot provide them and the preview path must be used
+        """
+        get_details = getattr(template, 'get_resolution_details', None)
+        if template is None or not callable(get_details):
+            return None
+        
+        try:
+            details = get_details()
+        except Exception as e:
+            self.logger.warning("Could not get resolution details from compiled template: %s", e)
+            return None
+        
+        if not isinstance(details, dict):
+            return None
+        for node in dag_nodes:
+            if not isinstance(details.get(node, {}).get('confidence'), (int, float)):
+                return None
+        return details
+    
+    def compile(self, dag: PipelineDAG, pipeline_name: Optional[str] = None, **kwargs) -> "Pipeline":
         """
         Compile DAG to pipeline with full control.
         
@@ -333,20 +517,22 @@ class PipelineDAGCompiler:
             PipelineAPIError: If compilation fails
         """
         try:
-            self.logger.info(f"Compiling DAG with {len(dag.nodes)} nodes to pipeline")
+            self.logger.info("Compiling DAG with %d nodes to pipeline", len(dag.nodes))
             
-            # Reuse our create_template method but enforce skip_validation=True for performance
+            # Reuse a cached template but enforce skip_validation=True for performance
             # as the validation is typically done separately before compilation
             template_kwargs = {**self.template_kwargs, **kwargs}
             template_kwargs['skip_validation'] = True  # Skip validation for performance during direct compilation
             
-            template = self.create_template(dag, **template_kwargs)
+            template = self._get_or_create_template(dag, **template_kwargs)
             
-            # Build pipeline
-            pipeline = template.generate_pipeline()
+            # Build pipeline; a cached template may be shared with another thread
+            with self._template_lock(template):
+                pipeline = template.generate_pipeline()
             
             # Store the template after generate_pipeline() has updated its internal state
             self._last_template = template
+            self._thread_state.last_template = template
             
             # Override pipeline name if provided or generate a new one
             if pipeline_name:
@@ -362,19 +548,93 @@ class PipelineDAGCompiler:
                 # Generate a name using the same approach as PipelineTemplateBase
                 pipeline.name = generate_pipeline_name(base_name, version)
             
-            self.logger.info(f"Successfully compiled DAG to pipeline: {pipeline.name}")
+            self.logger.info("Successfully compiled DAG to pipeline: %s", pipeline.name)
             return pipeline
             
+        except PipelineAPIError:
+            raise
         except Exception as e:
-            self.logger.error(f"Failed to compile DAG to pipeline: {e}")
+            self.logger.error("Failed to compile DAG to pipeline: %s", e)
             raise PipelineAPIError(f"DAG compilation failed: {e}") from e
     
+    def compile_prevalidated(self, dag: PipelineDAG, pipeline_name: Optional[str] = None, **kwargs) -> "Pipeline":
+        """
+        Compile a DAG that is already known to be valid.
+        
+        This is the minimal happy path for trusted callers (CI, tests, stable
+        production pipelines): no compatibility validation, resolution preview,
+        report generation or error wrapping. Exceptions from template creation
+        or pipeline generation propagate unchanged.
+        
+        Args:
+            dag: PipelineDAG instance to compile
+            pipeline_name: Optional pipeline name override
+            **kwargs: Additional arguments for template
+            
+        Returns:
+            Generated SageMaker Pipeline
+        """
+        template_kwargs = {**self.template_kwargs, **kwargs, 'skip_validation': True}
+        template = self._get_or_create_template(dag, **template_kwargs)
+        
+        with self._template_lock(template):
+            pipeline = template.generate_pipeline()
+        self._last_template = template
+        self._thread_state.last_template = template
+        
+        if pipeline_name:
+            pipeline.name = pipeline_name
+        return pipeline
+    
+    def compile_many(
+        self,
+        dag_name_pairs: Sequence[Tuple[PipelineDAG, Optional[str]]],
+        max_workers: int = 8
+    ) -> List["Pipeline"]:
+        """
+        Compile several DAGs against this compiler's configuration concurrently.
+        
+        All DAGs share this compiler, so the configuration file is parsed once
+        and templates are reused through the template cache. A DAG listed more
+        than once shares one template, and its pipelines are generated one at
+        a time. The config resolver and builder registry are shared between
+        threads. The default StepConfigResolver keeps its per-resolution state
+        (metadata mapping and parsed node names) in thread-local storage, so
+        concurrent resolutions do not interfere; custom resolvers must be safe
+        for concurrent calls to resolve_config_map, and custom registries for
+        concurrent reads.
+        After this call get_last_template() returns the template of whichever
+        compilation finished last.
+        
+        Args:
+            dag_name_pairs: Sequence of (dag, pipeline_name) pairs; a name of
+                None generates the pipeline name as in compile()
+            max_workers: Maximum number of compilation threads
+            
+        Returns:
+            Compiled pipelines in the same order as dag_name_pairs
+            
+        Raises:
+            PipelineAPIError: If any compilation fails
+        """
+        if not dag_name_pairs:
+            return []
+        
+        self.logger.info("Compiling %d DAGs with up to %d workers", len(dag_name_pairs), max_workers)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.compile, dag, pipeline_name=pipeline_name)
+                for dag, pipeline_name in dag_name_pairs
+            ]
+            return [future.result() for future in futures]
+    
     def compile_with_report(
         self,
         dag: PipelineDAG,
         pipeline_name: Optional[str] = None,
         **kwargs
-    ) -> Tuple[Pipeline, ConversionReport]:
+    ) -> Tuple["Pipeline", ConversionReport]:
         """
         Compile DAG to pipeline and return detailed compilation report.
         
@@ -387,32 +647,54 @@ class PipelineDAGCompiler:
             Tuple of (Pipeline, ConversionReport)
         """
         try:
-            self.logger.info(f"Compiling DAG with detailed reporting")
+            self.logger.info("Compiling DAG with detailed reporting")
             
-            # Compile pipeline
+            # Compile pipeline, keeping the template this thread's compile() used
+            self._thread_state.last_template = None
             pipeline = self.compile(dag, pipeline_name=pipeline_name, **kwargs)
+            template = getattr(self._thread_state, 'last_template', None)
             
-            # Generate report
+            # Generate report; the node list is materialized once and shared
+            # by the loop and the report
             dag_nodes = list(dag.nodes)
-            resolution_details = {}
-            total_confidence = 0.0
-            warnings = []
+            ambiguous_resolutions = []
             
-            # Get resolution preview for report details
-            preview = self.preview_resolution(dag)
+            # Prefer the details the compiled template already resolved
+            resolution_details = self._resolution_details_from_template(template, dag_nodes)
             
+            if resolution_details is not None:
+                for node in dag_nodes:
+                    similar = resolution_details[node].get('similar_candidates')
+                    if isinstance(similar, int) and similar > 1:
+                        ambiguous_resolutions.append(f"{node} has {similar} similar candidates")
+            else:
+                # Get resolution preview for report details, reusing the template
+                # that compile() just built instead of creating another one
+                preview = None
+                if template is not None:
+                    try:
+                        preview = self._preview_from_template(dag, template)
+                    except Exception as e:
+                        self.logger.warning("Could not preview resolution from compiled template: %s", e)
+                if preview is None:
+                    preview = self.preview_resolution(dag)
+                
+                resolution_details = {}
+                for node in dag_nodes:
+                    if node in preview.node_config_map:
+                        config_type = preview.node_config_map[node]
+                        resolution_details[node] = {
+                            'config_type': config_type,
+                            'builder_type': preview.config_builder_map.get(config_type, 'Unknown'),
+                            'confidence': preview.resolution_confidence.get(node, 0.0)
+                        }
+                ambiguous_resolutions = preview.ambiguous_resolutions
+            
+            total_confidence = 0.0
+            warnings = []
             for node in dag_nodes:
-                if node in preview.node_config_map:
-                    config_type = preview.node_config_map[node]
-                    confidence = preview.resolution_confidence.get(node, 0.0)
-                    builder_type = preview.config_builder_map.get(config_type, 'Unknown')
-                    
-                    resolution_details[node] = {
-                        'config_type': config_type,
-                        'builder_type': builder_type,
-                        'confidence': confidence
-                    }
-                    
+                if node in resolution_details:
+                    confidence = resolution_details[node]['confidence']
                     total_confidence += confidence
                     
                     if confidence < 0.8:
@@ -421,7 +703,7 @@ class PipelineDAGCompiler:
             avg_confidence = total_confidence / len(dag_nodes) if dag_nodes else 0.0
             
             # Add ambiguity warnings
-            warnings.extend(preview.ambiguous_resolutions)
+            warnings.extend(ambiguous_resolutions)
             
             report = ConversionReport(
                 pipeline_name=pipeline.name,
@@ -433,15 +715,18 @@ class PipelineDAGCompiler:
                     'dag_nodes': len(dag_nodes),
                     'dag_edges': len(dag.edges),
                     'config_path': self.config_path,
-                    'builder_registry_stats': self.builder_registry.get_registry_stats()
+                    'builder_registry_stats': self._get_registry_stats()
                 }
             )
             
-            self.logger.info(f"Compilation completed with report: {report.summary()}")
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info("Compilation completed with report: %s", report.summary())
             return pipeline, report
             
+        except PipelineAPIError:
+            raise
         except Exception as e:
-            self.logger.error(f"Failed to compile DAG with report: {e}")
+            self.logger.error("Failed to compile DAG with report: %s", e)
             raise PipelineAPIError(f"DAG compilation with report failed: {e}") from e
     
     def create_template(self, dag: PipelineDAG, **kwargs) -> "DynamicPipelineTemplate":
@@ -449,6 +734,8 @@ class PipelineDAGCompiler:
         Create a pipeline template from the DAG without generating the pipeline.
         
         This allows inspecting or modifying the template before pipeline generation.
+        Each call returns a new template; the template cache used by compile()
+        and compile_prevalidated() is not consulted or populated.
         
         Args:
             dag: PipelineDAG instance to create a template for
@@ -464,7 +751,7 @@ class PipelineDAGCompiler:
             # Import here to avoid circular import
             from .dynamic_template import DynamicPipelineTemplate
             
-            self.logger.info(f"Creating template for DAG with {len(dag.nodes)} nodes")
+            self.logger.info("Creating template for DAG with %d nodes", len(dag.nodes))
             
             # Merge kwargs with default values
             template_kwargs = {**self.template_kwargs}
@@ -487,13 +774,98 @@ class PipelineDAGCompiler:
                 **template_kwargs
             )
             
-            self.logger.info(f"Successfully created template")
+            self.logger.info("Successfully created template")
             return template
             
+        except PipelineAPIError:
+            raise
         except Exception as e:
-            self.logger.error(f"Failed to create template: {e}")
+            self.logger.error("Failed to create template: %s", e)
             raise PipelineAPIError(f"Template creation failed: {e}") from e
     
+    def _template_cache_key(self, dag: PipelineDAG, template_kwargs: Dict[str, Any]) -> Optional[tuple]:
+        """
+        Build the template cache key for a DAG and template kwargs.
+        
+        The key includes the DAG's nodes and edges so that any edit to the DAG
+        after a template was cached produces a new template, and the config
+        file mtime so that edits to the configuration file are picked up.
+        
+        Args:
+            dag: PipelineDAG instance the template is created for
+            template_kwargs: Fully merged template constructor arguments
+            
+        Returns:
+            Hashable cache key, or None if the template cannot be cached
+        """
+        try:
+            mtime_ns = os.stat(self.config_path).st_mtime_ns
+            key = (
+                id(dag), tuple(dag.nodes), tuple(dag.edges),
+                tuple(sorted(template_kwargs.items())), mtime_ns
+            )
+            hash(key)
+        except (OSError, TypeError):
+            return None
+        return key
+    
+    def _get_or_create_template(self, dag: PipelineDAG, **template_kwargs) -> "DynamicPipelineTemplate":
+        """
+        Return a cached template for the DAG or create and cache a new one.
+        
+        Only the compile paths use this cache. Templates handed out by the public
+        create_template() are never cached, so changes made to them cannot leak
+        into later compilations.
+        
+        Args:
+            dag: PipelineDAG instance to create a template for
+            **template_kwargs: Fully merged template constructor arguments
+            
+        Returns:
+            DynamicPipelineTemplate instance for the DAG
+        """
+        key = self._template_cache_key(dag, template_kwargs)
+        if key is not None:
+            with self._template_cache_lock:
+                cached = self._template_cache.get(key)
+            if cached is not None:
+                self.logger.debug("Reusing cached template for DAG with %d nodes", len(dag.nodes))
+                return cached
+        
+        template = self.create_template(dag, **template_kwargs)
+        
+        if key is not None:
+            with self._template_cache_lock:
+                # Evict the oldest entry once the cache is full
+                if key not in self._template_cache and len(self._template_cache) >= self._TEMPLATE_CACHE_SIZE:
+                    self._template_cache.pop(next(iter(self._template_cache)))
+                self._template_cache[key] = template
+        
+        return template
+    
+    def _template_lock(self, template: "DynamicPipelineTemplate") -> threading.Lock:
+        """
+        Get the lock serializing pipeline generation on a template.
+        
+        Args:
+            template: Template about to generate a pipeline
+            
+        Returns:
+            Lock shared by every compilation using this template
+        """
+        with self._template_cache_lock:
+            lock = self._template_locks.get(template)
+            if lock is None:
+                lock = self._template_locks[template] = threading.Lock()
+            return lock
+    
+    def clear_template_cache(self) -> None:
+        """
+        Drop all cached templates so the next call re-reads the configuration.
+        """
+        with self._template_cache_lock:
+            self._template_cache.clear()
+    
     def get_supported_step_types(self) -> list:
         """
         Get list of supported step types.
@@ -501,31 +873,88 @@ class PipelineDAGCompiler:
         Returns:
             List of supported step type names
         """
-        return self.builder_registry.list_supported_step_types()
+        return list(self._cached_registry_info(
+            'supported_step_types', self.builder_registry.list_supported_step_types
+        ))
+    
+    def _get_registry_stats(self) -> Dict[str, int]:
+        """
+        Get builder registry statistics, cached until the registry changes.
+        
+        Returns:
+            Dictionary with registry statistics
+        """
+        return dict(self._cached_registry_info(
+            'registry_stats', self.builder_registry.get_registry_stats
+        ))
+    
+    def _cached_registry_info(self, name: str, compute: Callable[[], Any]) -> Any:
+        """
+        Return a cached registry-derived value, recomputing it when the registry changes.
+        
+        Registries without a ``_version`` attribute are never cached.
+        
+        Args:
+            name: Cache slot name
+            compute: Callable producing the value from the registry
+            
+        Returns:
+            Cached or freshly computed value
+        """
+        registry = self.builder_registry
+        version = getattr(registry, '_version', None)
+        if version is None:
+            return compute()
+        
+        cached = self._registry_info_cache.get(name)
+        if cached is not None and cached[0] is registry and cached[1] == version:
+            return cached[2]
+        
+        value = compute()
+        self._registry_info_cache[name] = (registry, version, value)
+        return value
     
     def validate_config_file(self) -> Dict[str, Any]:
         """
         Validate the configuration file structure.
         
+        Successful results are cached until the configuration file's
+        modification time changes.
+        
         Returns:
             Dictionary with validation results
         """
         try:
-            # Create a minimal DAG to test config loading
-            test_dag = PipelineDAG()
-            test_dag.add_node("test_node")
+            mtime_ns = os.stat(self.config_path).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        
+        cached = self._cfg_validation_cache
+        if mtime_ns is not None and cached is not None and cached[0] == mtime_ns:
+            return copy.deepcopy(cached[1])
+        
+        try:
+            # Reuse the minimal DAG used to test config loading
+            cls = type(self)
+            if cls._PROBE_DAG is None:
+                probe_dag = PipelineDAG()
+                probe_dag.add_node_unchecked("test_node")
+                cls._PROBE_DAG = probe_dag
             
             # Use create_template with skip_validation=True to just test config loading
-            temp_template = self.create_template(dag=test_dag, skip_validation=True)
+            temp_template = self.create_template(dag=cls._PROBE_DAG, skip_validation=True)
             
             configs = temp_template.configs
             
-            return {
+            result = {
                 'valid': True,
                 'config_count': len(configs),
                 'config_types': [type(config).__name__ for config in configs.values()],
                 'config_names': list(configs.keys())
             }
+            if mtime_ns is not None:
+                self._cfg_validation_cache = (mtime_ns, copy.deepcopy(result))
+            return result
             
         except Exception as e:
             return {
@@ -555,7 +984,7 @@ class PipelineDAGCompiler:
         execution_doc: Dict[str, Any],
         pipeline_name: Optional[str] = None,
         **kwargs
-    ) -> Tuple[Pipeline, Dict[str, Any]]:
+    ) -> Tuple["Pipeline", Dict[str, Any]]:
         """
         Compile a DAG to pipeline and fill an execution document in one step.
         
@@ -7,6 +7,7 @@ with any PipelineDAG structure without requiring custom template classes.
 
 from typing import Dict, Type, Any, Optional, List, TYPE_CHECKING
 import logging
+import threading
 
 from sagemaker.workflow.parameters import ParameterString
 from sagemaker.network import NetworkConfig
@@ -106,6 +107,10 @@ class DynamicPipelineTemplate(PipelineTemplateBase):
         self._resolved_config_map = None
         self._resolved_builder_map = None
         self._loaded_metadata = None  # Store metadata from loaded configs
+        self._resolution_preview = None  # Populated by PipelineDAGCompiler on first preview
+        self._resolution_scores = {}  # node -> (confidence, method, similar_candidates) from config resolution
+        # Serializes config resolution so concurrent callers share one result
+        self._config_map_lock = threading.Lock()
         
         # Call parent constructor AFTER setting CONFIG_CLASSES
         super().__init__(
@@ -164,8 +169,24 @@ class DynamicPipelineTemplate(PipelineTemplateBase):
         if self._resolved_config_map is not None:
             return self._resolved_config_map
         
+        with self._config_map_lock:
+            # Another thread may have resolved the map while we waited
+            if self._resolved_config_map is not None:
+                return self._resolved_config_map
+            return self._resolve_config_map_locked()
+    
+    def _resolve_config_map_locked(self) -> Dict[str, BasePipelineConfig]:
+        """
+        Resolve the config map; the caller must hold _config_map_lock.
+        
+        Returns:
+            Dictionary mapping DAG node names to configuration instances
+            
+        Raises:
+            ConfigurationError: If nodes cannot be resolved to configurations
+        """
         try:
-            dag_nodes = list(self._dag.nodes)
+            dag_nodes = self._dag.nodes
             self.logger.info(f"Resolving {len(dag_nodes)} DAG nodes to configurations")
             
             # Extract metadata from loaded configurations if available
@@ -175,21 +196,34 @@ class DynamicPipelineTemplate(PipelineTemplateBase):
                     self.logger.info(f"Using metadata from loaded configuration")
             
             # Use the config resolver to map nodes to configs
-            self._resolved_config_map = self._config_resolver.resolve_config_map(
+            config_map = self._config_resolver.resolve_config_map(
                 dag_nodes=dag_nodes,
                 available_configs=self.configs,
                 metadata=self._loaded_metadata
             )
             
-            self.logger.info(f"Successfully resolved all {len(self._resolved_config_map)} nodes")
+            # Keep the scores of this resolution for reporting; custom resolvers
+            # without get_last_resolution_scores provide none
+            get_scores = getattr(self._config_resolver, 'get_last_resolution_scores', None)
+            scores = get_scores() if callable(get_scores) else {}
+            if not isinstance(scores, dict):
+                scores = {}
+            self._resolution_scores = {
+                node: scores[node] for node in config_map if node in scores
+            }
+            
+            # Publish the map last so lock-free readers never see it before its scores
+            self._resolved_config_map = config_map
+            
+            self.logger.info(f"Successfully resolved all {len(config_map)} nodes")
             
             # Log resolution details
-            for node, config in self._resolved_config_map.items():
+            for node, config in config_map.items():
                 config_type = type(config).__name__
                 job_type = getattr(config, 'job_type', 'N/A')
                 self.logger.debug(f"  {node} → {config_type} (job_type: {job_type})")
             
-            return self._resolved_config_map
+            return config_map
             
         except Exception as e:
             self.logger.error(f"Failed to resolve DAG nodes to configurations: {e}")
@@ -266,7 +300,7 @@ class DynamicPipelineTemplate(PipelineTemplateBase):
             self.logger.info("Validating dynamic pipeline configuration")
             
             # Get resolved mappings
-            dag_nodes = list(self._dag.nodes)
+            dag_nodes = self._dag.nodes
             config_map = self._create_config_map()
             builder_map = self._create_step_builder_map()
             
@@ -310,7 +344,7 @@ class DynamicPipelineTemplate(PipelineTemplateBase):
             Dictionary with resolution preview information
         """
         try:
-            dag_nodes = list(self._dag.nodes)
+            dag_nodes = self._dag.nodes
             preview_data = self._config_resolver.preview_resolution(
                 dag_nodes=dag_nodes,
                 available_configs=self.configs,
@@ -348,6 +382,38 @@ class DynamicPipelineTemplate(PipelineTemplateBase):
             self.logger.error(f"Failed to generate resolution preview: {e}")
             return {'error': str(e)}
             
+    def get_resolution_details(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get per-node resolution details from the already resolved mappings.
+        
+        Unlike get_resolution_preview, this does not run config resolution
+        again; it reports the config map and confidence scores computed when
+        the template resolved its DAG nodes.
+        
+        Returns:
+            Dictionary mapping node names to dictionaries with 'config_type',
+            'builder_type', 'confidence' and 'similar_candidates' (None if no
+            score was recorded)
+        """
+        config_map = self._create_config_map()
+        details = {}
+        
+        for node, config in config_map.items():
+            try:
+                builder_type = self._builder_registry.get_builder_for_config(config, node_name=node).__name__
+            except RegistryError:
+                builder_type = 'Unknown'
+            
+            score = self._resolution_scores.get(node)
+            details[node] = {
+                'config_type': type(config).__name__,
+                'builder_type': builder_type,
+                'confidence': score[0] if score else None,
+                'similar_candidates': score[2] if score else None
+            }
+        
+        return details
+    
     def _store_pipeline_metadata(self, assembler: "PipelineAssembler") -> None:
         """
         Store pipeline metadata from template.
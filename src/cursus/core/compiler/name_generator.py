@@ -9,6 +9,7 @@ import random
 import string
 import logging
 import re
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
@@ -95,13 +96,16 @@ def sanitize_pipeline_name(name: str) -> str:
     return sanitized
 
 
+@lru_cache(maxsize=128)
 def generate_pipeline_name(base_name: str, version: str = "1.0") -> str:
     """
     Generate a valid pipeline name with the format:
-    {base_name}-{random_word}-{version}-pipeline
+    {base_name}-{version}-pipeline
     
     This function ensures the generated name conforms to SageMaker constraints
-    by sanitizing it before returning.
+    by sanitizing it before returning. The name is deterministic, so results
+    are memoized per (base_name, version); drop the cache if a random
+    component is ever reintroduced.
     
     Args:
         base_name: Base name for the pipeline
@@ -110,11 +114,8 @@ def generate_pipeline_name(base_name: str, version: str = "1.0") -> str:
     Returns:
         A string with the generated pipeline name that passes SageMaker validation
     """
-    # Generate random 4-letter word
-    random_word = generate_random_word(4)
-    
     # Combine all parts
-    name = f"{base_name}-{version}-pipeline" #f"{base_name}-{random_word}-{version}-pipeline"
+    name = f"{base_name}-{version}-pipeline" #f"{base_name}-{generate_random_word(4)}-{version}-pipeline"
     
     # Sanitize the name to ensure it conforms to SageMaker constraints
     return sanitize_pipeline_name(name)
@@ -20,6 +20,11 @@ logger = logging.getLogger(__name__)
 @dataclass
 class ValidationResult:
     """Result of DAG-config compatibility validation."""
+    __slots__ = (
+        'is_valid', 'missing_configs', 'unresolvable_builders',
+        'config_errors', 'dependency_issues', 'warnings'
+    )
+    
     is_valid: bool
     missing_configs: List[str]
     unresolvable_builders: List[str]
@@ -113,6 +118,11 @@ class ValidationResult:
 @dataclass
 class ResolutionPreview:
     """Preview of how DAG nodes will be resolved."""
+    __slots__ = (
+        'node_config_map', 'config_builder_map', 'resolution_confidence',
+        'ambiguous_resolutions', 'recommendations'
+    )
+    
     node_config_map: Dict[str, str]  # node -> config type
     config_builder_map: Dict[str, str]  # config type -> builder type
     resolution_confidence: Dict[str, float]  # confidence scores
@@ -156,6 +166,11 @@ class ResolutionPreview:
 @dataclass
 class ConversionReport:
     """Report generated after successful pipeline conversion."""
+    __slots__ = (
+        'pipeline_name', 'steps', 'resolution_details',
+        'avg_confidence', 'warnings', 'metadata'
+    )
+    
     pipeline_name: str
     steps: List[str]
     resolution_details: Dict[str, Dict[str, Any]]
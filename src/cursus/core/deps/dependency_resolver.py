@@ -6,13 +6,15 @@ matches step dependencies with compatible outputs from other steps.
 """
 
 from typing import Dict, List, Set, Optional, Tuple
+from operator import itemgetter
+import heapq
 import logging
 from ..base import (
     StepSpecification, DependencySpec, OutputSpec, DependencyType
 )
 from .property_reference import PropertyReference
 from .specification_registry import SpecificationRegistry
-from .semantic_matcher import SemanticMatcher
+from .semantic_matcher import SemanticMatcher, keyword_match_fraction
 
 logger = logging.getLogger(__name__)
 
@@ -344,16 +346,16 @@ class UnifiedDependencyResolver:
                     candidates.append((prop_ref, confidence, provider_step, output_name))
         
         if candidates:
-            # Sort by confidence (highest first)
-            candidates.sort(key=lambda x: x[1], reverse=True)
-            best_match = candidates[0]
+            # Highest confidence wins, first candidate on ties
+            best_match = max(candidates, key=itemgetter(1))
             
             logger.info(f"Best match for {dep_spec.logical_name}: "
                        f"{best_match[2]}.{best_match[3]} (confidence: {best_match[1]:.3f})")
             
             # Log alternative matches if they exist
-            if len(candidates) > 1:
-                alternatives = [(c[2], c[3], c[1]) for c in candidates[1:3]]  # Top 2 alternatives
+            if len(candidates) > 1 and logger.isEnabledFor(logging.DEBUG):
+                top_candidates = heapq.nlargest(3, candidates, key=itemgetter(1))
+                alternatives = [(c[2], c[3], c[1]) for c in top_candidates[1:]]  # Top 2 alternatives
                 logger.debug(f"Alternative matches: {alternatives}")
             
             return best_match[0]
@@ -495,12 +497,7 @@ class UnifiedDependencyResolver:
     
     def _calculate_keyword_match(self, keywords: List[str], output_name: str) -> float:
         """Calculate keyword matching score."""
-        if not keywords:
-            return 0.0
-        
-        output_lower = output_name.lower()
-        matches = sum(1 for keyword in keywords if keyword.lower() in output_lower)
-        return matches / len(keywords)
+        return keyword_match_fraction(tuple(keywords), output_name)
     
     def get_resolution_report(self, available_steps: List[str]) -> Dict[str, any]:
         """
@@ -8,12 +8,133 @@ across various SageMaker step types.
 
 from typing import Dict, List, Optional, Any, Union, Tuple
 import re
+from functools import lru_cache
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
 from ..base import OutputSpec
 
 
+# Regular expression patterns for property path parsing:
+# 1. Dictionary access: Outputs['key'] or Outputs["key"]
+_DICT_PATTERN = re.compile(r'(\w+)\[([\'"]?)([^\]\'\"]+)\2\]')
+# 2. Array indexing: Array[0]
+_ARRAY_PATTERN = re.compile(r'(\w+)\[(\d+)\]')
+# 3. Detect complex case with dot after bracket: Sub[0].Value
+_COMPLEX_PATTERN = re.compile(r'([^.]+\[\d+\])\.(.+)')
+
+
+@lru_cache(maxsize=1024)
+def parse_property_path(path: str) -> Tuple[Union[str, Tuple[str, str]], ...]:
+    """
+    Parse a SageMaker property path into a sequence of access operations.
+    
+    Results are cached per path string, so callers that navigate the same
+    property paths repeatedly do not re-parse them.
+    
+    Args:
+        path: Property path as a string, with or without the "properties." prefix
+        
+    Returns:
+        Tuple of access operations, where each operation is either:
+        - A string for attribute access
+        - A tuple (attr_name, key) for dictionary access or array indexing
+    """
+    # Remove "properties." prefix if present
+    if path.startswith("properties."):
+        path = path[11:]  # Remove "properties."
+
+    result = []
+
+    # Split by dots first, but preserve quoted parts and brackets
+    parts = []
+    current = ""
+    in_brackets = False
+    bracket_depth = 0
+
+    for char in path:
+        if char == '.' and not in_brackets:
+            if current:
+                parts.append(current)
+                current = ""
+        elif char == '[':
+            in_brackets = True
+            bracket_depth += 1
+            current += char
+        elif char == ']':
+            bracket_depth -= 1
+            if bracket_depth == 0:
+                in_brackets = False
+            current += char
+        else:
+            current += char
+
+    if current:
+        parts.append(current)
+
+    # Process each part
+    i = 0
+    while i < len(parts):
+        part = parts[i]
+
+        # Handle the complex case: "Sub[0].Value"
+        complex_match = _COMPLEX_PATTERN.match(part)
+        if complex_match:
+            # Split into bracket part and property part
+            bracket_part = complex_match.group(1)  # "Sub[0]"
+            property_part = complex_match.group(2)  # "Value"
+
+            # Process the bracket part
+            array_match = _ARRAY_PATTERN.match(bracket_part)
+            if array_match:
+                # Add the array name
+                array_name = array_match.group(1)
+                result.append(array_name)
+
+                # Add the array index as a tuple with empty attr_name
+                array_index = int(array_match.group(2))
+                result.append(("", array_index))
+
+            # Add the property part
+            result.append(property_part)
+
+            i += 1
+            continue
+
+        # Check if this part contains dictionary access
+        dict_match = _DICT_PATTERN.match(part)
+        if dict_match:
+            # Extract the attribute name and key
+            attr_name = dict_match.group(1)
+            quote_type = dict_match.group(2)  # This will be ' or " or empty
+            key = dict_match.group(3)
+
+            # Handle numeric indices
+            if not quote_type and key.isdigit():
+                key = int(key)
+
+            # Add a tuple for dictionary access
+            result.append((attr_name, key))
+        else:
+            # Check for pure array indexing
+            array_match = _ARRAY_PATTERN.match(part)
+            if array_match:
+                # Add the array name
+                array_name = array_match.group(1)
+                result.append(array_name)
+
+                # Add the array index as a tuple with empty attr_name
+                array_index = int(array_match.group(2))
+                result.append(("", array_index))
+            else:
+                # Regular attribute access
+                result.append(part)
+
+        i += 1
+
+    return tuple(result)
+
+
 class PropertyReference(BaseModel):
     """Lazy evaluation reference bridging definition-time and runtime."""
     
@@ -127,6 +248,9 @@ class PropertyReference(BaseModel):
         - Array indexing: "properties.TrainingJobSummaries[0]"
         - Mixed patterns: "properties.Config.Outputs['data'].Sub[0].Value"
         
+        Parsing is cached per path string, since the same spec property paths are
+        resolved for every reference to them.
+        
         Args:
             path: Property path as a string
             
@@ -135,107 +259,7 @@ class PropertyReference(BaseModel):
             - A string for attribute access
             - A tuple (attr_name, key) for dictionary access or array indexing
         """
-        # Remove "properties." prefix if present
-        if path.startswith("properties."):
-            path = path[11:]  # Remove "properties."
-        
-        result = []
-        
-        # Regular expression patterns:
-        # 1. Dictionary access: Outputs['key'] or Outputs["key"]
-        dict_pattern = re.compile(r'(\w+)\[([\'"]?)([^\]\'\"]+)\2\]')
-        # 2. Array indexing: Array[0]
-        array_pattern = re.compile(r'(\w+)\[(\d+)\]')
-        # 3. Detect complex case with dot after bracket: Sub[0].Value
-        complex_pattern = re.compile(r'([^.]+\[\d+\])\.(.+)')
-        
-        # Split by dots first, but preserve quoted parts and brackets
-        parts = []
-        current = ""
-        in_brackets = False
-        bracket_depth = 0
-        
-        for char in path:
-            if char == '.' and not in_brackets:
-                if current:
-                    parts.append(current)
-                    current = ""
-            elif char == '[':
-                in_brackets = True
-                bracket_depth += 1
-                current += char
-            elif char == ']':
-                bracket_depth -= 1
-                if bracket_depth == 0:
-                    in_brackets = False
-                current += char
-            else:
-                current += char
-        
-        if current:
-            parts.append(current)
-        
-        # Process each part
-        i = 0
-        while i < len(parts):
-            part = parts[i]
-            
-            # Handle the complex case: "Sub[0].Value"
-            complex_match = complex_pattern.match(part)
-            if complex_match:
-                # Split into bracket part and property part
-                bracket_part = complex_match.group(1)  # "Sub[0]"
-                property_part = complex_match.group(2)  # "Value"
-                
-                # Process the bracket part
-                array_match = array_pattern.match(bracket_part)
-                if array_match:
-                    # Add the array name
-                    array_name = array_match.group(1)
-                    result.append(array_name)
-                    
-                    # Add the array index as a tuple with empty attr_name
-                    array_index = int(array_match.group(2))
-                    result.append(("", array_index))
-                
-                # Add the property part
-                result.append(property_part)
-                
-                i += 1
-                continue
-            
-            # Check if this part contains dictionary access
-            dict_match = dict_pattern.match(part)
-            if dict_match:
-                # Extract the attribute name and key
-                attr_name = dict_match.group(1)
-                quote_type = dict_match.group(2)  # This will be ' or " or empty
-                key = dict_match.group(3)
-                
-                # Handle numeric indices
-                if not quote_type and key.isdigit():
-                    key = int(key)
-                    
-                # Add a tuple for dictionary access
-                result.append((attr_name, key))
-            else:
-                # Check for pure array indexing
-                array_match = array_pattern.match(part)
-                if array_match:
-                    # Add the array name
-                    array_name = array_match.group(1)
-                    result.append(array_name)
-                    
-                    # Add the array index as a tuple with empty attr_name
-                    array_index = int(array_match.group(2))
-                    result.append(("", array_index))
-                else:
-                    # Regular attribute access
-                    result.append(part)
-            
-            i += 1
-        
-        return result
+        return list(parse_property_path(path))
     
     def __str__(self) -> str:
         return f"{self.step_name}.{self.output_spec.logical_name}"
@@ -6,6 +6,7 @@ dependency names and output names to enable intelligent auto-resolution.
 """
 
 import re
+from functools import lru_cache
 from typing import List, Set, Dict, Tuple
 from difflib import SequenceMatcher
 import logging
@@ -13,6 +14,29 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4096)
+def keyword_match_fraction(keywords: Tuple[str, ...], name: str) -> float:
+    """
+    Fraction of keywords that occur (case-insensitively) as substrings of name.
+    
+    Specs share a small, fixed keyword vocabulary and a fixed set of output names,
+    so the same (keywords, name) pairs are scored over and over during resolution;
+    the result is cached per pair.
+    
+    Args:
+        keywords: Keywords to look for
+        name: Name to search in
+        
+    Returns:
+        Matched keyword count divided by the number of keywords (0.0 if there are none)
+    """
+    if not keywords:
+        return 0.0
+    name_lower = name.lower()
+    matches = sum(1 for keyword in keywords if keyword.lower() in name_lower)
+    return matches / len(keywords)
+
+
 class SemanticMatcher:
     """Semantic similarity matching for dependency resolution."""
     
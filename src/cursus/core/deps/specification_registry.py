@@ -8,6 +8,7 @@ and managing step specifications within isolated contexts.
 from typing import Dict, List, Optional, Any
 import logging
 from ..base import StepSpecification, DependencySpec, OutputSpec
+from .semantic_matcher import keyword_match_fraction
 
 logger = logging.getLogger(__name__)
 
@@ -102,11 +103,7 @@ class SpecificationRegistry:
         
         # Semantic keyword matching
         if dep_spec.semantic_keywords:
-            keyword_matches = sum(
-                1 for keyword in dep_spec.semantic_keywords
-                if keyword.lower() in out_spec.logical_name.lower()
-            )
-            score += (keyword_matches / len(dep_spec.semantic_keywords)) * 0.2
+            score += keyword_match_fraction(tuple(dep_spec.semantic_keywords), out_spec.logical_name) * 0.2
         
         return min(score, 1.0)  # Cap at 1.0
     
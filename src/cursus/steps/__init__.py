@@ -14,7 +14,6 @@ from .contracts import *
 from .hyperparams import *
 from .registry import *
 from .scripts import *
-from .specs import *
 
 # Re-export everything from submodules
 from .builders import __all__ as builders_all
@@ -25,6 +24,15 @@ from .registry import __all__ as registry_all
 from .scripts import __all__ as scripts_all
 from .specs import __all__ as specs_all
 
+
+def __getattr__(name):
+    """Resolve step specifications lazily through the specs package."""
+    if name in specs_all:
+        from . import specs
+        return getattr(specs, name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
 __all__ = (
     builders_all +
     configs_all +
@@ -1,48 +1,106 @@
-from typing import Dict, Optional, Any, List, Set, Union
+from typing import Dict, Optional, Any, List, Set, Union, TYPE_CHECKING
 from pathlib import Path
+import copy
 import logging
+import weakref
 import os
 import json
+import re
 import importlib
+import importlib.util
 from datetime import datetime
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from types import MappingProxyType
 
 from sagemaker.workflow.steps import ProcessingStep, Step
 from sagemaker.workflow.steps import CacheConfig
 from ...core.deps.registry_manager import RegistryManager
 from ...core.deps.dependency_resolver import UnifiedDependencyResolver
+from ...core.deps.property_reference import parse_property_path
 
-# Import CradleDataLoadingStep
-from secure_ai_sandbox_workflow_python_sdk.cradle_data_loading.cradle_data_loading_step import (
-    CradleDataLoadingStep,
-)
+if TYPE_CHECKING:
+    from secure_ai_sandbox_workflow_python_sdk.cradle_data_loading.cradle_data_loading_step import (
+        CradleDataLoadingStep,
+    )
 
-# Import Cradle models for request building
-try:
-    from com.amazon.secureaisandboxproxyservice.models.field import Field
-    from com.amazon.secureaisandboxproxyservice.models.datasource import DataSource
-    from com.amazon.secureaisandboxproxyservice.models.mdsdatasourceproperties import MdsDataSourceProperties
-    from com.amazon.secureaisandboxproxyservice.models.edxdatasourceproperties import EdxDataSourceProperties
-    from com.amazon.secureaisandboxproxyservice.models.andesdatasourceproperties import AndesDataSourceProperties
-    from com.amazon.secureaisandboxproxyservice.models.datasourcesspecification import DataSourcesSpecification
-    from com.amazon.secureaisandboxproxyservice.models.jobsplitoptions import JobSplitOptions
-    from com.amazon.secureaisandboxproxyservice.models.transformspecification import TransformSpecification
-    from com.amazon.secureaisandboxproxyservice.models.outputspecification import OutputSpecification
-    from com.amazon.secureaisandboxproxyservice.models.cradlejobspecification import CradleJobSpecification
-    from com.amazon.secureaisandboxproxyservice.models.createcradledataloadjobrequest import CreateCradleDataLoadJobRequest
-    CRADLE_MODELS_AVAILABLE = True
-except ImportError:
+# The Cradle SDK, the Cradle request models and coral_utils are heavy and only
+# needed when a step or request is actually built, so they are imported on first
+# use. Each entry maps a module-level name to (module path, attribute).
+_CRADLE_MODELS_MODULE = "com.amazon.secureaisandboxproxyservice.models"
+_CORAL_UTILS_MODULE = "secure_ai_sandbox_python_lib.utils"
+_LAZY_IMPORTS = {
+    "CradleDataLoadingStep": (
+        "secure_ai_sandbox_workflow_python_sdk.cradle_data_loading.cradle_data_loading_step",
+        "CradleDataLoadingStep",
+    ),
+    "Field": (f"{_CRADLE_MODELS_MODULE}.field", "Field"),
+    "DataSource": (f"{_CRADLE_MODELS_MODULE}.datasource", "DataSource"),
+    "MdsDataSourceProperties": (f"{_CRADLE_MODELS_MODULE}.mdsdatasourceproperties", "MdsDataSourceProperties"),
+    "EdxDataSourceProperties": (f"{_CRADLE_MODELS_MODULE}.edxdatasourceproperties", "EdxDataSourceProperties"),
+    "AndesDataSourceProperties": (f"{_CRADLE_MODELS_MODULE}.andesdatasourceproperties", "AndesDataSourceProperties"),
+    "DataSourcesSpecification": (f"{_CRADLE_MODELS_MODULE}.datasourcesspecification", "DataSourcesSpecification"),
+    "JobSplitOptions": (f"{_CRADLE_MODELS_MODULE}.jobsplitoptions", "JobSplitOptions"),
+    "TransformSpecification": (f"{_CRADLE_MODELS_MODULE}.transformspecification", "TransformSpecification"),
+    "OutputSpecification": (f"{_CRADLE_MODELS_MODULE}.outputspecification", "OutputSpecification"),
+    "CradleJobSpecification": (f"{_CRADLE_MODELS_MODULE}.cradlejobspecification", "CradleJobSpecification"),
+    "CreateCradleDataLoadJobRequest": (
+        f"{_CRADLE_MODELS_MODULE}.createcradledataloadjobrequest",
+        "CreateCradleDataLoadJobRequest",
+    ),
+    "coral_utils": (_CORAL_UTILS_MODULE, "coral_utils"),
+}
+
+
+def _module_available(module_name: str) -> bool:
+    """Check whether a module can be imported without importing it."""
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        # A missing parent package raises instead of returning None
+        return False
+
+
+def _lazy_import(name: str) -> Any:
+    """
+    Import a deferred dependency on first use and cache it in the module globals.
+    
+    Args:
+        name: Module-level name registered in _LAZY_IMPORTS
+        
+    Returns:
+        The imported class or module
+    """
+    value = globals().get(name)
+    if value is not None:
+        return value
+    
+    module_path, attr = _LAZY_IMPORTS[name]
+    module = importlib.import_module(module_path)
+    try:
+        value = getattr(module, attr)
+    except AttributeError:
+        # The attribute is a submodule that the package does not import itself
+        value = importlib.import_module(f"{module_path}.{attr}")
+    globals()[name] = value
+    return value
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_IMPORTS:
+        return _lazy_import(name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+CRADLE_MODELS_AVAILABLE = _module_available(_CRADLE_MODELS_MODULE)
+if not CRADLE_MODELS_AVAILABLE:
     logger = logging.getLogger(__name__)
     logger.warning("Cradle models not available. _build_request and get_request_dict will not work.")
-    CRADLE_MODELS_AVAILABLE = False
 
-# Import coral utils for request conversion
-try:
-    from secure_ai_sandbox_python_lib.utils import coral_utils
-    CORAL_UTILS_AVAILABLE = True
-except ImportError:
+CORAL_UTILS_AVAILABLE = _module_available(_CORAL_UTILS_MODULE)
+if not CORAL_UTILS_AVAILABLE:
     logger = logging.getLogger(__name__)
     logger.warning("coral_utils not available. get_request_dict will not work.")
-    CORAL_UTILS_AVAILABLE = False
 
 # Import the script contract
 try:
@@ -73,6 +131,168 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Output type -> spec logical name for get_output_location
+_OUTPUT_TYPE_TO_LOGICAL_NAME = MappingProxyType({
+    OUTPUT_TYPE_DATA: "DATA",
+    OUTPUT_TYPE_METADATA: "METADATA",
+    OUTPUT_TYPE_SIGNATURE: "SIGNATURE",
+})
+_VALID_OUTPUT_TYPES = tuple(_OUTPUT_TYPE_TO_LOGICAL_NAME.keys())
+
+# Exact YYYY-mm-DDTHH:MM:SS shape required for Cradle start/end dates
+_DT_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}$")
+
+def _parse_cradle_datetime(field_name: str, value: Any) -> datetime:
+    """
+    Parse a Cradle start/end date that must be exactly YYYY-mm-DDTHH:MM:SS.
+    
+    Args:
+        field_name: Name of the field, used in the error message
+        value: Raw value from data_sources_spec
+        
+    Returns:
+        The parsed datetime
+        
+    Raises:
+        ValueError: If the value has the wrong shape or is not a real date
+    """
+    if isinstance(value, str) and _DT_RE.match(value):
+        # The regex fixes the layout, so the C-level ISO parser is enough here
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    raise ValueError(
+        f"'{field_name}' must be in format YYYY-mm-DD'T'HH:MM:SS "
+        f"(e.g. '2025-01-01T00:00:00'), got: {value!r}"
+    )
+
+
+# Job type -> (spec module, spec constant); other job types use the generic spec
+_SPEC_PATHS = {
+    "training": ("..specs.cradle_data_loading_training_spec", "DATA_LOADING_TRAINING_SPEC"),
+    "validation": ("..specs.cradle_data_loading_validation_spec", "DATA_LOADING_VALIDATION_SPEC"),
+    "testing": ("..specs.cradle_data_loading_testing_spec", "DATA_LOADING_TESTING_SPEC"),
+    "calibration": ("..specs.cradle_data_loading_calibration_spec", "DATA_LOADING_CALIBRATION_SPEC"),
+}
+_GENERIC_SPEC_PATH = ("..specs.cradle_data_loading_spec", "DATA_LOADING_SPEC")
+
+
+@lru_cache(maxsize=None)
+def _load_spec(job_type: str) -> Any:
+    """
+    Import the specification for a job type once per process.
+    
+    Args:
+        job_type: Lower-cased job type from the config
+        
+    Returns:
+        The step specification for the job type
+        
+    Raises:
+        ImportError: If the specification module cannot be imported
+    """
+    module_path, attr = _SPEC_PATHS.get(job_type, _GENERIC_SPEC_PATH)
+    return getattr(importlib.import_module(module_path, __package__), attr)
+
+
+@lru_cache(maxsize=None)
+def _compile_property_path(property_path: str) -> tuple:
+    """
+    Turn a spec property path into (attribute, key) access steps once.
+    
+    The path is parsed by the same parser PropertyReference uses. For example
+    "properties.Outputs['DATA']" becomes (("properties", None), ("Outputs", "DATA")).
+    
+    Args:
+        property_path: Dotted property path, optionally with ['key'] or [0] indexing
+        
+    Returns:
+        Tuple of (attribute name or None, item key or None) pairs
+    """
+    # The shared parser drops the "properties." prefix, which is walked from the step here
+    steps = [("properties", None)] if property_path.startswith("properties.") else []
+    for part in parse_property_path(property_path):
+        if isinstance(part, tuple):
+            attr, key = part
+            steps.append((attr or None, key))
+        else:
+            steps.append((part, None))
+    return tuple(steps)
+
+
+_FIELD_KEYS = itemgetter("field_name", "field_type")
+
+# Config sections a Cradle request is built from, fetched in one call
+_REQUEST_SECTIONS = ("data_sources_spec", "transform_spec", "output_spec", "cradle_job_spec")
+_get_request_sections = attrgetter(*_REQUEST_SECTIONS)
+
+
+def _schema_fields(rows: List[Dict[str, str]]) -> List[Any]:
+    """Convert schema rows of {'field_name', 'field_type'} into Cradle Field models."""
+    Field = _lazy_import("Field")
+    return [Field(field_name=name, field_type=field_type) for name, field_type in map(_FIELD_KEYS, rows)]
+
+
+def _build_mds_data_source(ds_cfg: Any) -> Any:
+    """Build a Cradle DataSource model for an MDS data source config."""
+    mds_props_cfg = ds_cfg.mds_data_source_properties
+    mds_props = _lazy_import("MdsDataSourceProperties")(
+        service_name=mds_props_cfg.service_name,
+        org_id=mds_props_cfg.org_id,
+        region=mds_props_cfg.region,
+        output_schema=_schema_fields(mds_props_cfg.output_schema),
+        use_hourly_edx_data_set=mds_props_cfg.use_hourly_edx_data_set,
+    )
+    return _lazy_import("DataSource")(
+        data_source_name=ds_cfg.data_source_name,
+        data_source_type="MDS",
+        mds_data_source_properties=mds_props,
+        edx_data_source_properties=None,
+    )
+
+
+def _build_edx_data_source(ds_cfg: Any) -> Any:
+    """Build a Cradle DataSource model for an EDX data source config."""
+    edx_props_cfg = ds_cfg.edx_data_source_properties
+    edx_props = _lazy_import("EdxDataSourceProperties")(
+        edx_arn=edx_props_cfg.edx_manifest,
+        schema_overrides=_schema_fields(edx_props_cfg.schema_overrides),
+    )
+    return _lazy_import("DataSource")(
+        data_source_name=ds_cfg.data_source_name,
+        data_source_type="EDX",
+        mds_data_source_properties=None,
+        edx_data_source_properties=edx_props,
+    )
+
+
+def _build_andes_data_source(ds_cfg: Any) -> Any:
+    """Build a Cradle DataSource model for an ANDES data source config."""
+    andes_props_cfg = ds_cfg.andes_data_source_properties
+    if andes_props_cfg.andes3_enabled and logger.isEnabledFor(logging.INFO):
+        logger.info("ANDES 3.0 is enabled for table %s", andes_props_cfg.table_name)
+    andes_props = _lazy_import("AndesDataSourceProperties")(
+        provider=andes_props_cfg.provider,
+        table_name=andes_props_cfg.table_name,
+        andes3_enabled=andes_props_cfg.andes3_enabled,
+    )
+    return _lazy_import("DataSource")(
+        data_source_name=ds_cfg.data_source_name,
+        data_source_type="ANDES",
+        mds_data_source_properties=None,
+        edx_data_source_properties=None,
+        andes_data_source_properties=andes_props,
+    )
+
+
+# data_source_type -> builder for the matching Cradle DataSource model
+_DATA_SOURCE_BUILDERS = {
+    "MDS": _build_mds_data_source,
+    "EDX": _build_edx_data_source,
+    "ANDES": _build_andes_data_source,
+}
+
 
 @register_builder()
 class CradleDataLoadingStepBuilder(StepBuilderBase):
@@ -112,31 +332,15 @@ class CradleDataLoadingStepBuilder(StepBuilderBase):
         spec = None
         if hasattr(config, 'job_type'):
             job_type = config.job_type.lower()
-            if job_type == "training":
-                from ..specs.cradle_data_loading_training_spec import DATA_LOADING_TRAINING_SPEC
-                spec = DATA_LOADING_TRAINING_SPEC
-                self.log_info("Using training-specific DATA_LOADING_TRAINING_SPEC")
-            elif job_type == "validation":
-                from ..specs.cradle_data_loading_validation_spec import DATA_LOADING_VALIDATION_SPEC
-                spec = DATA_LOADING_VALIDATION_SPEC
-                self.log_info("Using validation-specific DATA_LOADING_VALIDATION_SPEC")
-            elif job_type == "testing":
-                from ..specs.cradle_data_loading_testing_spec import DATA_LOADING_TESTING_SPEC
-                spec = DATA_LOADING_TESTING_SPEC
-                self.log_info("Using testing-specific DATA_LOADING_TESTING_SPEC")
-            elif job_type == "calibration":
-                from ..specs.cradle_data_loading_calibration_spec import DATA_LOADING_CALIBRATION_SPEC
-                spec = DATA_LOADING_CALIBRATION_SPEC
-                self.log_info("Using calibration-specific DATA_LOADING_CALIBRATION_SPEC")
-            
-            # If no specific type-based spec is found, try to use the generic one
-            if spec is None:
-                try:
-                    from ..specs.cradle_data_loading_spec import DATA_LOADING_SPEC
-                    spec = DATA_LOADING_SPEC
+            try:
+                spec = _load_spec(job_type)
+                if job_type in _SPEC_PATHS:
+                    self.log_info("Using %s-specific %s", job_type, _SPEC_PATHS[job_type][1])
+                else:
+                    # No type-specific spec, so the generic one is used
                     self.log_info("Using generic DATA_LOADING_SPEC for job type: %s", job_type)
-                except ImportError:
-                    self.log_warning("No specification found for job type: %s", job_type)
+            except ImportError:
+                self.log_warning("No specification found for job type: %s", job_type)
                 
         super().__init__(
             config=config,
@@ -152,6 +356,26 @@ class CradleDataLoadingStepBuilder(StepBuilderBase):
         # Store contract reference
         self.contract = CRADLE_DATA_LOADING_CONTRACT if CONTRACT_AVAILABLE else None
         
+        # (data source config ids, built DataSource models) from the last _build_request
+        self._data_source_models = None
+        # (config fingerprint, value) for the last built request and its dict form
+        self._cached_request = None
+        self._cached_request_dict = None
+        # step -> output locations returned by get_step_outputs(step)
+        self._outputs_cache = weakref.WeakKeyDictionary()
+        # The contract is fixed after init, so its output-path summary is formatted once
+        self._contract_output_log = None
+        self._contract_output_logged = False
+        if (
+            self.contract
+            and hasattr(self.contract, 'expected_output_paths')
+            and logger.isEnabledFor(logging.INFO)
+        ):
+            self._contract_output_log = "\n".join(
+                f"Contract defines output path for '{logical_name}': {container_path}"
+                for logical_name, container_path in self.contract.expected_output_paths.items()
+            )
+        
         if self.spec and not self.contract:
             self.log_warning("Script contract not available - path resolution will use hardcoded values")
 
@@ -204,24 +428,15 @@ class CradleDataLoadingStepBuilder(StepBuilderBase):
                 raise ValueError(f"DataSource #{idx} has invalid type: {ds_cfg.data_source_type}")
 
         # (4) Check that start_date & end_date match exact format YYYY-mm-DDTHH:MM:SS
-        for field_name in ("start_date", "end_date"):
-            value = getattr(self.config.data_sources_spec, field_name)
-            try:
-                parsed = datetime.strptime(value, "%Y-%m-%dT%H:%M:%S")
-            except Exception:
-                raise ValueError(
-                    f"'{field_name}' must be in format YYYY-mm-DD'T'HH:MM:SS "
-                    f"(e.g. '2025-01-01T00:00:00'), got: {value!r}"
-                )
-            if parsed.strftime("%Y-%m-%dT%H:%M:%S") != value:
-                raise ValueError(
-                    f"'{field_name}' does not match the required format exactly; got {value!r}"
-                )
+        #     The regex rejects loose shapes such as '2025-1-1T0:0:0'; parsing then
+        #     only has to reject impossible dates such as '2025-02-30T00:00:00'
+        parsed_dates = {
+            field_name: _parse_cradle_datetime(field_name, getattr(self.config.data_sources_spec, field_name))
+            for field_name in ("start_date", "end_date")
+        }
 
         # (5) Also ensure start_date < end_date
-        s = datetime.strptime(self.config.data_sources_spec.start_date, "%Y-%m-%dT%H:%M:%S")
-        e = datetime.strptime(self.config.data_sources_spec.end_date, "%Y-%m-%dT%H:%M:%S")
-        if s >= e:
+        if parsed_dates["start_date"] >= parsed_dates["end_date"]:
             raise ValueError("start_date must be strictly before end_date.")
 
         # (6) Everything else (output_path S3 URI, output_format, cluster_type, etc.) 
@@ -268,15 +483,22 @@ class CradleDataLoadingStepBuilder(StepBuilderBase):
             Empty dictionary as CradleDataLoading handles outputs differently
         """
         # CradleDataLoading uses a different output mechanism
-        # But we can use the contract to validate and log output paths
-        if self.contract and hasattr(self.contract, 'expected_output_paths'):
-            for logical_name, container_path in self.contract.expected_output_paths.items():
-                self.log_info("Contract defines output path for '%s': %s", logical_name, container_path)
+        # But we can log the contract's output paths (once per builder)
+        contract_output_log = getattr(self, '_contract_output_log', None)
+        if contract_output_log and not getattr(self, '_contract_output_logged', False):
+            self.log_info("%s", contract_output_log)
+            self._contract_output_logged = True
                 
         # The actual outputs are defined in the CradleDataLoadingStep itself
         return {}
         
-    def create_step(self, **kwargs) -> Step:
+    def create_step(
+        self,
+        *,
+        dependencies: Optional[List[Step]] = None,
+        enable_caching: bool = True,
+        **_: Any,
+    ) -> Step:
         """
         Creates a specialized CradleDataLoadingStep for Cradle data loading.
         
@@ -285,9 +507,9 @@ class CradleDataLoadingStepBuilder(StepBuilderBase):
         from MODSPredefinedProcessingStep rather than a standard SageMaker ProcessingStep.
 
         Args:
-            **kwargs: Keyword arguments for configuring the step, including:
-                - dependencies: Optional list of steps that this step depends on.
-                - enable_caching: A boolean indicating whether to cache the results of this step.
+            dependencies: Optional list of steps that this step depends on.
+            enable_caching: A boolean indicating whether to cache the results of this step.
+            **_: Other keyword arguments forwarded by the pipeline template (ignored).
 
         Returns:
             Step: A CradleDataLoadingStep instance with added output attributes.
@@ -301,13 +523,11 @@ class CradleDataLoadingStepBuilder(StepBuilderBase):
         
         self.log_info("Creating CradleDataLoadingStep...")
         try:
-            # Extract dependencies from kwargs
-            dependencies = kwargs.get('dependencies', [])
-            enable_caching = kwargs.get('enable_caching', True)
+            dependencies = dependencies or ()
             
             # Create a CradleDataLoadingStep - this is a custom step that handles its own
             # initialization differently than standard SageMaker ProcessingStep
-            step = CradleDataLoadingStep(
+            step = _lazy_import("CradleDataLoadingStep")(
                 step_name=step_name,
                 role=self.role,
                 sagemaker_session=self.session
@@ -323,10 +543,10 @@ class CradleDataLoadingStepBuilder(StepBuilderBase):
             
             # Store specification and contract in the step for future reference
             # This enables the specification-driven approach to work with the step
-            if hasattr(self, 'spec') and self.spec:
-                setattr(step, '_spec', self.spec)
-            if self.contract:
-                setattr(step, '_contract', self.contract)
+            if self.spec is not None:
+                step._spec = self.spec
+            if self.contract is not None:
+                step._contract = self.contract
             
             self.log_info("Created CradleDataLoadingStep with name: %s", step.name)
             
@@ -347,6 +567,13 @@ class CradleDataLoadingStepBuilder(StepBuilderBase):
         This method builds a Cradle data load request from the configuration, which can be
         used to fill in the execution document or for logging purposes.
         
+        The request is cached against the identities of the config, its four spec
+        sections and its data source configs, so replacing any of them (including by
+        Pydantic assignment) rebuilds it. Changing a field of a section in place, e.g.
+        ``config.data_sources_spec.start_date = ...``, keeps those identities; call
+        invalidate_request_cache() afterwards. The cached request is shared between
+        calls and must not be modified.
+        
         Returns:
             CreateCradleDataLoadJobRequest: The request object for Cradle data loading
             
@@ -357,80 +584,33 @@ class CradleDataLoadingStepBuilder(StepBuilderBase):
             raise ImportError("Cradle models not available. Cannot build request.")
             
         # Check if we have the necessary configuration attributes
-        required_attrs = [
-            'data_sources_spec',
-            'transform_spec',
-            'output_spec',
-            'cradle_job_spec'
-        ]
-        
-        for attr in required_attrs:
-            if not hasattr(self.config, attr) or getattr(self.config, attr) is None:
+        try:
+            sections = _get_request_sections(self.config)
+        except AttributeError:
+            sections = tuple(getattr(self.config, attr, None) for attr in _REQUEST_SECTIONS)
+        for attr, section in zip(_REQUEST_SECTIONS, sections):
+            if section is None:
                 raise ValueError(f"CradleDataLoadConfig missing required attribute: {attr}")
+        ds_spec_cfg, transform_spec_cfg, output_spec_cfg, cradle_job_spec_cfg = sections
+        
+        # Identity fingerprint, see the docstring for when it goes stale
+        cache_key = (id(self.config),) + tuple(map(id, sections)) + tuple(map(id, ds_spec_cfg.data_sources))
+        cached = getattr(self, "_cached_request", None)
+        if cached is not None and cached[0] == cache_key:
+            return cached[1]
+        
+        DataSourcesSpecification = _lazy_import("DataSourcesSpecification")
+        JobSplitOptions = _lazy_import("JobSplitOptions")
+        TransformSpecification = _lazy_import("TransformSpecification")
+        OutputSpecification = _lazy_import("OutputSpecification")
+        CradleJobSpecification = _lazy_import("CradleJobSpecification")
+        CreateCradleDataLoadJobRequest = _lazy_import("CreateCradleDataLoadJobRequest")
         
         try:
             # (a) Build each DataSource from data_sources_spec.data_sources
-            data_source_models: List[DataSource] = []
-            for ds_cfg in self.config.data_sources_spec.data_sources:
-                if ds_cfg.data_source_type == "MDS":
-                    mds_props_cfg = ds_cfg.mds_data_source_properties
-                    mds_props = MdsDataSourceProperties(
-                        service_name=mds_props_cfg.service_name,
-                        org_id=mds_props_cfg.org_id,
-                        region=mds_props_cfg.region,
-                        output_schema=[
-                            Field(field_name=f["field_name"], field_type=f["field_type"])
-                            for f in mds_props_cfg.output_schema
-                        ],
-                        use_hourly_edx_data_set=mds_props_cfg.use_hourly_edx_data_set,
-                    )
-                    data_source_models.append(
-                        DataSource(
-                            data_source_name=ds_cfg.data_source_name,
-                            data_source_type="MDS",
-                            mds_data_source_properties=mds_props,
-                            edx_data_source_properties=None,
-                        )
-                    )
-
-                elif ds_cfg.data_source_type == "EDX":
-                    edx_props_cfg = ds_cfg.edx_data_source_properties
-                    edx_props = EdxDataSourceProperties(
-                        edx_arn=edx_props_cfg.edx_manifest,
-                        schema_overrides=[
-                            Field(field_name=f["field_name"], field_type=f["field_type"])
-                            for f in edx_props_cfg.schema_overrides
-                        ],
-                    )
-                    data_source_models.append(
-                        DataSource(
-                            data_source_name=ds_cfg.data_source_name,
-                            data_source_type="EDX",
-                            mds_data_source_properties=None,
-                            edx_data_source_properties=edx_props,
-                        )
-                    )
-                elif ds_cfg.data_source_type == "ANDES":
-                    andes_props_cfg = ds_cfg.andes_data_source_properties
-                    if andes_props_cfg.andes3_enabled:
-                        self.log_info("ANDES 3.0 is enabled for table %s", andes_props_cfg.table_name)
-                    andes_props = AndesDataSourceProperties(
-                        provider=andes_props_cfg.provider,
-                        table_name=andes_props_cfg.table_name,
-                        andes3_enabled=andes_props_cfg.andes3_enabled,
-                    )
-                    data_source_models.append(
-                        DataSource(
-                            data_source_name=ds_cfg.data_source_name,
-                            data_source_type="ANDES",
-                            mds_data_source_properties=None,
-                            edx_data_source_properties=None,
-                            andes_data_source_properties=andes_props,
-                        )
-                    )
+            data_source_models = self._get_data_source_models(ds_spec_cfg.data_sources)
 
             # (b) DataSourcesSpecification
-            ds_spec_cfg = self.config.data_sources_spec
             data_sources_spec = DataSourcesSpecification(
                 start_date=ds_spec_cfg.start_date,
                 end_date=ds_spec_cfg.end_date,
@@ -438,7 +618,6 @@ class CradleDataLoadingStepBuilder(StepBuilderBase):
             )
 
             # (c) TransformSpecification
-            transform_spec_cfg = self.config.transform_spec
             jso = transform_spec_cfg.job_split_options
             split_opts = JobSplitOptions(
                 split_job=jso.split_job,
@@ -451,7 +630,6 @@ class CradleDataLoadingStepBuilder(StepBuilderBase):
             )
 
             # (d) OutputSpecification
-            output_spec_cfg = self.config.output_spec
             output_spec = OutputSpecification(
                 output_schema=output_spec_cfg.output_schema,
                 output_path=output_spec_cfg.output_path,
@@ -463,7 +641,6 @@ class CradleDataLoadingStepBuilder(StepBuilderBase):
             )
 
             # (e) CradleJobSpecification
-            cradle_job_spec_cfg = self.config.cradle_job_spec
             cradle_job_spec = CradleJobSpecification(
                 cluster_type=cradle_job_spec_cfg.cluster_type,
                 cradle_account=cradle_job_spec_cfg.cradle_account,
@@ -479,18 +656,68 @@ class CradleDataLoadingStepBuilder(StepBuilderBase):
                 cradle_job_specification=cradle_job_spec,
             )
 
+            self._cached_request = (cache_key, request)
             return request
             
         except Exception as e:
             self.log_error("Error building Cradle request: %s", e)
             raise ValueError(f"Failed to build Cradle request: {e}") from e
     
+    def invalidate_request_cache(self) -> None:
+        """
+        Drop the cached request, its dict form and the built DataSource models.
+        
+        Call this after changing the config or any of its spec sections or data
+        source configs in place; the next _build_request or get_request_dict call
+        then rebuilds them from the current config.
+        """
+        self._cached_request = None
+        self._cached_request_dict = None
+        self._data_source_models = None
+    
+    def _get_data_source_models(self, data_sources: List[Any]) -> List[Any]:
+        """
+        Build the Cradle DataSource models, reusing the previous result.
+        
+        The models are rebuilt only when the data source configs differ (by
+        identity) from the ones used last time, so repeated request building
+        from one builder walks the data sources once.
+        
+        Args:
+            data_sources: Data source configs from data_sources_spec
+            
+        Returns:
+            List of Cradle DataSource models in config order
+            
+        Raises:
+            ValueError: If a data source has an unknown data_source_type
+        """
+        key = tuple(map(id, data_sources))
+        cached = getattr(self, "_data_source_models", None)
+        if cached is not None and cached[0] == key:
+            return list(cached[1])
+        
+        data_source_models: List[Any] = []
+        for ds_cfg in data_sources:
+            try:
+                build_data_source = _DATA_SOURCE_BUILDERS[ds_cfg.data_source_type]
+            except KeyError:
+                raise ValueError(f"Invalid data source type: {ds_cfg.data_source_type}")
+            data_source_models.append(build_data_source(ds_cfg))
+        
+        self._data_source_models = (key, data_source_models)
+        return list(data_source_models)
+    
     def get_request_dict(self) -> Dict[str, Any]:
         """
         Return the CradleDataLoad request as a plain Python dict.
         
         This method is useful for logging or for passing to StepOperator.
         It builds the request using _build_request and then converts it to a dictionary.
+        Both the request and its converted form are cached, so repeated calls for an
+        unchanged config skip the conversion. Each call returns a deep copy of the
+        cached dict, which the caller may modify freely. See _build_request for when
+        invalidate_request_cache() must be called.
         
         Returns:
             Dict[str, Any]: The request as a dictionary
@@ -504,12 +731,18 @@ class CradleDataLoadingStepBuilder(StepBuilderBase):
             
         try:
             request = self._build_request()
-            return coral_utils.convert_coral_to_dict(request)
+            cached = getattr(self, "_cached_request_dict", None)
+            if cached is not None and cached[0] is request:
+                return copy.deepcopy(cached[1])
+            
+            request_dict = _lazy_import("coral_utils").convert_coral_to_dict(request)
+            self._cached_request_dict = (request, request_dict)
+            return copy.deepcopy(request_dict)
         except Exception as e:
             self.log_error("Error getting request dict: %s", e)
             raise ValueError(f"Failed to get request dict: {e}") from e
             
-    def get_output_location(self, step: CradleDataLoadingStep, output_type: str) -> str:
+    def get_output_location(self, step: "CradleDataLoadingStep", output_type: str) -> str:
         """
         Get a specific output location from a created CradleDataLoadingStep.
         
@@ -530,19 +763,13 @@ class CradleDataLoadingStepBuilder(StepBuilderBase):
             ValueError: If the step is not a CradleDataLoadingStep instance or if
                       the requested output_type is not valid
         """
-        if not isinstance(step, CradleDataLoadingStep):
+        if not isinstance(step, _lazy_import("CradleDataLoadingStep")):
             raise ValueError("Argument must be a CradleDataLoadingStep instance")
             
         # Map output type to logical name
-        output_type_to_logical_name = {
-            OUTPUT_TYPE_DATA: "DATA",
-            OUTPUT_TYPE_METADATA: "METADATA", 
-            OUTPUT_TYPE_SIGNATURE: "SIGNATURE"
-        }
-        
-        logical_name = output_type_to_logical_name.get(output_type)
+        logical_name = _OUTPUT_TYPE_TO_LOGICAL_NAME.get(output_type)
         if not logical_name:
-            raise ValueError(f"Invalid output_type: {output_type}. Valid values are: {list(output_type_to_logical_name.keys())}")
+            raise ValueError(f"Invalid output_type: {output_type}. Valid values are: {list(_VALID_OUTPUT_TYPES)}")
             
         # Use specification-based property path if available
         if self.spec and hasattr(step, '_spec'):
@@ -552,16 +779,12 @@ class CradleDataLoadingStepBuilder(StepBuilderBase):
                     if property_path:
                         # Use dynamic property access to get the value from the step
                         try:
-                            path_parts = property_path.split('.')
                             value = step
-                            for part in path_parts:
-                                # Handle array indexing with string key
-                                if '[' in part and ']' in part:
-                                    base_part = part.split('[')[0]
-                                    key = part.split('[')[1].split(']')[0].strip("'\"")
-                                    value = getattr(value, base_part)[key]
-                                else:
-                                    value = getattr(value, part)
+                            for attr, key in _compile_property_path(property_path):
+                                if attr is not None:
+                                    value = getattr(value, attr)
+                                if key is not None:
+                                    value = value[key]
                             return value
                         except Exception as e:
                             self.log_warning("Error accessing property path %s: %s", property_path, e)
@@ -569,7 +792,7 @@ class CradleDataLoadingStepBuilder(StepBuilderBase):
         # Fall back to the step's built-in method
         return step.get_output_locations(output_type)
         
-    def get_step_outputs(self, step: CradleDataLoadingStep, output_type: str = None) -> Union[Dict[str, str], str]:
+    def get_step_outputs(self, step: "CradleDataLoadingStep", output_type: str = None) -> Union[Dict[str, str], str]:
         """
         Get the output locations from a created CradleDataLoadingStep.
         
@@ -593,5 +816,14 @@ class CradleDataLoadingStepBuilder(StepBuilderBase):
         if output_type:
             return self.get_output_location(step, output_type)
             
-        # Get all outputs - use the step's built-in method for simplicity
-        return step.get_output_locations()
+        # Get all outputs - use the step's built-in method, once per step
+        outputs_cache = getattr(self, "_outputs_cache", None)
+        try:
+            outputs = outputs_cache.get(step)
+        except (AttributeError, TypeError):
+            # No cache, or the step cannot be weakly referenced or hashed
+            return step.get_output_locations()
+        if outputs is None:
+            outputs = step.get_output_locations()
+            outputs_cache[step] = outputs
+        return dict(outputs)
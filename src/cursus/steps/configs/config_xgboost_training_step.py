@@ -9,7 +9,7 @@ Fields are organized into three tiers:
 3. Tier 3: Derived Fields - fields calculated from other fields (private with properties)
 """
 
-from pydantic import BaseModel, Field, model_validator, field_validator, PrivateAttr
+from pydantic import BaseModel, Field, model_validator, field_validator, PrivateAttr, computed_field
 from typing import List, Optional, Dict, Any, ClassVar
 from pathlib import Path
 import json
@@ -19,6 +19,26 @@ from ..hyperparams.hyperparameters_xgboost import XGBoostModelHyperparameters
 from ...core.base.config_base import BasePipelineConfig
 
 
+# Common CPU instances for XGBoost. XGBoost can also use GPU instances (e.g., ml.g4dn, ml.g5)
+# if tree_method='gpu_hist' is used and framework supports it.
+_XGB_CPU_INSTANCE_TYPES = (
+    "ml.m5.large", "ml.m5.xlarge", "ml.m5.2xlarge", "ml.m5.4xlarge",
+    "ml.m5.12xlarge", "ml.m5.24xlarge",
+    "ml.c5.large", "ml.c5.xlarge", "ml.c5.2xlarge", "ml.c5.4xlarge",
+    "ml.c5.9xlarge", "ml.c5.18xlarge",
+)
+_XGB_GPU_INSTANCE_TYPES = (  # For GPU accelerated XGBoost
+    "ml.g4dn.xlarge", "ml.g4dn.2xlarge", "ml.g4dn.4xlarge",
+    "ml.g4dn.8xlarge", "ml.g4dn.12xlarge", "ml.g4dn.16xlarge",
+    "ml.g5.xlarge", "ml.g5.2xlarge", "ml.g5.4xlarge",
+    "ml.g5.8xlarge", "ml.g5.12xlarge", "ml.g5.16xlarge",
+    "ml.p3.2xlarge",  # Older but sometimes used
+)
+# Built once at import: the validator runs on every config construction
+_VALID_XGB_INSTANCE_TYPES = frozenset(_XGB_CPU_INSTANCE_TYPES + _XGB_GPU_INSTANCE_TYPES)
+_VALID_XGB_INSTANCE_LIST_STR = ", ".join(_XGB_CPU_INSTANCE_TYPES + _XGB_GPU_INSTANCE_TYPES)
+
+
 class XGBoostTrainingConfig(BasePipelineConfig):
     """
     Configuration specific to the SageMaker XGBoost Training Step.
@@ -78,6 +98,8 @@ class XGBoostTrainingConfig(BasePipelineConfig):
 
     # Public read-only properties for derived fields
     
+    # Serialized through pydantic-core as a computed field, so model_dump needs no override
+    @computed_field
     @property
     def hyperparameter_file(self) -> str:
         """Get hyperparameter file path."""
@@ -85,14 +107,6 @@ class XGBoostTrainingConfig(BasePipelineConfig):
             self._hyperparameter_file = f"{self.pipeline_s3_loc}/hyperparameters/{self.region}_hyperparameters.json"
         return self._hyperparameter_file
 
-    # Custom model_dump method to include derived properties
-    def model_dump(self, **kwargs) -> Dict[str, Any]:
-        """Override model_dump to include derived properties."""
-        data = super().model_dump(**kwargs)
-        # Add derived properties to output
-        data["hyperparameter_file"] = self.hyperparameter_file
-        return data
-
     # Initialize derived fields at creation time to avoid potential validation loops
     @model_validator(mode='after')
     def initialize_derived_fields(self) -> 'XGBoostTrainingConfig':
@@ -114,15 +128,15 @@ class XGBoostTrainingConfig(BasePipelineConfig):
         if not self.hyperparameters:
             raise ValueError("XGBoost hyperparameters must be provided.")
 
-        # Validate field lists
-        all_fields = set(self.hyperparameters.full_field_list)
+        # Validate field lists against the set cached on the hyperparameters object
+        all_fields = self.hyperparameters.get_full_field_set()
         
         # Check tab_field_list
-        if not set(self.hyperparameters.tab_field_list).issubset(all_fields):
+        if not all_fields.issuperset(self.hyperparameters.tab_field_list):
             raise ValueError("All fields in tab_field_list must be in full_field_list (from hyperparameters).")
         
         # Check cat_field_list
-        if not set(self.hyperparameters.cat_field_list).issubset(all_fields):
+        if not all_fields.issuperset(self.hyperparameters.cat_field_list):
             raise ValueError("All fields in cat_field_list must be in full_field_list (from hyperparameters).")
         
         # Check label_name
@@ -142,26 +156,10 @@ class XGBoostTrainingConfig(BasePipelineConfig):
     @field_validator('training_instance_type')
     @classmethod
     def _validate_sagemaker_xgboost_instance_type(cls, v: str) -> str:
-        # Common CPU instances for XGBoost. XGBoost can also use GPU instances (e.g., ml.g4dn, ml.g5)
-        # if tree_method='gpu_hist' is used and framework supports it.
-        valid_cpu_instances = [
-            "ml.m5.large", "ml.m5.xlarge", "ml.m5.2xlarge", "ml.m5.4xlarge",
-            "ml.m5.12xlarge", "ml.m5.24xlarge",
-            "ml.c5.large", "ml.c5.xlarge", "ml.c5.2xlarge", "ml.c5.4xlarge",
-            "ml.c5.9xlarge", "ml.c5.18xlarge",
-        ]
-        valid_gpu_instances = [ # For GPU accelerated XGBoost
-            "ml.g4dn.xlarge", "ml.g4dn.2xlarge", "ml.g4dn.4xlarge", 
-            "ml.g4dn.8xlarge", "ml.g4dn.12xlarge", "ml.g4dn.16xlarge",
-            "ml.g5.xlarge", "ml.g5.2xlarge", "ml.g5.4xlarge",
-            "ml.g5.8xlarge", "ml.g5.12xlarge", "ml.g5.16xlarge",
-             "ml.p3.2xlarge" # Older but sometimes used
-        ]
-        valid_instances = valid_cpu_instances + valid_gpu_instances
-        if v not in valid_instances:
+        if v not in _VALID_XGB_INSTANCE_TYPES:
             raise ValueError(
                 f"Invalid training instance type for XGBoost: {v}. "
-                f"Must be one of: {', '.join(valid_instances)}"
+                f"Must be one of: {_VALID_XGB_INSTANCE_LIST_STR}"
             )
         return v
     
@@ -10,6 +10,7 @@ for step naming and supports auto-discovery of step builders.
 from typing import Dict, Type, List, Optional, Any, Callable, TYPE_CHECKING
 import logging
 import importlib
+import importlib.util
 import inspect
 import pkgutil
 import sys
@@ -101,6 +102,12 @@ class StepBuilderRegistry:
     # Core registry mapping step types to builders - auto-populated during initialization
     BUILDER_REGISTRY = {}  
     
+    # Bumped whenever BUILDER_REGISTRY changes so callers can invalidate derived caches
+    _REGISTRY_VERSION = 0
+    
+    # Step type -> "module:ClassName" for builders imported on first lookup
+    LAZY_BUILDERS: Dict[str, str] = {}
+    
     # Legacy aliases for backward compatibility
     LEGACY_ALIASES = {
         "MIMSPackaging": "Package",  # Legacy name from before standardization
@@ -125,8 +132,57 @@ class StepBuilderRegistry:
             raise ValueError(f"Builder class must extend StepBuilderBase: {builder_class}")
         
         cls.BUILDER_REGISTRY[step_type] = builder_class
+        cls._REGISTRY_VERSION += 1
         registry_logger.info(f"Registered builder: {step_type} -> {builder_class.__name__}")
     
+    @classmethod
+    def register_lazy_builder(cls, step_type: str, import_path: str) -> None:
+        """
+        Register a builder by import path without importing its module.
+        
+        The builder module is imported the first time the step type is looked
+        up, so modules with expensive imports are only loaded when needed.
+        
+        Args:
+            step_type: Step type name
+            import_path: "module:ClassName"; relative module paths are resolved
+                against this registry package
+        """
+        if ':' not in import_path:
+            raise ValueError(f"Lazy builder path must be 'module:ClassName': {import_path}")
+        cls.LAZY_BUILDERS[step_type] = import_path
+        cls._REGISTRY_VERSION += 1
+        registry_logger.debug(f"Registered lazy builder: {step_type} -> {import_path}")
+    
+    @classmethod
+    def _resolve_lazy_builder(cls, step_type: str) -> Optional[Type[StepBuilderBase]]:
+        """
+        Import a lazily registered builder and move it into BUILDER_REGISTRY.
+        
+        Args:
+            step_type: Step type name
+            
+        Returns:
+            Builder class, or None if the step type has no importable lazy entry
+        """
+        import_path = cls.LAZY_BUILDERS.get(step_type)
+        if import_path is None:
+            return None
+        
+        module_path, _, class_name = import_path.partition(':')
+        try:
+            builder_class = getattr(importlib.import_module(module_path, __package__), class_name)
+        except (ImportError, AttributeError) as e:
+            # Keep the entry so the step type stays listed and a later lookup can retry
+            registry_logger.warning(f"Error importing lazy builder {import_path}: {e}")
+            return None
+        cls.LAZY_BUILDERS.pop(step_type, None)
+        
+        # Importing the module may already have registered it via @register_builder
+        if cls.BUILDER_REGISTRY.get(step_type) is not builder_class:
+            cls.register_builder_class(step_type, builder_class)
+        return builder_class
+    
     @classmethod
     def discover_builders(cls):
         """
@@ -141,9 +197,19 @@ class StepBuilderRegistry:
         # Get the package containing step builders
         try:
             from ..builders import __path__ as builders_path
+            from .. import builders as builders_package
+            
+            # Modules behind lazy entries are left for first lookup to import
+            lazy_modules = {
+                importlib.util.resolve_name(path.partition(':')[0], __package__)
+                for path in cls.LAZY_BUILDERS.values()
+            }
             
             # Walk through all modules in the package
             for _, module_name, _ in pkgutil.iter_modules(builders_path):
+                full_name = f"{builders_package.__name__}.{module_name}"
+                if full_name in lazy_modules and full_name not in sys.modules:
+                    continue
                 if module_name.startswith('builder_'):
                     try:
                         # Import the module
@@ -190,7 +256,6 @@ class StepBuilderRegistry:
     def _register_known_builders(cls, builder_map: Dict[str, Type[StepBuilderBase]]) -> None:
         """Register known step builders to ensure backward compatibility."""
         # Import all step builders
-        from ..builders.builder_cradle_data_loading_step import CradleDataLoadingStepBuilder
         from ..builders.builder_tabular_preprocessing_step import TabularPreprocessingStepBuilder
         from ..builders.builder_xgboost_training_step import XGBoostTrainingStepBuilder
         from ..builders.builder_xgboost_model_eval_step import XGBoostModelEvalStepBuilder
@@ -208,7 +273,6 @@ class StepBuilderRegistry:
         
         # Core registry with canonical step names from the central step registry
         known_builders = {
-            "CradleDataLoading": CradleDataLoadingStepBuilder,
             "TabularPreprocessing": TabularPreprocessingStepBuilder,
             "XGBoostTraining": XGBoostTrainingStepBuilder,
             "XGBoostModelEval": XGBoostModelEvalStepBuilder, 
@@ -234,6 +298,9 @@ class StepBuilderRegistry:
     def __init__(self):
         """Initialize the registry."""
         self._custom_builders = {}
+        self._custom_version = 0
+        self._config_to_builder_name = None
+        self._config_to_builder_name_version = None
         self.logger = registry_logger
         
         # Populate the registry if empty (first initialization)
@@ -241,10 +308,49 @@ class StepBuilderRegistry:
             # Get core builders through discovery
             discovered = self.__class__.discover_builders()
             self.__class__.BUILDER_REGISTRY = discovered
+            self.__class__._REGISTRY_VERSION += 1
             
             # Log discovery results
             self.logger.info(f"Discovered {len(discovered)} step builders")
     
+    @property
+    def _version(self) -> int:
+        """
+        Version of the builder mappings visible to this registry.
+        
+        Increases whenever a default or custom builder is registered or
+        unregistered, so it can be used to invalidate derived caches.
+        """
+        return self.__class__._REGISTRY_VERSION + self._custom_version
+    
+    @property
+    def config_to_builder_name(self) -> Dict[str, str]:
+        """
+        Mapping from registered config class names to builder class names.
+        
+        Built once from CONFIG_STEP_REGISTRY on first access and rebuilt only
+        when the registry version changes. Lazily registered builders are
+        named from their import path without importing their modules. Config
+        classes without a builder are omitted.
+        
+        Returns:
+            Dictionary mapping config class names to step builder class names
+        """
+        if self._config_to_builder_name is None or self._config_to_builder_name_version != self._version:
+            mapping = {}
+            for config_class_name in CONFIG_STEP_REGISTRY:
+                step_type = self._config_class_to_step_type(config_class_name)
+                step_type = self.LEGACY_ALIASES.get(step_type, step_type)
+                builder_class = self._custom_builders.get(step_type) or self.BUILDER_REGISTRY.get(step_type)
+                if builder_class is not None:
+                    mapping[config_class_name] = builder_class.__name__
+                elif step_type in self.LAZY_BUILDERS:
+                    mapping[config_class_name] = self.LAZY_BUILDERS[step_type].rpartition(':')[2]
+            self._config_to_builder_name = mapping
+            # Read the version once the mapping is complete
+            self._config_to_builder_name_version = self._version
+        return self._config_to_builder_name
+    
     def get_builder_map(self) -> Dict[str, Type[StepBuilderBase]]:
         """
         Get the complete builder registry.
@@ -252,6 +358,10 @@ class StepBuilderRegistry:
         Returns:
             Dictionary mapping step types to builder classes
         """
+        # Every builder class is needed here, so import any lazy entries first
+        for step_type in list(self.LAZY_BUILDERS):
+            self._resolve_lazy_builder(step_type)
+        
         # Combine default and custom builders
         builder_map = self.BUILDER_REGISTRY.copy()
         builder_map.update(self._custom_builders)
@@ -340,16 +450,21 @@ class StepBuilderRegistry:
         # Check if the step_type is a legacy alias and convert to canonical name
         canonical_step_type = self.LEGACY_ALIASES.get(step_type, step_type)
         
-        builder_map = self.get_builder_map()
-        if canonical_step_type not in builder_map:
-            available_types = list(builder_map.keys())
+        # Custom builders take precedence; lazy entries are imported only for this type
+        builder_class = self._custom_builders.get(canonical_step_type)
+        if builder_class is None:
+            builder_class = self.BUILDER_REGISTRY.get(canonical_step_type)
+        if builder_class is None:
+            builder_class = self._resolve_lazy_builder(canonical_step_type)
+        if builder_class is None:
+            available_types = list(self.get_builder_map().keys())
             raise RegistryError(
                 f"No step builder found for step type '{step_type}' (canonical: '{canonical_step_type}')",
                 unresolvable_types=[step_type],
                 available_builders=available_types
             )
         
-        return builder_map[canonical_step_type]
+        return builder_class
     
     def register_builder(self, step_type: str, builder_class: Type[StepBuilderBase]) -> None:
         """
@@ -365,6 +480,7 @@ class StepBuilderRegistry:
             raise ValueError(f"Builder class must extend StepBuilderBase: {builder_class}")
         
         self._custom_builders[step_type] = builder_class
+        self._custom_version += 1
         self.logger.info(f"Registered custom builder: {step_type} -> {builder_class.__name__}")
     
     def unregister_builder(self, step_type: str) -> None:
@@ -376,6 +492,7 @@ class StepBuilderRegistry:
         """
         if step_type in self._custom_builders:
             del self._custom_builders[step_type]
+            self._custom_version += 1
             self.logger.info(f"Unregistered custom builder: {step_type}")
         else:
             self.logger.warning(f"Attempted to unregister non-existent custom builder: {step_type}")
@@ -387,7 +504,7 @@ class StepBuilderRegistry:
         Returns:
             List of supported step type names
         """
-        canonical_types = list(self.get_builder_map().keys())
+        canonical_types = list({**self.BUILDER_REGISTRY, **self.LAZY_BUILDERS, **self._custom_builders})
         # Include legacy aliases for backward compatibility
         all_types = canonical_types + list(self.LEGACY_ALIASES.keys())
         return sorted(all_types)
@@ -404,7 +521,11 @@ class StepBuilderRegistry:
         """
         # Check both canonical names and legacy aliases
         canonical_step_type = self.LEGACY_ALIASES.get(step_type, step_type)
-        return canonical_step_type in self.get_builder_map()
+        return (
+            canonical_step_type in self._custom_builders
+            or canonical_step_type in self.BUILDER_REGISTRY
+            or canonical_step_type in self.LAZY_BUILDERS
+        )
     
     def get_config_types_for_step_type(self, step_type: str) -> List[str]:
         """
@@ -578,6 +699,15 @@ class StepBuilderRegistry:
         }
 
 
+# Allow "register_builder.lazy(step_type, 'module:ClassName')" next to the decorator form
+register_builder.lazy = StepBuilderRegistry.register_lazy_builder
+
+# Builders whose modules are only imported when their step type is looked up
+register_builder.lazy(
+    "CradleDataLoading", "..builders.builder_cradle_data_loading_step:CradleDataLoadingStepBuilder"
+)
+
+
 # Global registry instance
 _global_registry = None
 
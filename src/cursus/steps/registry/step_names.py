@@ -3,6 +3,8 @@ Central registry for all pipeline step names.
 Single source of truth for step naming across config, builders, and specifications.
 """
 
+import sys
+from functools import lru_cache
 from typing import Dict, List
 
 # Core step name registry - canonical names used throughout the system
@@ -192,11 +194,12 @@ def get_spec_step_type(step_name: str) -> str:
         raise ValueError(f"Unknown step name: {step_name}")
     return STEP_NAMES[step_name]["spec_type"]
 
+@lru_cache(maxsize=None)
 def get_spec_step_type_with_job_type(step_name: str, job_type: str = None) -> str:
-    """Get step_type with optional job_type suffix."""
+    """Get step_type with optional job_type suffix (cached and interned, STEP_NAMES is static)."""
     base_type = get_spec_step_type(step_name)
     if job_type:
-        return f"{base_type}_{job_type.capitalize()}"
+        return sys.intern(f"{base_type}_{job_type.capitalize()}")
     return base_type
 
 def get_step_name_from_spec_type(spec_type: str) -> str:
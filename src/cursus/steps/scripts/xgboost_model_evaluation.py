@@ -3,16 +3,22 @@ import os
 import json
 import argparse
 import pandas as pd
+from pandas.api.types import is_numeric_dtype
 import numpy as np
 import pickle as pkl
 from pathlib import Path
-from sklearn.metrics import roc_auc_score, average_precision_score, precision_recall_curve, roc_curve, f1_score
 import xgboost as xgb
-import matplotlib.pyplot as plt
 import time
 import sys
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
+
+# Use pyarrow for parquet schema reads if available
+try:
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
 
 from ...processing.risk_table_processor import RiskTableMappingProcessor
 from ...processing.numerical_imputation_processor import NumericalVariableImputationProcessor
@@ -23,6 +29,9 @@ import logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# matplotlib.pyplot is imported on first plot (see _get_pyplot); it is only needed for the curves
+plt = None
+
 # Container path constants - aligned with script contract
 CONTAINER_PATHS = {
     "MODEL_DIR": "/opt/ml/processing/input/model",
@@ -31,6 +40,19 @@ CONTAINER_PATHS = {
     "OUTPUT_METRICS_DIR": "/opt/ml/processing/output/metrics"
 }
 
+def _get_pyplot():
+    """
+    Import matplotlib.pyplot on first use, selecting the non-interactive Agg backend
+    so no GUI backend is probed inside the container.
+    """
+    global plt
+    if plt is None:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as pyplot
+        plt = pyplot
+    return plt
+
 def load_model_artifacts(model_dir):
     """
     Load the trained XGBoost model and all preprocessing artifacts from the specified directory.
@@ -54,6 +76,17 @@ def load_model_artifacts(model_dir):
     logger.info("Loaded hyperparameters.json")
     return model, risk_tables, impute_dict, feature_columns, hyperparams
 
+def _is_plain_risk_table(risk_table):
+    """
+    Check whether a risk table is a well-formed {"bins": dict, "default_bin": number} mapping
+    that can be applied directly with a vectorized Series.map.
+    """
+    return (
+        isinstance(risk_table, dict)
+        and isinstance(risk_table.get("bins"), dict)
+        and isinstance(risk_table.get("default_bin"), (int, float, np.integer, np.floating))
+    )
+
 def preprocess_eval_data(df, feature_columns, risk_tables, impute_dict):
     """
     Apply risk table mapping and numerical imputation to the evaluation DataFrame.
@@ -63,21 +96,49 @@ def preprocess_eval_data(df, feature_columns, risk_tables, impute_dict):
     for feature, risk_table in risk_tables.items():
         if feature in df.columns:
             logger.info(f"Applying risk table mapping for feature: {feature}")
-            proc = RiskTableMappingProcessor(
-                column_name=feature,
-                label_name="label",
-                risk_tables=risk_table
-            )
-            df[feature] = proc.transform(df[feature])
+            if _is_plain_risk_table(risk_table):
+                # Same lookup as RiskTableMappingProcessor.transform, without
+                # building and validating a processor per feature
+                df[feature] = (
+                    df[feature].astype(str)
+                    .map(risk_table["bins"])
+                    .fillna(risk_table["default_bin"])
+                    .astype(np.float32)
+                )
+            else:
+                proc = RiskTableMappingProcessor(
+                    column_name=feature,
+                    label_name="label",
+                    risk_tables=risk_table
+                )
+                df[feature] = proc.transform(df[feature])
     logger.info("Risk table mapping complete")
     logger.info("Starting numerical imputation")
     imputer = NumericalVariableImputationProcessor(imputation_dict=impute_dict)
-    df = imputer.transform(df)
-    logger.info("Numerical imputation complete")
+    available = set(df.columns)
+    cols = [col for col in feature_columns if col in available]
+    features = df[cols]
+    # Columns are usually numeric after risk table mapping; only coerce the rest
+    non_numeric = [col for col, dtype in features.dtypes.items() if not is_numeric_dtype(dtype)]
+    # Imputation fills values that are missing before coercion, exactly as imputer.transform
+    # would; it is applied to the float32 matrix below instead of on a copy of the frame
+    impute_targets = []
+    for j, col in enumerate(cols):
+        if col in imputer.imputation_dict:
+            missing = features[col].isna().to_numpy() if col in non_numeric else None
+            impute_targets.append((j, imputer.imputation_dict[col], missing))
+    if non_numeric:
+        features = features.assign(
+            **{col: pd.to_numeric(features[col], errors="coerce") for col in non_numeric}
+        )
     logger.info("Ensuring all features are numeric and reordering columns")
-    df[feature_columns] = df[feature_columns].apply(pd.to_numeric, errors="coerce").fillna(0)
-    df = df.copy()
-    df = df[[col for col in feature_columns if col in df.columns]]
+    values = features.to_numpy(dtype=np.float32, na_value=np.nan)
+    for j, value, missing in impute_targets:
+        column = values[:, j]
+        column[np.isnan(column) if missing is None else missing] = value
+    logger.info("Numerical imputation complete")
+    values[np.isnan(values)] = 0.0
+    df = pd.DataFrame(values, columns=cols, index=features.index)
     logger.info(f"Preprocessed eval data shape: {df.shape}")
     return df
 
@@ -89,21 +150,25 @@ def log_metrics_summary(metrics, is_binary=True):
         metrics: Dictionary of metrics to log
         is_binary: Whether these are binary classification metrics
     """
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
     logger.info("=" * 80)
     logger.info(f"METRICS SUMMARY - {timestamp}")
     logger.info("=" * 80)
     
-    # Log each metric with a consistent format
-    for name, value in metrics.items():
-        # Format numeric values to 4 decimal places
-        if isinstance(value, (int, float)):
-            formatted_value = f"{value:.4f}"
-        else:
-            formatted_value = str(value)
-        
-        # Add a special prefix for easy searching in logs
-        logger.info(f"METRIC: {name.ljust(25)} = {formatted_value}")
+    # One line per metric with a consistent format, emitted as a single log record;
+    # numeric values use 4 decimal places and the prefix keeps the lines easy to search for
+    logger.info(
+        "%s",
+        "\n".join(
+            f"METRIC: {name.ljust(25)} = {value:.4f}"
+            if isinstance(value, (int, float))
+            else f"METRIC: {name.ljust(25)} = {value}"
+            for name, value in metrics.items()
+        ),
+    )
     
     # Highlight key metrics based on task type
     logger.info("=" * 80)
@@ -132,23 +197,36 @@ def compute_metrics_binary(y_true, y_prob):
     """
     Compute binary classification metrics: AUC-ROC, average precision, and F1 score.
     """
+    from sklearn.metrics import roc_auc_score, average_precision_score, precision_recall_curve
     logger.info("Computing binary classification metrics")
     y_score = y_prob[:, 1]
+    
+    # precision[i]/recall[i] are for predicting positive when y_score >= thresholds[i]
+    # (ascending); the extra last point is "predict nothing positive". Every F1 below is
+    # read off this one curve instead of re-scoring the predictions per threshold.
+    precision, recall, thresholds = precision_recall_curve(y_true, y_score)
+    pr_sum = precision + recall
+    f1_curve = np.divide(2 * precision * recall, pr_sum, out=np.zeros_like(pr_sum), where=pr_sum > 0)
+    # Compare in the scores' dtype, as `y_score >= threshold` would
+    as_score = thresholds.dtype.type
+    
+    # Strict > 0.5 for the headline F1, i.e. the first curve threshold above 0.5
+    idx_gt_half = np.searchsorted(thresholds, as_score(0.5), side="right")
     metrics = {
         "auc_roc": roc_auc_score(y_true, y_score),
         "average_precision": average_precision_score(y_true, y_score),
-        "f1_score": f1_score(y_true, y_score > 0.5)
+        "f1_score": float(f1_curve[idx_gt_half])
     }
     
     # Add more detailed metrics
-    precision, recall, _ = precision_recall_curve(y_true, y_score)
-    metrics["precision_at_threshold_0.5"] = precision[0]
-    metrics["recall_at_threshold_0.5"] = recall[0]
+    idx_half = np.searchsorted(thresholds, as_score(0.5), side="left")
+    metrics["precision_at_threshold_0.5"] = float(precision[idx_half])
+    metrics["recall_at_threshold_0.5"] = float(recall[idx_half])
     
-    # Thresholds at different operating points
+    # Thresholds at different operating points (y_score >= threshold)
     for threshold in [0.3, 0.5, 0.7]:
-        y_pred = (y_score >= threshold).astype(int)
-        metrics[f"f1_score_at_{threshold}"] = f1_score(y_true, y_pred)
+        idx = np.searchsorted(thresholds, as_score(threshold), side="left")
+        metrics[f"f1_score_at_{threshold}"] = float(f1_curve[idx])
     
     # Log basic summary and detailed formatted metrics
     logger.info(f"Binary metrics computed: AUC={metrics['auc_roc']:.4f}, AP={metrics['average_precision']:.4f}, F1={metrics['f1_score']:.4f}")
@@ -161,32 +239,46 @@ def compute_metrics_multiclass(y_true, y_prob, n_classes):
     Compute multiclass metrics: one-vs-rest AUC-ROC, average precision, F1 for each class,
     and micro/macro averages for all metrics.
     """
+    from sklearn.metrics import roc_auc_score, average_precision_score, f1_score
     logger.info("Computing multiclass metrics")
     metrics = {}
     
+    # Binarize the labels once (one-vs-rest indicator matrix); per-class columns are views
+    y_true_bin_matrix = (np.asarray(y_true)[:, None] == np.arange(n_classes)).astype(np.int8)
+    y_pred = np.argmax(y_prob, axis=1)
+    
     # Per-class metrics
     for i in range(n_classes):
-        y_true_bin = (y_true == i).astype(int)
+        y_true_bin = y_true_bin_matrix[:, i]
         y_score = y_prob[:, i]
         metrics[f"auc_roc_class_{i}"] = roc_auc_score(y_true_bin, y_score)
         metrics[f"average_precision_class_{i}"] = average_precision_score(y_true_bin, y_score)
         metrics[f"f1_score_class_{i}"] = f1_score(y_true_bin, y_score > 0.5)
     
-    # Micro and macro averages
-    metrics["auc_roc_micro"] = roc_auc_score(y_true, y_prob, multi_class="ovr", average="micro")
-    metrics["auc_roc_macro"] = roc_auc_score(y_true, y_prob, multi_class="ovr", average="macro")
-    metrics["average_precision_micro"] = average_precision_score(y_true, y_prob, average="micro")
-    metrics["average_precision_macro"] = average_precision_score(y_true, y_prob, average="macro")
+    # Micro and macro averages over the already-binarized labels
+    metrics["auc_roc_micro"] = roc_auc_score(y_true_bin_matrix, y_prob, average="micro")
+    metrics["auc_roc_macro"] = roc_auc_score(y_true_bin_matrix, y_prob, average="macro")
+    metrics["average_precision_micro"] = average_precision_score(y_true_bin_matrix, y_prob, average="micro")
+    metrics["average_precision_macro"] = average_precision_score(y_true_bin_matrix, y_prob, average="macro")
     
-    y_pred = np.argmax(y_prob, axis=1)
     metrics["f1_score_micro"] = f1_score(y_true, y_pred, average="micro")
     metrics["f1_score_macro"] = f1_score(y_true, y_pred, average="macro")
     
     # Class distribution metrics
-    unique, counts = np.unique(y_true, return_counts=True)
-    for cls, count in zip(unique, counts):
+    # Integer labels are counted with a linear bincount; anything else falls back to np.unique
+    labels = np.asarray(y_true)
+    total = len(labels)
+    if np.issubdtype(labels.dtype, np.integer) and (total == 0 or labels.min() >= 0):
+        class_counts = [
+            (cls, count)
+            for cls, count in enumerate(np.bincount(labels.astype(np.int64, copy=False), minlength=n_classes))
+            if count
+        ]
+    else:
+        class_counts = zip(*np.unique(labels, return_counts=True))
+    for cls, count in class_counts:
         metrics[f"class_{cls}_count"] = int(count)
-        metrics[f"class_{cls}_ratio"] = float(count) / len(y_true)
+        metrics[f"class_{cls}_ratio"] = float(count) / total
     
     # Log basic summary and detailed formatted metrics
     logger.info(f"Multiclass metrics computed: Macro AUC={metrics['auc_roc_macro']:.4f}, Micro AUC={metrics['auc_roc_micro']:.4f}")
@@ -194,22 +286,72 @@ def compute_metrics_multiclass(y_true, y_prob, n_classes):
     
     return metrics
 
-def load_eval_data(eval_data_dir):
+_EVAL_DATA_SUFFIXES = frozenset({".csv", ".parquet"})
+
+def _find_first_eval_file(root):
+    """
+    Return the first .csv/.parquet path under root in sorted path order, i.e. the path
+    sorted(Path(root).glob("**/*")) would put first, without listing the whole tree.
+    Like the sorted glob, a directory with a matching suffix (e.g. a Spark-style
+    data.parquet/ directory) is returned itself, since it sorts before its contents.
+    Returns None if there is no such path.
+    """
+    try:
+        entries = sorted(os.scandir(root), key=lambda entry: entry.name)
+    except OSError:
+        return None
+    for entry in entries:
+        if Path(entry.name).suffix in _EVAL_DATA_SUFFIXES:
+            return Path(entry.path)
+        if entry.is_dir():
+            found = _find_first_eval_file(entry.path)
+            if found is not None:
+                return found
+    return None
+
+def _select_eval_columns(available, feature_columns, id_field, label_field):
+    """
+    Pick the columns to read from the eval file, in file order.
+    The first two columns are always kept so get_id_label_columns can fall back to them.
     """
-    Load the first .csv or .parquet file found in the evaluation data directory.
+    wanted = set(feature_columns)
+    wanted.update(field for field in (id_field, label_field) if field)
+    wanted.update(available[:2])
+    return [col for col in available if col in wanted]
+
+def load_eval_data(
+    eval_data_dir,
+    feature_columns: Optional[List[str]] = None,
+    id_field: Optional[str] = None,
+    label_field: Optional[str] = None
+):
+    """
+    Load the first .csv or .parquet path found in the evaluation data directory
+    (a partitioned .parquet directory is read as a whole).
+    When feature_columns is given, only the feature, id and label columns are read.
     Returns a pandas DataFrame.
     """
     logger.info(f"Loading eval data from {eval_data_dir}")
-    eval_files = sorted([f for f in Path(eval_data_dir).glob("**/*") if f.suffix in [".csv", ".parquet"]])
-    if not eval_files:
+    eval_file = _find_first_eval_file(eval_data_dir)
+    if eval_file is None:
         logger.error("No eval data file found in eval_data input.")
         raise RuntimeError("No eval data file found in eval_data input.")
-    eval_file = eval_files[0]
     logger.info(f"Using eval data file: {eval_file}")
     if eval_file.suffix == ".parquet":
-        df = pd.read_parquet(eval_file)
+        columns = None
+        if feature_columns is not None and HAS_PYARROW:
+            if eval_file.is_dir():
+                available = pq.ParquetDataset(eval_file).schema.names
+            else:
+                available = pq.read_schema(eval_file).names
+            columns = _select_eval_columns(available, feature_columns, id_field, label_field)
+        df = pd.read_parquet(eval_file, columns=columns)
     else:
-        df = pd.read_csv(eval_file)
+        usecols = None
+        if feature_columns is not None:
+            available = list(pd.read_csv(eval_file, nrows=0).columns)
+            usecols = _select_eval_columns(available, feature_columns, id_field, label_field)
+        df = pd.read_csv(eval_file, usecols=usecols)
     logger.info(f"Loaded eval data shape: {df.shape}")
     return df
 
@@ -228,12 +370,10 @@ def save_predictions(ids, y_true, y_prob, id_col, label_col, output_eval_dir):
     Save predictions to a CSV file, including id, true label, and class probabilities.
     """
     logger.info(f"Saving predictions to {output_eval_dir}")
-    prob_cols = [f"prob_class_{i}" for i in range(y_prob.shape[1])]
-    out_df = pd.DataFrame({id_col: ids, label_col: y_true})
-    for i, col in enumerate(prob_cols):
-        out_df[col] = y_prob[:, i]
+    columns = {id_col: ids, label_col: y_true}
+    columns.update({f"prob_class_{i}": y_prob[:, i] for i in range(y_prob.shape[1])})
     out_path = os.path.join(output_eval_dir, "eval_predictions.csv")
-    out_df.to_csv(out_path, index=False)
+    pd.DataFrame(columns).to_csv(out_path, index=False)
     logger.info(f"Saved predictions to {out_path}")
 
 def save_metrics(metrics, output_metrics_dir):
@@ -276,13 +416,28 @@ def save_metrics(metrics, output_metrics_dir):
     
     logger.info(f"Saved metrics summary to {summary_path}")
 
-def plot_and_save_roc_curve(y_true, y_score, output_dir, prefix=""):
+def _start_plot(plt, ax):
+    """
+    Make a fresh plotting target current: a new figure, or the given axes cleared for reuse.
+    Returns True if a new figure was created (and so should be closed by the caller).
+    """
+    if ax is None:
+        plt.figure()
+        return True
+    plt.sca(ax)
+    ax.clear()
+    return False
+
+def plot_and_save_roc_curve(y_true, y_score, output_dir, prefix="", ax=None):
     """
     Plot ROC curve and save as JPG.
+    If ax is given it is cleared and reused instead of creating (and closing) a new figure.
     """
+    from sklearn.metrics import roc_auc_score, roc_curve
+    plt = _get_pyplot()
     fpr, tpr, _ = roc_curve(y_true, y_score)
     auc = roc_auc_score(y_true, y_score)
-    plt.figure()
+    owns_figure = _start_plot(plt, ax)
     plt.plot(fpr, tpr, label=f"ROC curve (AUC = {auc:.2f})")
     plt.plot([0, 1], [0, 1], "k--", label="Random")
     plt.xlabel("False Positive Rate")
@@ -291,16 +446,20 @@ def plot_and_save_roc_curve(y_true, y_score, output_dir, prefix=""):
     plt.legend(loc="lower right")
     out_path = os.path.join(output_dir, f"{prefix}roc_curve.jpg")
     plt.savefig(out_path, format="jpg")
-    plt.close()
+    if owns_figure:
+        plt.close()
     logger.info(f"Saved ROC curve to {out_path}")
 
-def plot_and_save_pr_curve(y_true, y_score, output_dir, prefix=""):
+def plot_and_save_pr_curve(y_true, y_score, output_dir, prefix="", ax=None):
     """
     Plot Precision-Recall curve and save as JPG.
+    If ax is given it is cleared and reused instead of creating (and closing) a new figure.
     """
+    from sklearn.metrics import average_precision_score, precision_recall_curve
+    plt = _get_pyplot()
     precision, recall, _ = precision_recall_curve(y_true, y_score)
     ap = average_precision_score(y_true, y_score)
-    plt.figure()
+    owns_figure = _start_plot(plt, ax)
     plt.plot(recall, precision, label=f"PR curve (AP = {ap:.2f})")
     plt.xlabel("Recall")
     plt.ylabel("Precision")
@@ -308,7 +467,8 @@ def plot_and_save_pr_curve(y_true, y_score, output_dir, prefix=""):
     plt.legend(loc="lower left")
     out_path = os.path.join(output_dir, f"{prefix}pr_curve.jpg")
     plt.savefig(out_path, format="jpg")
-    plt.close()
+    if owns_figure:
+        plt.close()
     logger.info(f"Saved PR curve to {out_path}")
 
 def evaluate_model(model, df, feature_columns, id_col, label_col, hyperparams, output_eval_dir, output_metrics_dir):
@@ -319,13 +479,23 @@ def evaluate_model(model, df, feature_columns, id_col, label_col, hyperparams, o
     logger.info("Evaluating model")
     y_true = df[label_col].values
     ids = df[id_col].values
-    X = df[feature_columns].values
+    # float32 is what XGBoost stores internally, so DMatrix can use the array without converting it
+    X = np.ascontiguousarray(df[feature_columns].to_numpy(dtype=np.float32, copy=False))
 
-    dmatrix = xgb.DMatrix(X)
-    y_prob = model.predict(dmatrix)
+    try:
+        # Predict straight from the array, skipping DMatrix construction
+        y_prob = model.inplace_predict(X)
+    except (xgb.core.XGBoostError, TypeError, ValueError) as e:
+        # e.g. gblinear boosters do not support inplace prediction
+        logger.info(f"inplace_predict not supported ({e}); falling back to DMatrix prediction")
+        dmatrix = xgb.DMatrix(X, feature_names=feature_columns, nthread=-1)
+        y_prob = model.predict(dmatrix)
     logger.info(f"Model prediction shape: {y_prob.shape}")
     if len(y_prob.shape) == 1:
-        y_prob = np.column_stack([1 - y_prob, y_prob])
+        two_col = np.empty((y_prob.shape[0], 2), dtype=y_prob.dtype)
+        np.subtract(1.0, y_prob, out=two_col[:, 0])
+        two_col[:, 1] = y_prob
+        y_prob = two_col
         logger.info("Converted binary prediction to two-column probabilities")
 
     # Determine the classification type from the model's saved hyperparameters,
@@ -343,11 +513,17 @@ def evaluate_model(model, df, feature_columns, id_col, label_col, hyperparams, o
         n_classes = y_prob.shape[1]
         logger.info(f"Detected multiclass classification task with {n_classes} classes.")
         metrics = compute_metrics_multiclass(y_true, y_prob, n_classes)
-        for i in range(n_classes):
-            y_true_bin = (y_true == i).astype(int)
-            if len(np.unique(y_true_bin)) > 1:
-                plot_and_save_roc_curve(y_true_bin, y_prob[:, i], output_metrics_dir, prefix=f"class_{i}_")
-                plot_and_save_pr_curve(y_true_bin, y_prob[:, i], output_metrics_dir, prefix=f"class_{i}_")
+        # One figure is reused for every per-class curve rather than one figure per plot
+        plt = _get_pyplot()
+        fig, ax = plt.subplots()
+        try:
+            for i in range(n_classes):
+                y_true_bin = (y_true == i).astype(int)
+                if len(np.unique(y_true_bin)) > 1:
+                    plot_and_save_roc_curve(y_true_bin, y_prob[:, i], output_metrics_dir, prefix=f"class_{i}_", ax=ax)
+                    plot_and_save_pr_curve(y_true_bin, y_prob[:, i], output_metrics_dir, prefix=f"class_{i}_", ax=ax)
+        finally:
+            plt.close(fig)
 
     save_predictions(ids, y_true, y_prob, id_col, label_col, output_eval_dir)
     save_metrics(metrics, output_metrics_dir)
@@ -400,9 +576,8 @@ def main(
     model, risk_tables, impute_dict, feature_columns, hyperparams = load_model_artifacts(model_dir)
     
     # Load and preprocess data
-    df = load_eval_data(eval_data_dir)
+    df = load_eval_data(eval_data_dir, feature_columns, id_field, label_field)
     df = preprocess_eval_data(df, feature_columns, risk_tables, impute_dict)
-    df = df[[col for col in feature_columns if col in df.columns]]
     
     # Get ID and label columns
     id_col, label_col = get_id_label_columns(df, id_field, label_field)
@@ -280,16 +280,17 @@ def save_artifacts(model: xgb.Booster, risk_tables: dict, impute_dict: dict, mod
     model.save_model(model_file)
     logger.info(f"Saved XGBoost model to {model_file}")
 
-    # Save risk tables
+    # Save risk tables; pickle protocol 4 is pinned so that inference images
+    # on Python older than 3.8 (which lack protocol 5) can still load them
     risk_map_file = os.path.join(model_path, "risk_table_map.pkl")
     with open(risk_map_file, "wb") as f:
-        pkl.dump(risk_tables, f)
+        pkl.dump(risk_tables, f, protocol=4)
     logger.info(f"Saved consolidated risk table map to {risk_map_file}")
     
     # Save imputation dictionary
     impute_file = os.path.join(model_path, "impute_dict.pkl")
     with open(impute_file, "wb") as f:
-        pkl.dump(impute_dict, f)
+        pkl.dump(impute_dict, f, protocol=4)
     logger.info(f"Saved imputation dictionary to {impute_file}")
 
     # Save feature importance
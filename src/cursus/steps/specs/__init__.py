@@ -6,55 +6,76 @@ dependencies, outputs, and script contracts. These specifications serve as the
 single source of truth for step behavior and connectivity.
 """
 
-# Batch Transform specifications
-from .batch_transform_calibration_spec import BATCH_TRANSFORM_CALIBRATION_SPEC
-from .batch_transform_testing_spec import BATCH_TRANSFORM_TESTING_SPEC
-from .batch_transform_training_spec import BATCH_TRANSFORM_TRAINING_SPEC
-from .batch_transform_validation_spec import BATCH_TRANSFORM_VALIDATION_SPEC
-
-# Currency Conversion specifications
-from .currency_conversion_calibration_spec import CURRENCY_CONVERSION_CALIBRATION_SPEC
-from .currency_conversion_testing_spec import CURRENCY_CONVERSION_TESTING_SPEC
-from .currency_conversion_training_spec import CURRENCY_CONVERSION_TRAINING_SPEC
-from .currency_conversion_validation_spec import CURRENCY_CONVERSION_VALIDATION_SPEC
-
-# Data Loading specifications
-from .cradle_data_loading_spec import DATA_LOADING_SPEC
-from .cradle_data_loading_calibration_spec import DATA_LOADING_CALIBRATION_SPEC
-from .cradle_data_loading_testing_spec import DATA_LOADING_TESTING_SPEC
-from .cradle_data_loading_training_spec import DATA_LOADING_TRAINING_SPEC
-from .cradle_data_loading_validation_spec import DATA_LOADING_VALIDATION_SPEC
-
-# Training specifications
-from .dummy_training_spec import DUMMY_TRAINING_SPEC
-from .pytorch_training_spec import PYTORCH_TRAINING_SPEC
-from .xgboost_training_spec import XGBOOST_TRAINING_SPEC
-
-# Model specifications
-from .pytorch_model_spec import PYTORCH_MODEL_SPEC
-from .xgboost_model_spec import XGBOOST_MODEL_SPEC
-
-# Model operations specifications
-from .model_calibration_spec import MODEL_CALIBRATION_SPEC
-from .xgboost_model_eval_spec import MODEL_EVAL_SPEC
-
-# Packaging and deployment specifications
-from .package_spec import PACKAGE_SPEC
-from .payload_spec import PAYLOAD_SPEC
-from .registration_spec import REGISTRATION_SPEC
-
-# Preprocessing specifications
-from .tabular_preprocessing_spec import TABULAR_PREPROCESSING_SPEC
-from .tabular_preprocessing_calibration_spec import TABULAR_PREPROCESSING_CALIBRATION_SPEC
-from .tabular_preprocessing_testing_spec import TABULAR_PREPROCESSING_TESTING_SPEC
-from .tabular_preprocessing_training_spec import TABULAR_PREPROCESSING_TRAINING_SPEC
-from .tabular_preprocessing_validation_spec import TABULAR_PREPROCESSING_VALIDATION_SPEC
-
-# Risk Table Mapping specifications
-from .risk_table_mapping_calibration_spec import RISK_TABLE_MAPPING_CALIBRATION_SPEC
-from .risk_table_mapping_testing_spec import RISK_TABLE_MAPPING_TESTING_SPEC
-from .risk_table_mapping_training_spec import RISK_TABLE_MAPPING_TRAINING_SPEC
-from .risk_table_mapping_validation_spec import RISK_TABLE_MAPPING_VALIDATION_SPEC
+import importlib
+
+# Spec constants are imported from their modules on first access (PEP 562), so
+# importing this package does not build every specification up front.
+_SPEC_MODULES = {
+    # Batch Transform specifications
+    "BATCH_TRANSFORM_CALIBRATION_SPEC": "batch_transform_calibration_spec",
+    "BATCH_TRANSFORM_TESTING_SPEC": "batch_transform_testing_spec",
+    "BATCH_TRANSFORM_TRAINING_SPEC": "batch_transform_training_spec",
+    "BATCH_TRANSFORM_VALIDATION_SPEC": "batch_transform_validation_spec",
+
+    # Currency Conversion specifications
+    "CURRENCY_CONVERSION_CALIBRATION_SPEC": "currency_conversion_calibration_spec",
+    "CURRENCY_CONVERSION_TESTING_SPEC": "currency_conversion_testing_spec",
+    "CURRENCY_CONVERSION_TRAINING_SPEC": "currency_conversion_training_spec",
+    "CURRENCY_CONVERSION_VALIDATION_SPEC": "currency_conversion_validation_spec",
+
+    # Data Loading specifications
+    "DATA_LOADING_SPEC": "cradle_data_loading_spec",
+    "DATA_LOADING_CALIBRATION_SPEC": "cradle_data_loading_calibration_spec",
+    "DATA_LOADING_TESTING_SPEC": "cradle_data_loading_testing_spec",
+    "DATA_LOADING_TRAINING_SPEC": "cradle_data_loading_training_spec",
+    "DATA_LOADING_VALIDATION_SPEC": "cradle_data_loading_validation_spec",
+
+    # Training specifications
+    "DUMMY_TRAINING_SPEC": "dummy_training_spec",
+    "PYTORCH_TRAINING_SPEC": "pytorch_training_spec",
+    "XGBOOST_TRAINING_SPEC": "xgboost_training_spec",
+
+    # Model specifications
+    "PYTORCH_MODEL_SPEC": "pytorch_model_spec",
+    "XGBOOST_MODEL_SPEC": "xgboost_model_spec",
+
+    # Model operations specifications
+    "MODEL_CALIBRATION_SPEC": "model_calibration_spec",
+    "MODEL_EVAL_SPEC": "xgboost_model_eval_spec",
+
+    # Packaging and deployment specifications
+    "PACKAGE_SPEC": "package_spec",
+    "PAYLOAD_SPEC": "payload_spec",
+    "REGISTRATION_SPEC": "registration_spec",
+
+    # Preprocessing specifications
+    "TABULAR_PREPROCESSING_SPEC": "tabular_preprocessing_spec",
+    "TABULAR_PREPROCESSING_CALIBRATION_SPEC": "tabular_preprocessing_calibration_spec",
+    "TABULAR_PREPROCESSING_TESTING_SPEC": "tabular_preprocessing_testing_spec",
+    "TABULAR_PREPROCESSING_TRAINING_SPEC": "tabular_preprocessing_training_spec",
+    "TABULAR_PREPROCESSING_VALIDATION_SPEC": "tabular_preprocessing_validation_spec",
+
+    # Risk Table Mapping specifications
+    "RISK_TABLE_MAPPING_CALIBRATION_SPEC": "risk_table_mapping_calibration_spec",
+    "RISK_TABLE_MAPPING_TESTING_SPEC": "risk_table_mapping_testing_spec",
+    "RISK_TABLE_MAPPING_TRAINING_SPEC": "risk_table_mapping_training_spec",
+    "RISK_TABLE_MAPPING_VALIDATION_SPEC": "risk_table_mapping_validation_spec",
+}
+
+
+def __getattr__(name):
+    """Import a step specification from its module on first access."""
+    module_name = _SPEC_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_SPEC_MODULES))
+
 
 __all__ = [
     # Batch Transform specifications
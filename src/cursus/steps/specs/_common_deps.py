@@ -0,0 +1,23 @@
+"""
+Shared dependency specifications.
+
+Dependencies declared identically by several step specifications are defined
+once here and referenced from each spec, so the loaded specs share a single
+instance. These objects are shared: treat them as read-only.
+"""
+
+from ...core.base.specification_base import DependencySpec, DependencyType
+
+# Optional externally provided hyperparameters (risk table mapping generates its own)
+HYPERPARAMETERS_S3_URI_DEP = DependencySpec(
+    logical_name="hyperparameters_s3_uri",
+    dependency_type=DependencyType.HYPERPARAMETERS,
+    required=False,
+    compatible_sources=[
+        "HyperparameterPrep", "ProcessingStep", "ConfigurationStep",
+        "DataPrep", "ModelTraining", "FeatureEngineering", "DataQuality"
+    ],
+    semantic_keywords=["config", "params", "hyperparameters", "settings", "hyperparams"],
+    data_type="S3Uri",
+    description="Optional external hyperparameters configuration file (will be overridden by internal generation)"
+)
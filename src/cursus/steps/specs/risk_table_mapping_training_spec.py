@@ -7,6 +7,7 @@ specifically for training data, including their dependencies and outputs.
 
 from ...core.base.specification_base import StepSpecification, DependencySpec, OutputSpec, DependencyType, NodeType
 from ..registry.step_names import get_spec_step_type_with_job_type
+from ._common_deps import HYPERPARAMETERS_S3_URI_DEP
 
 # Import the contract at runtime to avoid circular imports
 def _get_risk_table_mapping_contract():
@@ -30,18 +31,7 @@ RISK_TABLE_MAPPING_TRAINING_SPEC = StepSpecification(
         ),
         # Hyperparameters are optional as they can be generated internally,
         # but we still support external hyperparameters being provided
-        DependencySpec(
-            logical_name="hyperparameters_s3_uri",
-            dependency_type=DependencyType.HYPERPARAMETERS,
-            required=False,
-            compatible_sources=[
-                "HyperparameterPrep", "ProcessingStep", "ConfigurationStep",
-                "DataPrep", "ModelTraining", "FeatureEngineering", "DataQuality"
-            ],
-            semantic_keywords=["config", "params", "hyperparameters", "settings", "hyperparams"],
-            data_type="S3Uri",
-            description="Optional external hyperparameters configuration file (will be overridden by internal generation)"
-        ),
+        HYPERPARAMETERS_S3_URI_DEP,
         # Risk tables dependency - optional for training mode since training creates them
         DependencySpec(
             logical_name="risk_tables",
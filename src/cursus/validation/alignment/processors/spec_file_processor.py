@@ -212,6 +212,9 @@ class SpecificationFileProcessor:
         ).replace(
             'from ..contracts.',
             'from src.cursus.steps.contracts.'
+        ).replace(
+            'from ._common_deps import',
+            'from src.cursus.steps.specs._common_deps import'
         )
     
     def _determine_spec_var_name(self, contract_name: str, job_type: str) -> str:
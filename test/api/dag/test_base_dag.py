@@ -62,6 +62,37 @@ class TestPipelineDAG(unittest.TestCase):
         dag.add_node('X')
         self.assertEqual(dag.nodes.count('X'), 1)
 
+    def test_add_node_unchecked(self):
+        """Test adding a node without the duplicate check."""
+        dag = PipelineDAG()
+        dag.add_node_unchecked('X')
+        
+        self.assertEqual(dag.nodes, ['X'])
+        self.assertEqual(dag.adj_list['X'], [])
+        self.assertEqual(dag.reverse_adj['X'], [])
+        dag.validate()
+        
+        # Duplicates are only caught by validate()
+        dag.add_node_unchecked('X')
+        with self.assertRaises(ValueError):
+            dag.validate()
+
+    def test_validate(self):
+        """Test structural validation of the DAG."""
+        self.dag.validate()
+        
+        cyclic = PipelineDAG(
+            nodes=['A', 'B'],
+            edges=[('A', 'B'), ('B', 'A')]
+        )
+        with self.assertRaises(ValueError):
+            cyclic.validate()
+        
+        dangling = PipelineDAG(nodes=['A'])
+        dangling.edges.append(('A', 'Z'))
+        with self.assertRaises(ValueError):
+            dangling.validate()
+
     def test_add_edge(self):
         """Test adding an edge to the DAG."""
         dag = PipelineDAG()
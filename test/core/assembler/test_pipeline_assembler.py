@@ -11,8 +11,8 @@ project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from src.cursus.core.assembler.pipeline_assembler import PipelineAssembler
-from src.cursus.core.base import BasePipelineConfig, StepBuilderBase, OutputSpec, DependencySpec, StepSpecification
+from src.cursus.core.assembler.pipeline_assembler import PipelineAssembler, _resolve_step_type
+from src.cursus.core.base import BasePipelineConfig, StepBuilderBase, OutputSpec, DependencySpec, StepSpecification, DependencyType
 from src.cursus.api.dag.base_dag import PipelineDAG
 from src.cursus.core.deps.registry_manager import RegistryManager
 from src.cursus.core.deps.dependency_resolver import UnifiedDependencyResolver
@@ -42,12 +42,14 @@ class MockStepBuilder(StepBuilderBase):
         self.spec = Mock(spec=StepSpecification)
         self.spec.step_type = "MockStep"
         self.spec.outputs = {
-            "output1": Mock(spec=OutputSpec, property_path="Steps.MockStep.OutputDataConfig.S3OutputPath"),
-            "output2": Mock(spec=OutputSpec, property_path="Steps.MockStep.ProcessingOutputConfig.Outputs.output2.S3Output.S3Uri")
+            "output1": Mock(spec=OutputSpec, output_type=DependencyType.PROCESSING_OUTPUT,
+                            property_path="Steps.MockStep.OutputDataConfig.S3OutputPath"),
+            "output2": Mock(spec=OutputSpec, output_type=DependencyType.PROCESSING_OUTPUT,
+                            property_path="Steps.MockStep.ProcessingOutputConfig.Outputs.output2.S3Output.S3Uri")
         }
         self.spec.dependencies = {
-            "input1": Mock(spec=DependencySpec),
-            "input2": Mock(spec=DependencySpec)
+            "input1": Mock(spec=DependencySpec, dependency_type=DependencyType.PROCESSING_OUTPUT),
+            "input2": Mock(spec=DependencySpec, dependency_type=DependencyType.PROCESSING_OUTPUT)
         }
         self.spec.get_output_by_name_or_alias = Mock(side_effect=lambda name: self.spec.outputs.get(name))
         
@@ -89,6 +91,9 @@ class TestPipelineAssembler(unittest.TestCase):
     
     def setUp(self):
         """Set up test fixtures."""
+        # Step types are cached per config class name; tests patch the registry
+        _resolve_step_type.cache_clear()
+        
         # Create mock DAG
         self.nodes = ['step1', 'step2', 'step3']
         self.edges = [('step1', 'step2'), ('step2', 'step3')]
@@ -139,6 +144,11 @@ class TestPipelineAssembler(unittest.TestCase):
         self.assertEqual(assembler.sagemaker_session, self.mock_session)
         self.assertEqual(assembler.role, self.role)
         self.assertEqual(assembler.notebook_root, self.notebook_root)
+        
+        # Step builders are created on first use
+        self.assertEqual(assembler.step_builders, {})
+        for step_name in self.nodes:
+            assembler._get_builder(step_name)
         self.assertEqual(len(assembler.step_builders), 3)
         
         # Verify step builders were created
@@ -146,6 +156,38 @@ class TestPipelineAssembler(unittest.TestCase):
             self.assertIn(step_name, assembler.step_builders)
             self.assertIsInstance(assembler.step_builders[step_name], MockStepBuilder)
 
+    def test_get_builder_instantiates_once(self):
+        """Test that builders are instantiated on first access and then reused."""
+        builder_cls = Mock(side_effect=MockStepBuilder)
+        assembler = PipelineAssembler(
+            dag=self.dag,
+            config_map=self.config_map,
+            step_builder_map={'MockConfig': builder_cls},
+            registry_manager=self.mock_registry_manager,
+            dependency_resolver=self.mock_dependency_resolver
+        )
+        builder_cls.assert_not_called()
+        
+        builder = assembler._get_builder('step1')
+        self.assertIs(assembler._get_builder('step1'), builder)
+        self.assertEqual(builder_cls.call_count, 1)
+        self.assertIs(assembler._get_spec('step1'), builder.spec)
+
+    def test_resolve_step_type_warns_once_per_class(self):
+        """Test that unregistered config classes only log the fallback warning once."""
+        with patch('src.cursus.core.assembler.pipeline_assembler.logger') as mock_logger:
+            PipelineAssembler(
+                dag=self.dag,
+                config_map=self.config_map,
+                step_builder_map=self.step_builder_map,
+                registry_manager=self.mock_registry_manager,
+                dependency_resolver=self.mock_dependency_resolver
+            )
+            
+            # Three MockConfig instances, one warning
+            mock_logger.warning.assert_called_once()
+            self.assertEqual(_resolve_step_type('MockConfig'), 'MockConfig')
+
     def test_init_missing_configs(self):
         """Test initialization with missing configs raises ValueError."""
         incomplete_config_map = {
@@ -186,6 +228,22 @@ class TestPipelineAssembler(unittest.TestCase):
                 edges=[('step1', 'step2'), ('step2', 'step3')]  # step3 doesn't exist
             )
 
+    def test_init_edge_to_unknown_node(self):
+        """Test initialization with an edge to a node outside the DAG raises ValueError."""
+        dag = PipelineDAG(nodes=['step1', 'step2', 'step3'], edges=[('step1', 'step2')])
+        dag.edges.append(('step2', 'step4'))
+        
+        with self.assertRaises(ValueError) as context:
+            PipelineAssembler(
+                dag=dag,
+                config_map=self.config_map,
+                step_builder_map=self.step_builder_map,
+                registry_manager=self.mock_registry_manager,
+                dependency_resolver=self.mock_dependency_resolver
+            )
+        
+        self.assertIn("Edge destination node not in DAG: step4", str(context.exception))
+
     @patch('src.cursus.core.assembler.pipeline_assembler.CONFIG_STEP_REGISTRY')
     def test_initialize_step_builders(self, mock_registry):
         """Test step builder initialization."""
@@ -200,6 +258,8 @@ class TestPipelineAssembler(unittest.TestCase):
             dependency_resolver=self.mock_dependency_resolver
         )
         
+        assembler._initialize_step_builders()
+        
         # Verify all step builders were initialized
         self.assertEqual(len(assembler.step_builders), 3)
         for step_name in self.nodes:
@@ -229,6 +289,93 @@ class TestPipelineAssembler(unittest.TestCase):
         # step3 should have messages from step2
         self.assertTrue(len(assembler.step_messages) >= 0)  # May be empty if no matches
 
+    def test_propagate_messages_keys_by_step_and_dependency(self):
+        """Test that step messages are keyed by (destination step, dependency name)."""
+        assembler = PipelineAssembler(
+            dag=self.dag,
+            config_map=self.config_map,
+            step_builder_map=self.step_builder_map,
+            registry_manager=self.mock_registry_manager,
+            dependency_resolver=self.mock_dependency_resolver
+        )
+        
+        assembler._propagate_messages()
+        
+        self.assertEqual(
+            set(assembler.step_messages),
+            {('step2', 'input1'), ('step2', 'input2'), ('step3', 'input1'), ('step3', 'input2')}
+        )
+        message = assembler.step_messages[('step2', 'input1')]
+        self.assertEqual(message.source_step, 'step1')
+        self.assertEqual(message.source_output, 'output1')
+        self.assertEqual(message.compatibility, 0.8)
+
+    def test_propagate_messages_reuses_compatibility_scores(self):
+        """Test that edges sharing specifications reuse compatibility scores."""
+        shared_spec = MockStepBuilder(MockConfig()).spec
+        
+        class SharedSpecBuilder(MockStepBuilder):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.spec = shared_spec
+        
+        # Two sources with the same spec feeding the same destination
+        dag = PipelineDAG(
+            nodes=['step1', 'step2', 'step3'],
+            edges=[('step1', 'step3'), ('step2', 'step3')]
+        )
+        assembler = PipelineAssembler(
+            dag=dag,
+            config_map=self.config_map,
+            step_builder_map={'MockConfig': SharedSpecBuilder},
+            registry_manager=self.mock_registry_manager,
+            dependency_resolver=self.mock_dependency_resolver
+        )
+        
+        assembler._propagate_messages()
+        
+        # 2 dependencies x 2 outputs, computed once for both edges
+        self.assertEqual(self.mock_dependency_resolver._calculate_compatibility.call_count, 4)
+
+    def test_propagate_messages_stops_at_perfect_match(self):
+        """Test that a perfect match stops scoring the remaining outputs."""
+        self.mock_dependency_resolver._calculate_compatibility.return_value = 1.0
+        assembler = PipelineAssembler(
+            dag=self.dag,
+            config_map=self.config_map,
+            step_builder_map=self.step_builder_map,
+            registry_manager=self.mock_registry_manager,
+            dependency_resolver=self.mock_dependency_resolver
+        )
+        
+        assembler._propagate_messages()
+        
+        # 2 edges x 2 dependencies, only the first output is scored each time
+        self.assertEqual(self.mock_dependency_resolver._calculate_compatibility.call_count, 4)
+        self.assertEqual(assembler.step_messages[('step3', 'input2')].source_output, 'output1')
+
+    def test_propagate_messages_skips_incompatible_output_types(self):
+        """Test that outputs with incompatible types are never scored."""
+        class ModelOutputBuilder(MockStepBuilder):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                for out_spec in self.spec.outputs.values():
+                    out_spec.output_type = DependencyType.MODEL_ARTIFACTS
+        
+        self.mock_dependency_resolver._are_types_compatible.return_value = False
+        assembler = PipelineAssembler(
+            dag=self.dag,
+            config_map=self.config_map,
+            step_builder_map={'MockConfig': ModelOutputBuilder},
+            registry_manager=self.mock_registry_manager,
+            dependency_resolver=self.mock_dependency_resolver
+        )
+        
+        assembler._propagate_messages()
+        
+        self.mock_dependency_resolver._calculate_compatibility.assert_not_called()
+        self.assertEqual(len(assembler.step_messages), 0)
+
     def test_generate_outputs(self):
         """Test output generation for a step."""
         assembler = PipelineAssembler(
@@ -250,6 +397,22 @@ class TestPipelineAssembler(unittest.TestCase):
             for output_name, output_path in outputs.items():
                 self.assertTrue(output_path.startswith("s3://"))
 
+    def test_generate_outputs_paths(self):
+        """Test that output paths follow {pipeline_s3_loc}/{step_type}/{logical_name}."""
+        assembler = PipelineAssembler(
+            dag=self.dag,
+            config_map=self.config_map,
+            step_builder_map=self.step_builder_map,
+            registry_manager=self.mock_registry_manager,
+            dependency_resolver=self.mock_dependency_resolver
+        )
+        
+        base_s3_loc = self.config_map['step1'].pipeline_s3_loc
+        self.assertEqual(assembler._generate_outputs('step1'), {
+            'output1': f"{base_s3_loc}/mockstep/output1",
+            'output2': f"{base_s3_loc}/mockstep/output2",
+        })
+
     def test_instantiate_step(self):
         """Test step instantiation."""
         assembler = PipelineAssembler(
@@ -274,6 +437,51 @@ class TestPipelineAssembler(unittest.TestCase):
         step2 = assembler._instantiate_step('step2')
         self.assertIsNotNone(step2)
 
+    def test_instantiate_step_passes_predecessor_steps(self):
+        """Test that instantiated predecessors are passed as step dependencies."""
+        assembler = PipelineAssembler(
+            dag=self.dag,
+            config_map=self.config_map,
+            step_builder_map=self.step_builder_map,
+            registry_manager=self.mock_registry_manager,
+            dependency_resolver=self.mock_dependency_resolver
+        )
+        
+        step1 = assembler._instantiate_step('step1')
+        assembler.step_instances['step1'] = step1
+        step2 = assembler._instantiate_step('step2')
+        
+        self.assertEqual(step1.dependencies, [])
+        self.assertEqual(step2.dependencies, [step1])
+
+    @patch('src.cursus.core.assembler.pipeline_assembler.Pipeline')
+    @patch('src.cursus.core.assembler.pipeline_assembler.PropertyReference')
+    def test_runtime_properties_shared_across_consumers(self, mock_prop_ref_class, mock_pipeline_class):
+        """Test that one runtime property is built per consumed source output."""
+        dag = PipelineDAG(
+            nodes=['step1', 'step2', 'step3'],
+            edges=[('step1', 'step2'), ('step1', 'step3')]
+        )
+        assembler = PipelineAssembler(
+            dag=dag,
+            config_map=self.config_map,
+            step_builder_map=self.step_builder_map,
+            registry_manager=self.mock_registry_manager,
+            dependency_resolver=self.mock_dependency_resolver
+        )
+        
+        assembler.generate_pipeline("test_pipeline")
+        
+        # All four dependencies bind to step1.output1
+        mock_prop_ref_class.assert_called_once()
+        runtime_prop = mock_prop_ref_class.return_value.to_runtime_property.return_value
+        self.assertIs(assembler.step_instances['step2'].inputs['input1'], runtime_prop)
+        self.assertIs(assembler.step_instances['step3'].inputs['input2'], runtime_prop)
+        
+        # Regeneration builds the properties again for the new step instances
+        assembler.generate_pipeline("test_pipeline")
+        self.assertEqual(mock_prop_ref_class.call_count, 2)
+
     @patch('src.cursus.core.assembler.pipeline_assembler.Pipeline')
     def test_generate_pipeline(self, mock_pipeline_class):
         """Test pipeline generation."""
@@ -301,22 +509,114 @@ class TestPipelineAssembler(unittest.TestCase):
         # Verify all steps were instantiated
         self.assertEqual(len(assembler.step_instances), 3)
 
-    def test_generate_pipeline_with_cycle(self):
-        """Test pipeline generation with cyclic DAG raises error."""
+    def test_kahn_sort_matches_dag_order(self):
+        """Test that the assembler's sort matches PipelineDAG.topological_sort."""
+        dag = PipelineDAG(
+            nodes=['step1', 'step2', 'step3'],
+            edges=[('step1', 'step3'), ('step2', 'step3'), ('step1', 'step2')]
+        )
+        assembler = PipelineAssembler(
+            dag=dag,
+            config_map=self.config_map,
+            step_builder_map=self.step_builder_map,
+            registry_manager=self.mock_registry_manager,
+            dependency_resolver=self.mock_dependency_resolver
+        )
+        
+        self.assertEqual(assembler._kahn_sort(), dag.topological_sort())
+        self.assertEqual(assembler._kahn_sort(), ['step1', 'step2', 'step3'])
+
+    def test_init_with_cycle(self):
+        """Test initialization with cyclic DAG raises error before building steps."""
         # Create DAG with cycle
         cyclic_dag = PipelineDAG(
             nodes=['step1', 'step2', 'step3'],
             edges=[('step1', 'step2'), ('step2', 'step3'), ('step3', 'step1')]
         )
+        builder_cls = Mock()
         
+        # Should raise ValueError due to cycle
+        with self.assertRaises(ValueError) as context:
+            PipelineAssembler(
+                dag=cyclic_dag,
+                config_map=self.config_map,
+                step_builder_map={'MockConfig': builder_cls},
+                registry_manager=self.mock_registry_manager,
+                dependency_resolver=self.mock_dependency_resolver
+            )
+        
+        self.assertIn("DAG contains a cycle: step1 -> step2 -> step3 -> step1", str(context.exception))
+        builder_cls.assert_not_called()
+
+    def test_find_cycle(self):
+        """Test cycle detection on acyclic, cyclic and self-loop graphs."""
+        assembler = PipelineAssembler(
+            dag=PipelineDAG(
+                nodes=['step1', 'step2', 'step3'],
+                edges=[('step1', 'step2'), ('step1', 'step3'), ('step2', 'step3')]
+            ),
+            config_map=self.config_map,
+            step_builder_map=self.step_builder_map,
+            registry_manager=self.mock_registry_manager,
+            dependency_resolver=self.mock_dependency_resolver
+        )
+        self.assertIsNone(assembler._find_cycle())
+        
+        # Cycle that does not include the first node
+        assembler.dag.add_edge('step3', 'step2')
+        assembler._build_adjacency()
+        self.assertEqual(assembler._find_cycle(), ['step2', 'step3', 'step2'])
+        
+        assembler.dag = PipelineDAG(nodes=['step1'], edges=[('step1', 'step1')])
+        assembler._build_adjacency()
+        self.assertEqual(assembler._find_cycle(), ['step1', 'step1'])
+
+    def test_topological_levels(self):
+        """Test grouping of steps into independent levels."""
+        dag = PipelineDAG(
+            nodes=['step1', 'step2', 'step3'],
+            edges=[('step1', 'step3'), ('step2', 'step3')]
+        )
         assembler = PipelineAssembler(
-            dag=cyclic_dag,
+            dag=dag,
             config_map=self.config_map,
             step_builder_map=self.step_builder_map,
             registry_manager=self.mock_registry_manager,
             dependency_resolver=self.mock_dependency_resolver
         )
         
+        self.assertEqual(assembler._topological_levels(assembler._kahn_sort()), [['step1', 'step2'], ['step3']])
+
+    @patch.dict(os.environ, {'CURSUS_PARALLEL_STEP_CREATION': 'true'})
+    @patch('src.cursus.core.assembler.pipeline_assembler.Pipeline')
+    def test_generate_pipeline_parallel(self, mock_pipeline_class):
+        """Test pipeline generation with concurrent step instantiation."""
+        assembler = PipelineAssembler(
+            dag=self.dag,
+            config_map=self.config_map,
+            step_builder_map=self.step_builder_map,
+            registry_manager=self.mock_registry_manager,
+            dependency_resolver=self.mock_dependency_resolver
+        )
+        self.assertTrue(assembler._parallel)
+        
+        assembler.generate_pipeline("test_pipeline")
+        
+        steps = mock_pipeline_class.call_args.kwargs['steps']
+        self.assertEqual(steps, [assembler.step_instances[name] for name in self.nodes])
+        self.assertEqual(assembler.step_instances['step3'].dependencies, [assembler.step_instances['step2']])
+
+    def test_generate_pipeline_with_cycle(self):
+        """Test pipeline generation after introducing a cycle raises error."""
+        assembler = PipelineAssembler(
+            dag=self.dag,
+            config_map=self.config_map,
+            step_builder_map=self.step_builder_map,
+            registry_manager=self.mock_registry_manager,
+            dependency_resolver=self.mock_dependency_resolver
+        )
+        self.dag.add_edge('step3', 'step1')
+        
         # Should raise ValueError due to cycle
         with self.assertRaises(ValueError) as context:
             assembler.generate_pipeline("test_pipeline")
@@ -434,6 +734,68 @@ class TestPipelineAssembler(unittest.TestCase):
             # Verify instances were cleared and recreated
             self.assertEqual(len(assembler.step_instances), 3)  # All steps recreated
 
+    def test_pipeline_regeneration_reuses_build_order(self):
+        """Test that regeneration reuses the cached build order until the DAG changes."""
+        assembler = PipelineAssembler(
+            dag=self.dag,
+            config_map=self.config_map,
+            step_builder_map=self.step_builder_map,
+            registry_manager=self.mock_registry_manager,
+            dependency_resolver=self.mock_dependency_resolver
+        )
+        
+        with patch('src.cursus.core.assembler.pipeline_assembler.Pipeline'), \
+             patch.object(assembler, '_propagate_messages', wraps=assembler._propagate_messages) as mock_propagate:
+            assembler.generate_pipeline("test_pipeline")
+            assembler.generate_pipeline("test_pipeline")
+            self.assertEqual(mock_propagate.call_count, 1)
+            
+            # Mutating the DAG invalidates the cache
+            self.dag.add_edge('step1', 'step3')
+            assembler.generate_pipeline("test_pipeline")
+            self.assertEqual(mock_propagate.call_count, 2)
+            self.assertEqual(assembler._predecessors['step3'], ['step2', 'step1'])
+            
+            # Explicit invalidation forces recomputation
+            assembler.invalidate_cache()
+            assembler.generate_pipeline("test_pipeline")
+            self.assertEqual(mock_propagate.call_count, 3)
+
+    def test_pipeline_regeneration_revalidates_changed_dag(self):
+        """Test that regeneration re-runs input validation after the DAG or config map changes."""
+        assembler = PipelineAssembler(
+            dag=self.dag,
+            config_map=self.config_map,
+            step_builder_map=self.step_builder_map,
+            registry_manager=self.mock_registry_manager,
+            dependency_resolver=self.mock_dependency_resolver
+        )
+        
+        with patch('src.cursus.core.assembler.pipeline_assembler.Pipeline'):
+            assembler.generate_pipeline("test_pipeline")
+            
+            # A node without a config is rejected on the next generation
+            self.dag.add_node('step4')
+            with self.assertRaises(ValueError):
+                assembler.generate_pipeline("test_pipeline")
+            
+            # Replacing the config map is detected and drops builders built from the old configs
+            assembler.config_map = {**self.config_map, 'step4': self.config_map['step1']}
+            assembler.generate_pipeline("test_pipeline")
+            self.assertIn('step4', assembler._builder_classes)
+            self.assertEqual(set(assembler.step_builders), {'step1', 'step2', 'step3', 'step4'})
+            
+            # Replacing a single config entry in place rebuilds the builders as well
+            old_builder = assembler.step_builders['step2']
+            assembler.config_map['step2'] = MockConfig(author="other_author")
+            assembler.generate_pipeline("test_pipeline")
+            self.assertIsNot(assembler.step_builders['step2'], old_builder)
+            
+            # A cycle added after construction is rejected as well
+            self.dag.add_edge('step3', 'step1')
+            with self.assertRaisesRegex(ValueError, "cycle"):
+                assembler.generate_pipeline("test_pipeline")
+
     def test_logging_integration(self):
         """Test that logging is properly integrated."""
         with patch('src.cursus.core.assembler.pipeline_assembler.logger') as mock_logger:
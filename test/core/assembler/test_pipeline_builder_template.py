@@ -3,6 +3,9 @@ from unittest.mock import patch, MagicMock, ANY, call
 from pathlib import Path
 from collections import defaultdict
 import json
+from typing import List
+
+from pydantic import BaseModel
 
 # Add the project root to the Python path to allow for absolute imports
 import sys
@@ -19,8 +22,8 @@ sys.modules['src.cursus.core.deps.registry_manager'] = MagicMock()
 sys.modules['src.cursus.core.deps.semantic_matcher'] = MagicMock()
 sys.modules['src.cursus.core.deps.factory'] = MagicMock()
 
-from src.cursus.core.assembler.pipeline_template_base import PipelineTemplateBase
-from src.cursus.core.assembler.pipeline_assembler import PipelineAssembler
+from src.cursus.core.assembler.pipeline_template_base import PipelineTemplateBase, _clear_config_cache
+from src.cursus.core.assembler.pipeline_assembler import PipelineAssembler, _resolve_step_type
 from src.cursus.api.dag.base_dag import PipelineDAG
 
 # Create mock classes for testing
@@ -30,6 +33,10 @@ class MockBasePipelineConfig:
     def get_step_name(config_class_name):
         return config_class_name.replace('Config', 'Step')
 
+class _PydanticTestConfig(BaseModel):
+    """Minimal pydantic config for checking that loaded configs are copied."""
+    tags: List[str]
+
 class MockStepBuilderBase:
     """Mock StepBuilderBase for testing."""
     pass
@@ -224,6 +231,34 @@ class TestPipelineTemplateBase(unittest.TestCase):
         self.assertIn('TestConfig1', config_classes)
         self.assertIn('TestConfig2', config_classes)
 
+    def test_config_loading_is_memoized_per_file_version(self):
+        """Test that unchanged config files are parsed only once."""
+        _clear_config_cache()
+        self.addCleanup(_clear_config_cache)
+        
+        self.mock_load_configs.return_value = {
+            **self.mock_configs, 'Pydantic': _PydanticTestConfig(tags=['a'])
+        }
+        
+        with patch('src.cursus.core.assembler.pipeline_template_base.os.stat') as mock_stat:
+            mock_stat.return_value = MagicMock(st_mtime_ns=1, st_size=100)
+            first = ConcretePipelineTemplate(config_path='memoized_config.json')
+            second = ConcretePipelineTemplate(config_path='memoized_config.json')
+            
+            self.mock_load_configs.assert_called_once()
+            self.assertEqual(first.configs, second.configs)
+            self.assertIsNot(first.configs, second.configs)
+            
+            # Each template gets its own copies of the pydantic config objects
+            first.configs['Pydantic'].tags.append('b')
+            self.assertIsNot(first.configs['Pydantic'], second.configs['Pydantic'])
+            self.assertEqual(second.configs['Pydantic'].tags, ['a'])
+            
+            # A modified file is parsed again
+            mock_stat.return_value = MagicMock(st_mtime_ns=2, st_size=100)
+            ConcretePipelineTemplate(config_path='memoized_config.json')
+            self.assertEqual(self.mock_load_configs.call_count, 2)
+
     def test_base_config_validation(self):
         """Test that missing base config raises error."""
         # Mock load_configs to return configs without Base
@@ -477,6 +512,9 @@ class TestPipelineTemplateBase(unittest.TestCase):
 class TestPipelineAssembler(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures for PipelineAssembler tests."""
+        # Step types are cached per config class name; the registry is patched below
+        _resolve_step_type.cache_clear()
+        
         # Mock PipelineDAG
         self.mock_dag = MagicMock(spec=PipelineDAG)
         self.mock_dag.nodes = ['step1', 'step2', 'step3']
@@ -559,7 +597,9 @@ class TestPipelineAssembler(unittest.TestCase):
         self.assertEqual(assembler._registry_manager, self.mock_registry_manager)
         self.assertEqual(assembler._dependency_resolver, self.mock_dependency_resolver)
         
-        # Verify step builders were initialized
+        # Verify step builders are initialized on demand
+        self.assertEqual(len(assembler.step_builders), 0)
+        assembler._initialize_step_builders()
         self.assertEqual(len(assembler.step_builders), 3)
 
     def test_assembler_validation_missing_configs(self):
@@ -321,7 +321,18 @@ class TestModelHyperparameters(unittest.TestCase):
         
         # Check that private attribute is set
         self.assertEqual(hyperparam._input_tab_dim, 2)
-    
+
+    def test_get_full_field_set(self):
+        """Test that the full field set is cached and refreshed when full_field_list is reassigned."""
+        hyperparam = ModelHyperparameters(**self.valid_hyperparam_data)
+
+        field_set = hyperparam.get_full_field_set()
+        self.assertEqual(field_set, frozenset(self.valid_hyperparam_data["full_field_list"]))
+        self.assertIs(hyperparam.get_full_field_set(), field_set)
+
+        hyperparam.full_field_list = ["id", "feature1", "feature2", "category1", "label", "new_field"]
+        self.assertIn("new_field", hyperparam.get_full_field_set())
+
     def test_extra_fields_allowed(self):
         """Test that extra fields are allowed."""
         data_with_extra = self.valid_hyperparam_data.copy()
@@ -6,6 +6,7 @@ particularly focusing on the intelligent matching of DAG nodes to configurations
 using different resolution strategies.
 """
 
+import threading
 import unittest
 from unittest.mock import patch, MagicMock
 
@@ -157,6 +158,27 @@ class TestConfigResolver(unittest.TestCase):
         self.assertEqual(config_map["preprocessing"], self.preprocessing_config)
         self.assertEqual(config_map["training"], self.training_config)
         self.assertEqual(config_map["evaluation"], self.eval_config)
+        
+        # Verify the confidence scores of the resolution are kept for this thread
+        scores = resolver.get_last_resolution_scores()
+        self.assertEqual(set(scores), set(config_map))
+        self.assertEqual(scores["data_loading"], (1.0, "direct_name", 1))
+        self.assertEqual(scores["preprocessing"], (0.8, "job_type", 1))
+    
+    def test_resolution_state_is_thread_local(self):
+        """Test that a resolution in another thread does not reset this thread's metadata mapping."""
+        self.resolver._metadata_mapping = {"data_loading": "CradleDataLoadConfig"}
+        self.resolver._config_cache["data_loading"] = {"config_type": "CradleDataLoad"}
+        
+        def resolve_elsewhere():
+            self.resolver.resolve_config_map(["data_loading"], self.configs, metadata={"config_types": {}})
+        
+        thread = threading.Thread(target=resolve_elsewhere)
+        thread.start()
+        thread.join()
+        
+        self.assertEqual(self.resolver._metadata_mapping, {"data_loading": "CradleDataLoadConfig"})
+        self.assertIn("data_loading", self.resolver._config_cache)
     
     def test_resolve_single_node_direct_match(self):
         """Test that _resolve_single_node works with direct matching."""
@@ -5,6 +5,9 @@ This module tests the pipeline compilation process, particularly focusing on the
 conversion of PipelineDAG structures to SageMaker pipelines.
 """
 
+import os
+import tempfile
+import time
 import unittest
 from unittest.mock import patch, MagicMock, mock_open
 from pathlib import Path
@@ -37,15 +40,13 @@ class TestDagCompiler(unittest.TestCase):
         self.mock_session = MagicMock()
         self.mock_role = "arn:aws:iam::123456789012:role/SageMakerRole"
 
-    @patch('src.cursus.core.compiler.dag_compiler.Path')
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
     @patch('src.cursus.core.compiler.dynamic_template.DynamicPipelineTemplate')
     @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
-    def test_compile_with_custom_pipeline_name(self, mock_registry_class, mock_template_class, mock_path):
+    def test_compile_with_custom_pipeline_name(self, mock_registry_class, mock_template_class, mock_exists):
         """Test that custom pipeline names are used directly."""
         # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
+        mock_exists.return_value = True
         
         mock_registry = MagicMock()
         mock_registry_class.return_value = mock_registry
@@ -117,14 +118,12 @@ class TestCompileDagToPipeline(unittest.TestCase):
             )
         self.assertIn("Configuration file not found", str(context.exception))
 
-    @patch('src.cursus.core.compiler.dag_compiler.Path')
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
     @patch('src.cursus.core.compiler.dag_compiler.PipelineDAGCompiler')
-    def test_compile_dag_to_pipeline_success(self, mock_compiler_class, mock_path):
+    def test_compile_dag_to_pipeline_success(self, mock_compiler_class, mock_exists):
         """Test successful compile_dag_to_pipeline execution."""
         # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
+        mock_exists.return_value = True
         
         mock_compiler = MagicMock()
         mock_pipeline = MagicMock()
@@ -154,14 +153,12 @@ class TestCompileDagToPipeline(unittest.TestCase):
         # Verify result
         self.assertEqual(result, mock_pipeline)
 
-    @patch('src.cursus.core.compiler.dag_compiler.Path')
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
     @patch('src.cursus.core.compiler.dag_compiler.PipelineDAGCompiler')
-    def test_compile_dag_to_pipeline_exception_handling(self, mock_compiler_class, mock_path):
+    def test_compile_dag_to_pipeline_exception_handling(self, mock_compiler_class, mock_exists):
         """Test exception handling in compile_dag_to_pipeline."""
         # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
+        mock_exists.return_value = True
         
         mock_compiler = MagicMock()
         mock_compiler.compile.side_effect = Exception("Compilation failed")
@@ -188,16 +185,14 @@ class TestPipelineDAGCompilerInit(unittest.TestCase):
         self.mock_session = MagicMock()
         self.mock_role = "arn:aws:iam::123456789012:role/SageMakerRole"
 
-    @patch('src.cursus.core.compiler.dag_compiler.Path')
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
     @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
     @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
     @patch('src.cursus.core.compiler.dag_compiler.ValidationEngine')
-    def test_compiler_init_success(self, mock_validation_engine, mock_resolver, mock_registry, mock_path):
+    def test_compiler_init_success(self, mock_validation_engine, mock_resolver, mock_registry, mock_exists):
         """Test successful PipelineDAGCompiler initialization."""
         # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
+        mock_exists.return_value = True
         
         # Create compiler
         compiler = PipelineDAGCompiler(
@@ -225,13 +220,11 @@ class TestPipelineDAGCompilerInit(unittest.TestCase):
             )
         self.assertIn("Configuration file not found", str(context.exception))
 
-    @patch('src.cursus.core.compiler.dag_compiler.Path')
-    def test_compiler_init_with_custom_components(self, mock_path):
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
+    def test_compiler_init_with_custom_components(self, mock_exists):
         """Test PipelineDAGCompiler initialization with custom components."""
         # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
+        mock_exists.return_value = True
         
         custom_resolver = MagicMock()
         custom_registry = MagicMock()
@@ -260,16 +253,14 @@ class TestPipelineDAGCompilerValidation(unittest.TestCase):
         
         self.config_path = "test_config.json"
 
-    @patch('src.cursus.core.compiler.dag_compiler.Path')
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
     @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
     @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
     @patch('src.cursus.core.compiler.dag_compiler.ValidationEngine')
-    def test_validate_dag_compatibility_success(self, mock_validation_engine, mock_resolver, mock_registry, mock_path):
+    def test_validate_dag_compatibility_success(self, mock_validation_engine, mock_resolver, mock_registry, mock_exists):
         """Test successful DAG compatibility validation."""
         # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
+        mock_exists.return_value = True
         
         mock_validation_engine_instance = MagicMock()
         mock_validation_result = ValidationResult(
@@ -300,15 +291,13 @@ class TestPipelineDAGCompilerValidation(unittest.TestCase):
         self.assertIsInstance(result, ValidationResult)
         self.assertTrue(result.is_valid)
 
-    @patch('src.cursus.core.compiler.dag_compiler.Path')
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
     @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
     @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
-    def test_validate_dag_compatibility_config_resolution_failure(self, mock_resolver, mock_registry, mock_path):
+    def test_validate_dag_compatibility_config_resolution_failure(self, mock_resolver, mock_registry, mock_exists):
         """Test validation with config resolution failure."""
         # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
+        mock_exists.return_value = True
         
         # Create compiler
         compiler = PipelineDAGCompiler(config_path=self.config_path)
@@ -326,15 +315,51 @@ class TestPipelineDAGCompilerValidation(unittest.TestCase):
         self.assertFalse(result.is_valid)
         self.assertIn("Config resolution failed", str(result.config_errors))
 
-    @patch('src.cursus.core.compiler.dag_compiler.Path')
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
     @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
     @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
-    def test_preview_resolution_success(self, mock_resolver, mock_registry, mock_path):
+    def test_validate_dag_compatibility_cycle_skips_template(self, mock_resolver, mock_registry, mock_exists):
+        """Test that a cyclic DAG fails validation before any template is created."""
+        mock_exists.return_value = True
+        
+        compiler = PipelineDAGCompiler(config_path=self.config_path)
+        compiler.create_template = MagicMock()
+        
+        self.dag.add_edge("training", "data_loading")
+        result = compiler.validate_dag_compatibility(self.dag)
+        
+        self.assertFalse(result.is_valid)
+        self.assertEqual(
+            result.dependency_issues,
+            ["DAG contains a cycle: data_loading -> training -> data_loading"]
+        )
+        compiler.create_template.assert_not_called()
+
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
+    @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
+    @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
+    def test_detect_cycle(self, mock_resolver, mock_registry, mock_exists):
+        """Test structural cycle detection on acyclic and cyclic DAGs."""
+        mock_exists.return_value = True
+        
+        compiler = PipelineDAGCompiler(config_path=self.config_path)
+        
+        diamond = PipelineDAG(
+            nodes=["a", "b", "c", "d"],
+            edges=[("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")]
+        )
+        self.assertIsNone(compiler.detect_cycle(diamond))
+        
+        diamond.add_edge("d", "b")
+        self.assertEqual(compiler.detect_cycle(diamond), ["b", "d", "b"])
+
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
+    @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
+    @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
+    def test_preview_resolution_success(self, mock_resolver, mock_registry, mock_exists):
         """Test successful resolution preview."""
         # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
+        mock_exists.return_value = True
         
         mock_resolver_instance = MagicMock()
         mock_preview_data = {
@@ -379,15 +404,84 @@ class TestPipelineDAGCompilerValidation(unittest.TestCase):
         self.assertEqual(result.node_config_map["data_loading"], "CradleDataLoadConfig")
         self.assertEqual(result.resolution_confidence["data_loading"], 1.0)
 
-    @patch('src.cursus.core.compiler.dag_compiler.Path')
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
+    @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
+    @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
+    def test_preview_resolution_resolves_builder_once_per_config_type(self, mock_resolver, mock_registry, mock_exists):
+        """Test that nodes sharing a config type share one builder lookup."""
+        mock_exists.return_value = True
+        
+        mock_resolver_instance = MagicMock()
+        mock_resolver_instance.preview_resolution.return_value = {
+            "preprocess_a": [
+                {"config_type": "TabularPreprocessingConfig", "confidence": 0.9},
+                {"config_type": "XGBoostTrainingConfig", "confidence": 0.85}
+            ],
+            "preprocess_b": [{"config_type": "TabularPreprocessingConfig", "confidence": 0.7}],
+            "preprocess_c": [{"config_type": "TabularPreprocessingConfig", "confidence": 1.0}],
+            "orphan": []
+        }
+        mock_resolver.return_value = mock_resolver_instance
+        
+        mock_registry_instance = MagicMock()
+        mock_registry_instance._config_class_to_step_type.side_effect = lambda x: x.replace("Config", "")
+        mock_registry_instance.get_builder_for_step_type.return_value = MagicMock(__name__="MockBuilder")
+        mock_registry.return_value = mock_registry_instance
+        
+        compiler = PipelineDAGCompiler(config_path=self.config_path)
+        mock_template = MagicMock()
+        mock_template._resolution_preview = None
+        compiler.create_template = MagicMock(return_value=mock_template)
+        
+        result = compiler.preview_resolution(self.dag)
+        
+        mock_registry_instance._config_class_to_step_type.assert_called_once_with("TabularPreprocessingConfig")
+        self.assertEqual(result.config_builder_map, {"TabularPreprocessingConfig": "MockBuilder"})
+        self.assertEqual(result.node_config_map["orphan"], "UNRESOLVED")
+        self.assertEqual(result.ambiguous_resolutions, ["preprocess_a has 2 similar candidates"])
+        self.assertIn("Consider renaming 'preprocess_b' for better matching", result.recommendations)
+        self.assertIn("Add configuration for node 'orphan'", result.recommendations)
+
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
+    @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
+    @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
+    def test_preview_resolution_uses_precomputed_builder_names(self, mock_resolver, mock_registry, mock_exists):
+        """Test that registered config types skip per-call builder resolution."""
+        mock_exists.return_value = True
+        
+        mock_resolver_instance = MagicMock()
+        mock_resolver_instance.preview_resolution.return_value = {
+            "training": [{"config_type": "XGBoostTrainingConfig", "confidence": 1.0}],
+            "custom": [{"config_type": "CustomStepConfig", "confidence": 1.0}]
+        }
+        mock_resolver.return_value = mock_resolver_instance
+        
+        mock_registry_instance = MagicMock()
+        mock_registry_instance.config_to_builder_name = {"XGBoostTrainingConfig": "XGBoostTrainingStepBuilder"}
+        mock_registry_instance._config_class_to_step_type.side_effect = lambda x: x.replace("Config", "")
+        mock_registry_instance.get_builder_for_step_type.return_value = MagicMock(__name__="CustomStepBuilder")
+        mock_registry.return_value = mock_registry_instance
+        
+        compiler = PipelineDAGCompiler(config_path=self.config_path)
+        mock_template = MagicMock()
+        mock_template._resolution_preview = None
+        compiler.create_template = MagicMock(return_value=mock_template)
+        
+        result = compiler.preview_resolution(self.dag)
+        
+        self.assertEqual(result.config_builder_map, {
+            "XGBoostTrainingConfig": "XGBoostTrainingStepBuilder",
+            "CustomStepConfig": "CustomStepBuilder"
+        })
+        mock_registry_instance._config_class_to_step_type.assert_called_once_with("CustomStepConfig")
+
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
     @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
     @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
-    def test_preview_resolution_exception_handling(self, mock_resolver, mock_registry, mock_path):
+    def test_preview_resolution_exception_handling(self, mock_resolver, mock_registry, mock_exists):
         """Test preview resolution exception handling."""
         # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
+        mock_exists.return_value = True
         
         # Create compiler
         compiler = PipelineDAGCompiler(config_path=self.config_path)
@@ -416,15 +510,13 @@ class TestPipelineDAGCompilerCompilation(unittest.TestCase):
         
         self.config_path = "test_config.json"
 
-    @patch('src.cursus.core.compiler.dag_compiler.Path')
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
     @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
     @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
-    def test_compile_success(self, mock_resolver, mock_registry, mock_path):
+    def test_compile_success(self, mock_resolver, mock_registry, mock_exists):
         """Test successful compilation."""
         # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
+        mock_exists.return_value = True
         
         # Create compiler
         compiler = PipelineDAGCompiler(config_path=self.config_path)
@@ -449,15 +541,13 @@ class TestPipelineDAGCompilerCompilation(unittest.TestCase):
         self.assertEqual(result.name, "generated-pipeline-name")
         self.assertEqual(compiler._last_template, mock_template)
 
-    @patch('src.cursus.core.compiler.dag_compiler.Path')
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
     @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
     @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
-    def test_compile_with_custom_pipeline_name(self, mock_resolver, mock_registry, mock_path):
+    def test_compile_with_custom_pipeline_name(self, mock_resolver, mock_registry, mock_exists):
         """Test compilation with custom pipeline name."""
         # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
+        mock_exists.return_value = True
         
         # Create compiler
         compiler = PipelineDAGCompiler(config_path=self.config_path)
@@ -474,15 +564,13 @@ class TestPipelineDAGCompilerCompilation(unittest.TestCase):
         # Verify custom name is used
         self.assertEqual(result.name, "custom-pipeline-name")
 
-    @patch('src.cursus.core.compiler.dag_compiler.Path')
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
     @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
     @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
-    def test_compile_exception_handling(self, mock_resolver, mock_registry, mock_path):
+    def test_compile_exception_handling(self, mock_resolver, mock_registry, mock_exists):
         """Test compilation exception handling."""
         # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
+        mock_exists.return_value = True
         
         # Create compiler
         compiler = PipelineDAGCompiler(config_path=self.config_path)
@@ -496,15 +584,32 @@ class TestPipelineDAGCompilerCompilation(unittest.TestCase):
         
         self.assertIn("DAG compilation failed", str(context.exception))
 
-    @patch('src.cursus.core.compiler.dag_compiler.Path')
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
     @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
     @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
-    def test_compile_with_report(self, mock_resolver, mock_registry, mock_path):
+    def test_compile_does_not_rewrap_pipeline_api_error(self, mock_resolver, mock_registry, mock_exists):
+        """Test that a PipelineAPIError from a nested call is re-raised unchanged."""
+        mock_exists.return_value = True
+        
+        compiler = PipelineDAGCompiler(config_path=self.config_path)
+        original = PipelineAPIError("Template creation failed: boom")
+        compiler.create_template = MagicMock(side_effect=original)
+        
+        with self.assertRaises(PipelineAPIError) as context:
+            compiler.compile(self.dag)
+        self.assertIs(context.exception, original)
+        
+        with self.assertRaises(PipelineAPIError) as context:
+            compiler.compile_with_report(self.dag)
+        self.assertIs(context.exception, original)
+
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
+    @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
+    @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
+    def test_compile_with_report(self, mock_resolver, mock_registry, mock_exists):
         """Test compilation with detailed report."""
         # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
+        mock_exists.return_value = True
         
         # Create compiler
         compiler = PipelineDAGCompiler(config_path=self.config_path)
@@ -538,6 +643,287 @@ class TestPipelineDAGCompilerCompilation(unittest.TestCase):
         self.assertIn("data_loading", report.resolution_details)
         self.assertIn("training", report.resolution_details)
 
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
+    @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
+    @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
+    def test_compile_with_report_reuses_compiled_template(self, mock_resolver, mock_registry, mock_exists):
+        """Test that the report is built from the template used during compile."""
+        mock_exists.return_value = True
+        
+        mock_resolver_instance = MagicMock()
+        mock_resolver_instance.preview_resolution.return_value = {
+            "data_loading": [{"config_type": "CradleDataLoadConfig", "confidence": 1.0}],
+            "training": [{"config_type": "XGBoostTrainingConfig", "confidence": 0.9}]
+        }
+        mock_resolver.return_value = mock_resolver_instance
+        
+        compiler = PipelineDAGCompiler(config_path=self.config_path)
+        
+        mock_template = MagicMock()
+        mock_template._resolution_preview = None
+        mock_pipeline = MagicMock()
+        mock_template.generate_pipeline.return_value = mock_pipeline
+        compiler.create_template = MagicMock(return_value=mock_template)
+        compiler.preview_resolution = MagicMock()
+        
+        pipeline, report = compiler.compile_with_report(self.dag, pipeline_name="report-pipeline")
+        
+        # Only the compile template was created and the standalone preview was skipped
+        compiler.create_template.assert_called_once()
+        compiler.preview_resolution.assert_not_called()
+        self.assertEqual(report.resolution_details["training"]["config_type"], "XGBoostTrainingConfig")
+        self.assertIsInstance(mock_template._resolution_preview, ResolutionPreview)
+
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
+    @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
+    @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
+    def test_compile_prevalidated(self, mock_resolver, mock_registry, mock_exists):
+        """Test the prevalidated fast path skips validation and error wrapping."""
+        mock_exists.return_value = True
+        
+        compiler = PipelineDAGCompiler(config_path=self.config_path)
+        mock_template = MagicMock()
+        mock_pipeline = MagicMock()
+        mock_template.generate_pipeline.return_value = mock_pipeline
+        compiler._get_or_create_template = MagicMock(return_value=mock_template)
+        compiler.validate_dag_compatibility = MagicMock()
+        
+        result = compiler.compile_prevalidated(self.dag, pipeline_name="fast-pipeline")
+        
+        self.assertIs(result, mock_pipeline)
+        self.assertEqual(mock_pipeline.name, "fast-pipeline")
+        self.assertIs(compiler.get_last_template(), mock_template)
+        self.assertTrue(compiler._get_or_create_template.call_args.kwargs['skip_validation'])
+        compiler.validate_dag_compatibility.assert_not_called()
+        
+        # Errors are not wrapped in PipelineAPIError
+        mock_template.generate_pipeline.side_effect = ValueError("boom")
+        with self.assertRaises(ValueError):
+            compiler.compile_prevalidated(self.dag)
+
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
+    @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
+    @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
+    def test_compile_many_preserves_order(self, mock_resolver, mock_registry, mock_exists):
+        """Test that compile_many compiles every DAG and keeps the input order."""
+        mock_exists.return_value = True
+        
+        compiler = PipelineDAGCompiler(config_path=self.config_path)
+        
+        other_dag = PipelineDAG()
+        other_dag.add_node("training")
+        
+        mock_template = MagicMock()
+        mock_template.generate_pipeline.side_effect = lambda: MagicMock()
+        compiler.create_template = MagicMock(return_value=mock_template)
+        
+        pipelines = compiler.compile_many(
+            [(self.dag, "first-pipeline"), (other_dag, "second-pipeline")],
+            max_workers=2
+        )
+        
+        self.assertEqual([p.name for p in pipelines], ["first-pipeline", "second-pipeline"])
+        self.assertEqual(compiler.create_template.call_count, 2)
+        self.assertEqual(compiler.compile_many([]), [])
+
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
+    @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
+    @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
+    def test_compile_many_serializes_shared_template(self, mock_resolver, mock_registry, mock_exists):
+        """Test that a DAG listed twice never generates on its shared template concurrently."""
+        mock_exists.return_value = True
+        
+        compiler = PipelineDAGCompiler(config_path=self.config_path)
+        
+        active = []
+        overlaps = []
+        
+        def generate():
+            active.append(1)
+            overlaps.append(len(active))
+            time.sleep(0.05)
+            active.pop()
+            return MagicMock()
+        
+        mock_template = MagicMock()
+        mock_template.generate_pipeline.side_effect = generate
+        compiler._get_or_create_template = MagicMock(return_value=mock_template)
+        
+        pipelines = compiler.compile_many(
+            [(self.dag, "first-pipeline"), (self.dag, "second-pipeline")],
+            max_workers=2
+        )
+        
+        self.assertEqual([p.name for p in pipelines], ["first-pipeline", "second-pipeline"])
+        self.assertEqual(overlaps, [1, 1])
+
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
+    @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
+    @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
+    def test_compile_with_report_uses_own_template(self, mock_resolver, mock_registry, mock_exists):
+        """Test that the report describes this call's template even if another compile finished later."""
+        mock_exists.return_value = True
+        
+        compiler = PipelineDAGCompiler(config_path=self.config_path)
+        other_template = MagicMock()
+        other_template.get_resolution_details.return_value = {
+            "data_loading": {"config_type": "OtherConfig", "confidence": 0.1},
+            "training": {"config_type": "OtherConfig", "confidence": 0.1}
+        }
+        
+        compile_own = compiler.compile
+        
+        def compile_then_other(*args, **kwargs):
+            pipeline = compile_own(*args, **kwargs)
+            # Simulate a concurrent compile() of another DAG finishing just after
+            compiler._last_template = other_template
+            return pipeline
+        
+        compiler.compile = compile_then_other
+        
+        mock_template = MagicMock()
+        mock_template.generate_pipeline.return_value = MagicMock()
+        mock_template.get_resolution_details.return_value = {
+            "data_loading": {"config_type": "CradleDataLoadConfig", "confidence": 1.0},
+            "training": {"config_type": "XGBoostTrainingConfig", "confidence": 1.0}
+        }
+        compiler._get_or_create_template = MagicMock(return_value=mock_template)
+        
+        _, report = compiler.compile_with_report(self.dag, pipeline_name="report-pipeline")
+        
+        self.assertEqual(report.resolution_details["training"]["config_type"], "XGBoostTrainingConfig")
+        other_template.get_resolution_details.assert_not_called()
+
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
+    @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
+    @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
+    def test_compile_with_report_uses_template_resolution_details(self, mock_resolver, mock_registry, mock_exists):
+        """Test that the report uses the template's resolved details and skips any preview."""
+        mock_exists.return_value = True
+        
+        mock_resolver_instance = MagicMock()
+        mock_resolver.return_value = mock_resolver_instance
+        
+        compiler = PipelineDAGCompiler(config_path=self.config_path)
+        
+        mock_template = MagicMock()
+        mock_template.generate_pipeline.return_value = MagicMock()
+        mock_template.get_resolution_details.return_value = {
+            "data_loading": {"config_type": "CradleDataLoadConfig", "builder_type": "CradleDataLoadingStepBuilder", "confidence": 1.0},
+            "training": {"config_type": "XGBoostTrainingConfig", "builder_type": "XGBoostTrainingStepBuilder",
+                         "confidence": 0.5, "similar_candidates": 2}
+        }
+        compiler.create_template = MagicMock(return_value=mock_template)
+        compiler.preview_resolution = MagicMock()
+        
+        pipeline, report = compiler.compile_with_report(self.dag, pipeline_name="report-pipeline")
+        
+        compiler.preview_resolution.assert_not_called()
+        mock_resolver_instance.preview_resolution.assert_not_called()
+        self.assertEqual(report.resolution_details["training"]["builder_type"], "XGBoostTrainingStepBuilder")
+        self.assertAlmostEqual(report.avg_confidence, 0.75)
+        self.assertEqual(report.warnings, [
+            "Low confidence resolution for node 'training': 0.50",
+            "training has 2 similar candidates"
+        ])
+
+
+class TestPipelineDAGCompilerTemplateCache(unittest.TestCase):
+    """Tests for PipelineDAGCompiler template caching."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.dag = PipelineDAG()
+        self.dag.add_node("data_loading")
+        self.dag.add_node("training")
+        self.dag.add_edge("data_loading", "training")
+        
+        config_file = tempfile.NamedTemporaryFile(suffix=".json", delete=False)
+        config_file.write(b"{}")
+        config_file.close()
+        self.config_path = config_file.name
+        self.addCleanup(os.remove, self.config_path)
+
+    @patch('src.cursus.core.compiler.dynamic_template.DynamicPipelineTemplate')
+    @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
+    @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
+    def test_compile_reuses_cached_template(self, mock_resolver, mock_registry, mock_template_class):
+        """Test that repeated compiles of the same DAG reuse one template."""
+        compiler = PipelineDAGCompiler(config_path=self.config_path)
+        
+        compiler.compile(self.dag, pipeline_name="first")
+        compiler.compile(self.dag, pipeline_name="second")
+        
+        mock_template_class.assert_called_once()
+        
+        # Different template kwargs produce a separate template
+        compiler.compile(self.dag, pipeline_name="third", extra_option=True)
+        self.assertEqual(mock_template_class.call_count, 2)
+
+    @patch('src.cursus.core.compiler.dynamic_template.DynamicPipelineTemplate')
+    @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
+    @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
+    def test_create_template_is_not_cached(self, mock_resolver, mock_registry, mock_template_class):
+        """Test that create_template hands out new templates and leaves the compile cache alone."""
+        mock_template_class.side_effect = lambda **kwargs: MagicMock()
+        compiler = PipelineDAGCompiler(config_path=self.config_path)
+        
+        first = compiler.create_template(self.dag, skip_validation=True)
+        second = compiler.create_template(self.dag, skip_validation=True)
+        
+        self.assertIsNot(first, second)
+        self.assertEqual(compiler._template_cache, {})
+        
+        compiler.compile(self.dag, pipeline_name="compiled")
+        self.assertNotIn(compiler.get_last_template(), (first, second))
+
+    @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
+    @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
+    def test_validate_config_file_cached_until_file_changes(self, mock_resolver, mock_registry):
+        """Test that validate_config_file reuses its result for an unchanged file."""
+        compiler = PipelineDAGCompiler(config_path=self.config_path)
+        mock_template = MagicMock()
+        mock_template.configs = {"Base": MagicMock()}
+        compiler.create_template = MagicMock(return_value=mock_template)
+        
+        first = compiler.validate_config_file()
+        first['config_names'].append("mutated")
+        second = compiler.validate_config_file()
+        
+        compiler.create_template.assert_called_once()
+        self.assertEqual(second['config_names'], ["Base"])
+        
+        stat = os.stat(self.config_path)
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        compiler.validate_config_file()
+        self.assertEqual(compiler.create_template.call_count, 2)
+
+    @patch('src.cursus.core.compiler.dynamic_template.DynamicPipelineTemplate')
+    @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
+    @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
+    def test_template_cache_invalidated_by_changes(self, mock_resolver, mock_registry, mock_template_class):
+        """Test that DAG edits, config file edits and clearing rebuild the template."""
+        compiler = PipelineDAGCompiler(config_path=self.config_path)
+        compiler.compile(self.dag)
+        
+        self.dag.add_node("evaluation")
+        compiler.compile(self.dag)
+        self.assertEqual(mock_template_class.call_count, 2)
+        
+        # An edit that keeps the node and edge counts is detected too
+        self.dag.edges[0] = ("data_loading", "evaluation")
+        compiler.compile(self.dag)
+        self.assertEqual(mock_template_class.call_count, 3)
+        
+        stat = os.stat(self.config_path)
+        os.utime(self.config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        compiler.compile(self.dag)
+        self.assertEqual(mock_template_class.call_count, 4)
+        
+        compiler.clear_template_cache()
+        compiler.compile(self.dag)
+        self.assertEqual(mock_template_class.call_count, 5)
+
 
 class TestPipelineDAGCompilerUtilityMethods(unittest.TestCase):
     """Tests for PipelineDAGCompiler utility methods."""
@@ -546,15 +932,13 @@ class TestPipelineDAGCompilerUtilityMethods(unittest.TestCase):
         """Set up test fixtures."""
         self.config_path = "test_config.json"
 
-    @patch('src.cursus.core.compiler.dag_compiler.Path')
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
     @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
     @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
-    def test_get_supported_step_types(self, mock_resolver, mock_registry, mock_path):
+    def test_get_supported_step_types(self, mock_resolver, mock_registry, mock_exists):
         """Test get_supported_step_types method."""
         # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
+        mock_exists.return_value = True
         
         mock_registry_instance = MagicMock()
         mock_registry_instance.list_supported_step_types.return_value = ["DataLoading", "Training", "Evaluation"]
@@ -569,15 +953,36 @@ class TestPipelineDAGCompilerUtilityMethods(unittest.TestCase):
         # Verify result
         self.assertEqual(result, ["DataLoading", "Training", "Evaluation"])
 
-    @patch('src.cursus.core.compiler.dag_compiler.Path')
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
     @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
     @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
-    def test_validate_config_file_success(self, mock_resolver, mock_registry, mock_path):
+    def test_get_supported_step_types_cached_until_registry_changes(self, mock_resolver, mock_registry, mock_exists):
+        """Test that supported step types are recomputed only when the registry version changes."""
+        mock_exists.return_value = True
+        
+        mock_registry_instance = MagicMock()
+        mock_registry_instance._version = 1
+        mock_registry_instance.list_supported_step_types.return_value = ["Training"]
+        mock_registry.return_value = mock_registry_instance
+        
+        compiler = PipelineDAGCompiler(config_path=self.config_path)
+        
+        self.assertEqual(compiler.get_supported_step_types(), ["Training"])
+        self.assertEqual(compiler.get_supported_step_types(), ["Training"])
+        mock_registry_instance.list_supported_step_types.assert_called_once()
+        
+        mock_registry_instance._version = 2
+        mock_registry_instance.list_supported_step_types.return_value = ["Training", "Package"]
+        self.assertEqual(compiler.get_supported_step_types(), ["Training", "Package"])
+        self.assertEqual(mock_registry_instance.list_supported_step_types.call_count, 2)
+
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
+    @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
+    @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
+    def test_validate_config_file_success(self, mock_resolver, mock_registry, mock_exists):
         """Test successful config file validation."""
         # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
+        mock_exists.return_value = True
         
         # Create compiler
         compiler = PipelineDAGCompiler(config_path=self.config_path)
@@ -598,15 +1003,31 @@ class TestPipelineDAGCompilerUtilityMethods(unittest.TestCase):
         self.assertEqual(result['config_count'], 2)
         self.assertEqual(result['config_names'], ["config1", "config2"])
 
-    @patch('src.cursus.core.compiler.dag_compiler.Path')
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
+    @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
+    @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
+    def test_validate_config_file_reuses_probe_dag(self, mock_resolver, mock_registry, mock_exists):
+        """Test that config file validation shares one probe DAG across calls."""
+        mock_exists.return_value = True
+        
+        probe_dags = []
+        for _ in range(2):
+            compiler = PipelineDAGCompiler(config_path=self.config_path)
+            compiler.create_template = MagicMock(return_value=MagicMock(configs={}))
+            compiler.validate_config_file()
+            probe_dags.append(compiler.create_template.call_args.kwargs['dag'])
+        
+        self.assertIs(probe_dags[0], probe_dags[1])
+        self.assertIs(probe_dags[0], PipelineDAGCompiler._PROBE_DAG)
+        self.assertEqual(probe_dags[0].nodes, ["test_node"])
+
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
     @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
     @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
-    def test_validate_config_file_failure(self, mock_resolver, mock_registry, mock_path):
+    def test_validate_config_file_failure(self, mock_resolver, mock_registry, mock_exists):
         """Test config file validation failure."""
         # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
+        mock_exists.return_value = True
         
         # Create compiler
         compiler = PipelineDAGCompiler(config_path=self.config_path)
@@ -622,15 +1043,13 @@ class TestPipelineDAGCompilerUtilityMethods(unittest.TestCase):
         self.assertIn("Config loading failed", result['error'])
         self.assertEqual(result['config_count'], 0)
 
-    @patch('src.cursus.core.compiler.dag_compiler.Path')
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
     @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
     @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
-    def test_get_last_template(self, mock_resolver, mock_registry, mock_path):
+    def test_get_last_template(self, mock_resolver, mock_registry, mock_exists):
         """Test get_last_template method."""
         # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
+        mock_exists.return_value = True
         
         # Create compiler
         compiler = PipelineDAGCompiler(config_path=self.config_path)
@@ -645,15 +1064,13 @@ class TestPipelineDAGCompilerUtilityMethods(unittest.TestCase):
         # Should return the template
         self.assertEqual(compiler.get_last_template(), mock_template)
 
-    @patch('src.cursus.core.compiler.dag_compiler.Path')
+    @patch('src.cursus.core.compiler.dag_compiler.os.path.exists')
     @patch('src.cursus.core.compiler.dag_compiler.StepBuilderRegistry')
     @patch('src.cursus.core.compiler.dag_compiler.StepConfigResolver')
-    def test_compile_and_fill_execution_doc(self, mock_resolver, mock_registry, mock_path):
+    def test_compile_and_fill_execution_doc(self, mock_resolver, mock_registry, mock_exists):
         """Test compile_and_fill_execution_doc method."""
         # Setup mocks
-        mock_path_instance = MagicMock()
-        mock_path_instance.exists.return_value = True
-        mock_path.return_value = mock_path_instance
+        mock_exists.return_value = True
         
         # Create compiler
         compiler = PipelineDAGCompiler(config_path=self.config_path)
@@ -10,6 +10,8 @@ import unittest
 import os
 import json
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch, MagicMock, mock_open
 
 from src.cursus.api.dag.base_dag import PipelineDAG
@@ -229,6 +231,111 @@ class TestDynamicPipelineTemplate(unittest.TestCase):
         self.assertEqual(config_map_again, expected_config_map)
         self.mock_config_resolver.resolve_config_map.assert_not_called()
 
+    @patch.object(PipelineTemplateBase, '_load_configs')
+    @patch('src.cursus.steps.configs.utils.detect_config_classes_from_json')
+    def test_create_config_map_concurrent_calls_resolve_once(self, mock_detect_classes, mock_template_load_configs):
+        """Test that concurrent _create_config_map calls share a single resolution."""
+        mock_detect_classes.return_value = {"BasePipelineConfig": BasePipelineConfig}
+        mock_template_load_configs.return_value = {"Base": MagicMock(spec=BasePipelineConfig)}
+        
+        expected_config_map = {"data_loading": MagicMock(spec=BasePipelineConfig)}
+        
+        def slow_resolve(**kwargs):
+            time.sleep(0.05)
+            return expected_config_map
+        
+        self.mock_config_resolver.resolve_config_map.side_effect = slow_resolve
+        
+        template = DynamicPipelineTemplate(
+            dag=self.dag,
+            config_path=self.config_path,
+            config_resolver=self.mock_config_resolver,
+            builder_registry=self.mock_builder_registry,
+            skip_validation=True
+        )
+        
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(template._create_config_map) for _ in range(2)]
+        
+        for future in futures:
+            self.assertIs(future.result(), expected_config_map)
+        self.mock_config_resolver.resolve_config_map.assert_called_once()
+
+    @patch.object(PipelineTemplateBase, '_load_configs')
+    @patch('src.cursus.steps.configs.utils.detect_config_classes_from_json')
+    def test_get_resolution_details(self, mock_detect_classes, mock_template_load_configs):
+        """Test that resolution details come from the resolved maps without re-resolving."""
+        mock_detect_classes.return_value = {"BasePipelineConfig": BasePipelineConfig}
+        
+        base_config = MagicMock(spec=BasePipelineConfig)
+        data_config = MagicMock(spec=BasePipelineConfig)
+        training_config = MagicMock(spec=BasePipelineConfig)
+        mock_template_load_configs.return_value = {
+            "Base": base_config,
+            "data_loading": data_config,
+            "training": training_config
+        }
+        
+        self.mock_config_resolver.resolve_config_map.return_value = {
+            "data_loading": data_config,
+            "training": training_config
+        }
+        self.mock_config_resolver.get_last_resolution_scores.return_value = {
+            "data_loading": (1.0, "direct_name", 1),
+            "training": (0.75, "semantic", 2)
+        }
+        self.mock_builder_registry.get_builder_for_config.return_value = MagicMock(__name__="MockStepBuilder")
+        
+        template = DynamicPipelineTemplate(
+            dag=self.dag,
+            config_path=self.config_path,
+            config_resolver=self.mock_config_resolver,
+            builder_registry=self.mock_builder_registry,
+            skip_validation=True
+        )
+        
+        details = template.get_resolution_details()
+        
+        self.assertEqual(details["training"], {
+            "config_type": type(training_config).__name__,
+            "builder_type": "MockStepBuilder",
+            "confidence": 0.75,
+            "similar_candidates": 2
+        })
+        self.assertEqual(details["data_loading"]["confidence"], 1.0)
+        self.mock_config_resolver.resolve_config_map.assert_called_once()
+        self.mock_config_resolver.preview_resolution.assert_not_called()
+
+    @patch.object(PipelineTemplateBase, '_load_configs')
+    @patch('src.cursus.steps.configs.utils.detect_config_classes_from_json')
+    def test_custom_resolver_without_scores(self, mock_detect_classes, mock_template_load_configs):
+        """Test that a resolver with only resolve_config_map still works, without scores."""
+        mock_detect_classes.return_value = {"BasePipelineConfig": BasePipelineConfig}
+
+        base_config = MagicMock(spec=BasePipelineConfig)
+        data_config = MagicMock(spec=BasePipelineConfig)
+        mock_template_load_configs.return_value = {"Base": base_config, "data_loading": data_config}
+
+        class CustomResolver:
+            def resolve_config_map(self, dag_nodes, available_configs, metadata=None):
+                return {"data_loading": available_configs["data_loading"]}
+
+        self.mock_builder_registry.get_builder_for_config.return_value = MagicMock(__name__="MockStepBuilder")
+
+        template = DynamicPipelineTemplate(
+            dag=self.dag,
+            config_path=self.config_path,
+            config_resolver=CustomResolver(),
+            builder_registry=self.mock_builder_registry,
+            skip_validation=True
+        )
+
+        details = template.get_resolution_details()
+
+        self.assertEqual(details["data_loading"]["config_type"], type(data_config).__name__)
+        self.assertIsNone(details["data_loading"]["confidence"])
+        self.assertIsNone(details["data_loading"]["similar_candidates"])
+
     @patch.object(PipelineTemplateBase, '_get_base_config')
     @patch('src.cursus.steps.configs.utils.detect_config_classes_from_json')
     @patch('src.cursus.steps.configs.utils.load_configs')
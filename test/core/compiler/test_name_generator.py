@@ -82,5 +82,15 @@ class TestNameGenerator(unittest.TestCase):
         self.assertTrue(validate_pipeline_name(name))
         self.assertNotIn("@", name)  # Special chars should be removed
 
+    def test_generate_pipeline_name_memoized(self):
+        """Test that repeated calls for the same inputs return the cached name."""
+        generate_pipeline_name.cache_clear()
+        first = generate_pipeline_name("cached", "2.0")
+        second = generate_pipeline_name("cached", "2.0")
+        
+        self.assertEqual(first, "cached-2-0-pipeline")
+        self.assertIs(first, second)
+        self.assertEqual(generate_pipeline_name.cache_info().hits, 1)
+
 if __name__ == '__main__':
     unittest.main()
@@ -36,6 +36,21 @@ class TestValidationResult(unittest.TestCase):
         self.assertIn("✅ Validation passed", summary)
         self.assertIn("with 1 warnings", summary)
 
+    def test_validation_result_uses_slots(self):
+        """Test that ValidationResult stores fields in slots without an instance dict."""
+        result = ValidationResult(
+            is_valid=True,
+            missing_configs=[],
+            unresolvable_builders=[],
+            config_errors={},
+            dependency_issues=[],
+            warnings=[]
+        )
+        
+        self.assertFalse(hasattr(result, '__dict__'))
+        with self.assertRaises(AttributeError):
+            result.unexpected_field = True
+
     def test_validation_result_invalid(self):
         """Test ValidationResult for an invalid configuration."""
         result = ValidationResult(
@@ -159,6 +159,20 @@ class TestPropertyReference(unittest.TestCase):
         # Check that we're extracting Value
         self.assertTrue("Value" in parts or any(p[0] == "Value" if isinstance(p, tuple) else False for p in parts))
     
+    def test_parse_property_path_is_cached_but_returns_fresh_lists(self):
+        """Test that repeated parses reuse the cached result without sharing the returned list."""
+        prop_ref = PropertyReference(
+            step_name="test_step",
+            output_spec=self.processing_output_spec
+        )
+        path = "properties.ProcessingOutputConfig.Outputs['cached_output'].S3Output.S3Uri"
+        
+        first = prop_ref._parse_property_path(path)
+        first.append("mutated")
+        second = prop_ref._parse_property_path(path)
+        
+        self.assertEqual(second, ["ProcessingOutputConfig", ("Outputs", "cached_output"), "S3Output", "S3Uri"])
+    
     def test_to_sagemaker_property(self):
         """Test conversion to SageMaker property format."""
         # Test training output
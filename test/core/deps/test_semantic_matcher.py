@@ -1,9 +1,11 @@
 import unittest
+from unittest.mock import Mock
 from src.cursus.core.deps import (
     SemanticMatcher, OutputSpec, DependencyType,
     UnifiedDependencyResolver, SpecificationRegistry,
     StepSpecification, DependencySpec, NodeType
 )
+from src.cursus.core.deps.semantic_matcher import keyword_match_fraction
 
 class TestSemanticMatcher(unittest.TestCase):
     def test_calculate_similarity_with_aliases(self):
@@ -353,5 +355,19 @@ class TestSemanticMatcher(unittest.TestCase):
                 f"Low similarity synonyms '{word1}' and '{word2}' should have some similarity"
             )
 
+    @unittest.skipIf(isinstance(keyword_match_fraction, Mock),
+                     "semantic_matcher was replaced by another test module's sys.modules mocks")
+    def test_keyword_match_fraction(self):
+        """Test the cached keyword match fraction used for compatibility scoring."""
+        keywords = ("config", "params", "hyperparams", "model")
+        
+        self.assertEqual(keyword_match_fraction(keywords, "Hyperparams_S3_Uri"), 0.5)
+        self.assertEqual(keyword_match_fraction(keywords, "processed_data"), 0.0)
+        self.assertEqual(keyword_match_fraction((), "processed_data"), 0.0)
+        
+        hits = keyword_match_fraction.cache_info().hits
+        keyword_match_fraction(keywords, "Hyperparams_S3_Uri")
+        self.assertEqual(keyword_match_fraction.cache_info().hits, hits + 1)
+
 if __name__ == '__main__':
     unittest.main()
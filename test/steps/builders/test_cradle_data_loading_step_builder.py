@@ -0,0 +1,290 @@
+"""
+Unit tests for the CradleDataLoadingStepBuilder.
+
+Covers configuration validation, request building and its caches, output
+location lookup and step creation.
+
+The Cradle SDK and request models are not needed: the builder resolves them
+through _lazy_import, which these tests replace with simple model factories.
+"""
+
+import gc
+import unittest
+import weakref
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock, Mock, patch
+
+from src.cursus.steps.builders import builder_cradle_data_loading_step as cradle_module
+from src.cursus.steps.builders.builder_cradle_data_loading_step import CradleDataLoadingStepBuilder
+
+
+def _fake_lazy_import(name):
+    """Return a stand-in for a lazily imported Cradle model or coral_utils."""
+    if name == "coral_utils":
+        return SimpleNamespace(convert_coral_to_dict=lambda request: {
+            "dataSources": {
+                "startDate": request.data_sources.start_date,
+                "dataSources": [ds.data_source_name for ds in request.data_sources.data_sources],
+            }
+        })
+    return lambda **kwargs: SimpleNamespace(model=name, **kwargs)
+
+
+def _make_config(start_date="2025-01-01T00:00:00", end_date="2025-01-02T00:00:00"):
+    """Build a minimal config object with the sections _build_request reads."""
+    mds_source = SimpleNamespace(
+        data_source_name="RAW_MDS",
+        data_source_type="MDS",
+        mds_data_source_properties=SimpleNamespace(
+            service_name="service",
+            org_id=0,
+            region="NA",
+            output_schema=[{"field_name": "objectId", "field_type": "STRING"}],
+            use_hourly_edx_data_set=False,
+        ),
+    )
+    return SimpleNamespace(
+        job_type="training",
+        data_sources_spec=SimpleNamespace(start_date=start_date, end_date=end_date, data_sources=[mds_source]),
+        transform_spec=SimpleNamespace(
+            transform_sql="SELECT * FROM RAW_MDS",
+            job_split_options=SimpleNamespace(split_job=False, days_per_split=7, merge_sql=None),
+        ),
+        output_spec=SimpleNamespace(
+            output_schema=["objectId"],
+            output_path="s3://bucket/output",
+            output_format="PARQUET",
+            output_save_mode="ERRORIFEXISTS",
+            output_file_count=0,
+            keep_dot_in_output_schema=False,
+            include_header_in_s3_output=True,
+        ),
+        cradle_job_spec=SimpleNamespace(
+            cluster_type="STANDARD",
+            cradle_account="Buyer-Abuse-RnD-Dev",
+            extra_spark_job_arguments=None,
+            job_retry_count=1,
+        ),
+    )
+
+
+def _make_builder(config):
+    """Create a builder around a config without running StepBuilderBase.__init__."""
+    builder = CradleDataLoadingStepBuilder.__new__(CradleDataLoadingStepBuilder)
+    builder.config = config
+    builder.spec = None
+    builder.contract = None
+    builder.role = "arn:aws:iam::000000000000:role/test"
+    builder.session = None
+    builder._data_source_models = None
+    builder._cached_request = None
+    builder._cached_request_dict = None
+    builder._outputs_cache = weakref.WeakKeyDictionary()
+    return builder
+
+
+class _FakeCradleStep:
+    """Stand-in for CradleDataLoadingStep that counts output location lookups."""
+
+    def __init__(self, step_name=None, role=None, sagemaker_session=None):
+        self.name = step_name
+        self.depends_on = []
+        self.lookups = 0
+
+    def add_depends_on(self, steps):
+        self.depends_on.extend(steps)
+
+    def get_output_locations(self, output_type=None):
+        self.lookups += 1
+        locations = {"DATA": "s3://bucket/data", "METADATA": "s3://bucket/metadata", "SIGNATURE": "s3://bucket/signature"}
+        return locations[output_type] if output_type else locations
+
+
+class TestParseCradleDatetime(unittest.TestCase):
+    """Tests for the Cradle start/end date parser."""
+
+    def test_valid_date(self):
+        """Test that an exact YYYY-mm-DDTHH:MM:SS value is parsed."""
+        self.assertEqual(
+            cradle_module._parse_cradle_datetime("start_date", "2025-01-31T23:59:59"),
+            datetime(2025, 1, 31, 23, 59, 59),
+        )
+
+    def test_invalid_dates(self):
+        """Test that loose shapes, impossible dates and non-strings are rejected."""
+        for value in ("2025-1-1T0:0:0", "2025-01-01 00:00:00", "2025-01-01T00:00:00Z",
+                      "2025-02-30T00:00:00", None):
+            with self.subTest(value=value):
+                with self.assertRaisesRegex(ValueError, "start_date"):
+                    cradle_module._parse_cradle_datetime("start_date", value)
+
+
+class TestCradleDataLoadingValidation(unittest.TestCase):
+    """Tests for validate_configuration."""
+
+    def test_valid_configuration(self):
+        """Test that a complete config passes validation."""
+        _make_builder(_make_config()).validate_configuration()
+
+    def test_start_date_must_precede_end_date(self):
+        """Test that the parsed dates are compared."""
+        builder = _make_builder(_make_config(start_date="2025-01-02T00:00:00", end_date="2025-01-01T00:00:00"))
+        with self.assertRaisesRegex(ValueError, "strictly before"):
+            builder.validate_configuration()
+
+    def test_in_place_change_is_revalidated(self):
+        """Test that a config changed after passing validation is checked again."""
+        config = _make_config()
+        _make_builder(config).validate_configuration()
+
+        config.data_sources_spec.end_date = "2024-12-31T00:00:00"
+        with self.assertRaisesRegex(ValueError, "strictly before"):
+            _make_builder(config).validate_configuration()
+
+    def test_unknown_data_source_type(self):
+        """Test that data source types outside MDS/EDX/ANDES are rejected."""
+        config = _make_config()
+        config.data_sources_spec.data_sources[0].data_source_type = "S3"
+        with self.assertRaisesRegex(ValueError, "invalid type"):
+            _make_builder(config).validate_configuration()
+
+
+class TestCradleDataLoadingRequestCache(unittest.TestCase):
+    """Tests for the cached Cradle request and its dict form."""
+
+    def setUp(self):
+        for target, value in (
+            ("_lazy_import", _fake_lazy_import),
+            ("CRADLE_MODELS_AVAILABLE", True),
+            ("CORAL_UTILS_AVAILABLE", True),
+        ):
+            patcher = patch.object(cradle_module, target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.config = _make_config()
+        self.builder = _make_builder(self.config)
+
+    def test_data_sources_are_built_through_dispatch_table(self):
+        """Test that each data source type is built by its registered builder."""
+        request = self.builder._build_request()
+
+        (data_source,) = request.data_sources.data_sources
+        self.assertEqual(data_source.model, "DataSource")
+        self.assertEqual(data_source.data_source_type, "MDS")
+        self.assertEqual(data_source.mds_data_source_properties.model, "MdsDataSourceProperties")
+        self.assertEqual(data_source.mds_data_source_properties.output_schema[0].field_name, "objectId")
+        self.assertEqual(set(cradle_module._DATA_SOURCE_BUILDERS), {"MDS", "EDX", "ANDES"})
+
+    def test_unknown_data_source_type_is_rejected(self):
+        """Test that a data source type without a builder raises ValueError."""
+        self.config.data_sources_spec.data_sources[0].data_source_type = "S3"
+        with self.assertRaisesRegex(ValueError, "Invalid data source type"):
+            self.builder._build_request()
+
+    def test_build_request_is_cached(self):
+        """Test that an unchanged config reuses the built request."""
+        request = self.builder._build_request()
+
+        self.assertEqual(request.model, "CreateCradleDataLoadJobRequest")
+        self.assertIs(self.builder._build_request(), request)
+
+    def test_replaced_section_rebuilds_request(self):
+        """Test that replacing a spec section changes the fingerprint."""
+        request = self.builder._build_request()
+
+        self.config.transform_spec = SimpleNamespace(
+            transform_sql="SELECT objectId FROM RAW_MDS",
+            job_split_options=self.config.transform_spec.job_split_options,
+        )
+
+        rebuilt = self.builder._build_request()
+        self.assertIsNot(rebuilt, request)
+        self.assertEqual(rebuilt.transform_specification.transform_sql, "SELECT objectId FROM RAW_MDS")
+
+    def test_in_place_change_needs_invalidate_request_cache(self):
+        """Test that in-place edits are only picked up after invalidate_request_cache()."""
+        self.builder.get_request_dict()
+        self.config.data_sources_spec.start_date = "2025-01-01T12:00:00"
+
+        # The section identities are unchanged, so the cached request is still used
+        self.assertEqual(self.builder.get_request_dict()["dataSources"]["startDate"], "2025-01-01T00:00:00")
+
+        self.builder.invalidate_request_cache()
+        self.assertEqual(self.builder.get_request_dict()["dataSources"]["startDate"], "2025-01-01T12:00:00")
+
+    def test_get_request_dict_returns_independent_copies(self):
+        """Test that modifying a returned request dict does not affect later calls."""
+        first = self.builder.get_request_dict()
+        first["dataSources"]["dataSources"].append("EXTRA")
+        first["dataSources"]["startDate"] = "changed"
+
+        second = self.builder.get_request_dict()
+        self.assertEqual(second["dataSources"], {"startDate": "2025-01-01T00:00:00", "dataSources": ["RAW_MDS"]})
+
+
+class TestCradleDataLoadingSteps(unittest.TestCase):
+    """Tests for step creation and output location lookup."""
+
+    def setUp(self):
+        patcher = patch.object(cradle_module, "_lazy_import", lambda name: _FakeCradleStep)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.builder = _make_builder(_make_config())
+        self.builder._get_step_name = MagicMock(return_value="CradleDataLoading-Training")
+
+    def test_create_step_is_keyword_only(self):
+        """Test that create_step only takes keyword arguments and ignores unknown ones."""
+        dependency = MagicMock()
+        step = self.builder.create_step(dependencies=[dependency], inputs={}, outputs={})
+
+        self.assertEqual(step.name, "CradleDataLoading-Training")
+        self.assertEqual(step.depends_on, [dependency])
+        with self.assertRaises(TypeError):
+            self.builder.create_step([dependency])
+
+    def test_get_step_outputs_is_cached_per_step(self):
+        """Test that all-output lookups are cached per step and hand out copies."""
+        step = _FakeCradleStep()
+
+        outputs = self.builder.get_step_outputs(step)
+        outputs["DATA"] = "changed"
+
+        self.assertEqual(self.builder.get_step_outputs(step)["DATA"], "s3://bucket/data")
+        self.assertEqual(step.lookups, 1)
+        self.assertEqual(self.builder.get_step_outputs(step, "METADATA"), "s3://bucket/metadata")
+
+    def test_outputs_cache_does_not_keep_steps_alive(self):
+        """Test that cached outputs are dropped with their step."""
+        step = _FakeCradleStep()
+        self.builder.get_step_outputs(step)
+        self.assertEqual(len(self.builder._outputs_cache), 1)
+
+        del step
+        gc.collect()
+        self.assertEqual(len(self.builder._outputs_cache), 0)
+
+
+@unittest.skipIf(isinstance(cradle_module.parse_property_path, Mock),
+                 "property_reference was replaced by another test module's sys.modules mocks")
+class TestCompilePropertyPath(unittest.TestCase):
+    """Tests for the cached property path access steps."""
+
+    def test_spec_property_path(self):
+        """Test that a spec property path keeps the properties step and item keys."""
+        self.assertEqual(
+            cradle_module._compile_property_path("properties.ProcessingOutputConfig.Outputs['DATA'].S3Output.S3Uri"),
+            (("properties", None), ("ProcessingOutputConfig", None), ("Outputs", "DATA"),
+             ("S3Output", None), ("S3Uri", None)),
+        )
+
+    def test_array_index(self):
+        """Test that array indexing from the shared parser becomes an item access."""
+        self.assertEqual(
+            cradle_module._compile_property_path("properties.Jobs[0].Name"),
+            (("properties", None), ("Jobs", 0), ("Name", None)),
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
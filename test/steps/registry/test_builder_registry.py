@@ -2,6 +2,8 @@
 
 import unittest
 import logging
+import sys
+from unittest.mock import patch
 
 from src.cursus.steps.registry.builder_registry import StepBuilderRegistry, get_global_registry
 from src.cursus.steps.registry.step_names import STEP_NAMES, get_all_step_names
@@ -91,6 +93,84 @@ class TestBuilderRegistry(unittest.TestCase):
         if validation.get('missing'):
             logging.warning(f"Missing registry entries: {validation['missing']}")
     
+    def _make_custom_builder(self):
+        """Create a builder class from the currently loaded StepBuilderBase."""
+        # Imported at call time so the class matches the base the registry checks
+        # against, even if other tests have reloaded the module
+        from src.cursus.core.base.builder_base import StepBuilderBase
+        return type("CustomPackageStepBuilder", (StepBuilderBase,), {})
+
+    def test_version_changes_on_custom_registration(self):
+        """Test that registering and unregistering custom builders bumps the version."""
+        initial_version = self.registry._version
+        self.registry.register_builder("CustomPackage", self._make_custom_builder())
+        registered_version = self.registry._version
+        self.assertGreater(registered_version, initial_version)
+        
+        self.registry.unregister_builder("CustomPackage")
+        self.assertGreater(self.registry._version, registered_version)
+
+    def test_config_to_builder_name(self):
+        """Test the precomputed config class to builder name mapping."""
+        mapping = self.registry.config_to_builder_name
+        
+        self.assertEqual(mapping.get("XGBoostTrainingConfig"), "XGBoostTrainingStepBuilder")
+        self.assertIs(self.registry.config_to_builder_name, mapping)
+        
+        # Registering a builder rebuilds the mapping
+        self.registry.register_builder("CustomPackage", self._make_custom_builder())
+        self.addCleanup(self.registry.unregister_builder, "CustomPackage")
+        self.assertIsNot(self.registry.config_to_builder_name, mapping)
+    
+    def test_config_to_builder_name_does_not_import_lazy_builders(self):
+        """Test that lazy builders are named from their import path without importing them."""
+        builder_registry = dict(StepBuilderRegistry.BUILDER_REGISTRY)
+        builder_registry.pop("CradleDataLoading", None)
+        lazy_path = "no_such_module_for_test:CradleDataLoadingStepBuilder"
+        
+        with patch.dict(StepBuilderRegistry.BUILDER_REGISTRY, builder_registry, clear=True), \
+             patch.dict(StepBuilderRegistry.LAZY_BUILDERS, {"CradleDataLoading": lazy_path}):
+            StepBuilderRegistry._REGISTRY_VERSION += 1
+            mapping = self.registry.config_to_builder_name
+            
+            self.assertEqual(mapping.get("CradleDataLoadConfig"), "CradleDataLoadingStepBuilder")
+            self.assertEqual(StepBuilderRegistry.LAZY_BUILDERS["CradleDataLoading"], lazy_path)
+            self.assertIs(self.registry.config_to_builder_name, mapping)
+        StepBuilderRegistry._REGISTRY_VERSION += 1
+
+    def test_lazy_builder_registration(self):
+        """Test that lazily registered builders are imported on first lookup."""
+        test_module = sys.modules[__name__]
+        test_module._LazyTestStepBuilder = self._make_custom_builder()
+        self.addCleanup(delattr, test_module, "_LazyTestStepBuilder")
+        self.addCleanup(StepBuilderRegistry.BUILDER_REGISTRY.pop, "LazyTest", None)
+        self.addCleanup(StepBuilderRegistry.LAZY_BUILDERS.pop, "LazyTest", None)
+        
+        StepBuilderRegistry.register_lazy_builder("LazyTest", f"{__name__}:_LazyTestStepBuilder")
+        
+        # Support checks do not import the builder
+        self.assertTrue(self.registry.is_step_type_supported("LazyTest"))
+        self.assertIn("LazyTest", self.registry.list_supported_step_types())
+        self.assertNotIn("LazyTest", StepBuilderRegistry.BUILDER_REGISTRY)
+        
+        builder_class = self.registry.get_builder_for_step_type("LazyTest")
+        self.assertIs(builder_class, test_module._LazyTestStepBuilder)
+        self.assertIs(StepBuilderRegistry.BUILDER_REGISTRY["LazyTest"], builder_class)
+        self.assertNotIn("LazyTest", StepBuilderRegistry.LAZY_BUILDERS)
+        
+        with self.assertRaises(ValueError):
+            StepBuilderRegistry.register_lazy_builder("Broken", "no_class_separator")
+    
+    def test_failed_lazy_import_keeps_entry(self):
+        """Test that a lazy entry whose import fails stays registered."""
+        self.addCleanup(StepBuilderRegistry.LAZY_BUILDERS.pop, "LazyMissing", None)
+        StepBuilderRegistry.register_lazy_builder("LazyMissing", "no_such_module_for_test:MissingStepBuilder")
+        
+        with self.assertRaises(RegistryError):
+            self.registry.get_builder_for_step_type("LazyMissing")
+        self.assertIn("LazyMissing", StepBuilderRegistry.LAZY_BUILDERS)
+        self.assertTrue(self.registry.is_step_type_supported("LazyMissing"))
+
     def test_global_registry_singleton(self):
         """Test that the global registry is a singleton."""
         reg1 = get_global_registry()
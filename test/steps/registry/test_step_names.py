@@ -101,6 +101,7 @@ class TestStepNames(unittest.TestCase):
         spec_type_with_job = get_spec_step_type_with_job_type(step_name, "training")
         expected = f"{STEP_NAMES[step_name]['spec_type']}_Training"
         self.assertEqual(spec_type_with_job, expected)
+        self.assertIs(get_spec_step_type_with_job_type(step_name, "training"), spec_type_with_job)
         
         # Test with invalid step name
         with self.assertRaises(ValueError):
@@ -8,6 +8,7 @@ import pickle as pkl
 from pathlib import Path
 import numpy as np
 import pandas as pd
+import xgboost as xgb
 
 # Import the functions to be tested
 from src.cursus.steps.scripts.xgboost_model_evaluation import (
@@ -118,6 +119,54 @@ class TestModelEvaluationHelpers(unittest.TestCase):
         # Verify result contains only feature columns
         self.assertEqual(list(result.columns), feature_columns)
 
+    @patch('src.cursus.steps.scripts.xgboost_model_evaluation.RiskTableMappingProcessor')
+    def test_preprocess_eval_data_maps_risk_tables_directly(self, mock_risk_processor_class):
+        """Test that well-formed risk tables are mapped without building a processor."""
+        df = pd.DataFrame({
+            'feature1': ['A', 'B', 'C'],
+            'feature2': [1.0, np.nan, 3.0]
+        })
+        feature_columns = ['feature1', 'feature2']
+        risk_tables = {'feature1': {'bins': {'A': 0.1, 'B': 0.2}, 'default_bin': 0.5}}
+        impute_dict = {'feature2': 2.0}
+
+        result = preprocess_eval_data(df, feature_columns, risk_tables, impute_dict)
+
+        mock_risk_processor_class.assert_not_called()
+        np.testing.assert_allclose(result['feature1'].values, [0.1, 0.2, 0.5], rtol=1e-6)
+        np.testing.assert_allclose(result['feature2'].values, [1.0, 2.0, 3.0])
+
+    def test_preprocess_eval_data_coerces_non_numeric_features(self):
+        """Test that non-numeric feature columns are coerced and missing values become 0."""
+        df = pd.DataFrame({
+            'feature1': ['1.5', 'bad', '3'],
+            'feature2': [1.0, 2.0, 3.0],
+            'other_col': ['x', 'y', 'z']
+        })
+
+        result = preprocess_eval_data(df, ['feature1', 'feature2'], {}, {'feature2': 0.0})
+
+        self.assertEqual(list(result.columns), ['feature1', 'feature2'])
+        self.assertTrue(all(dtype == np.float32 for dtype in result.dtypes))
+        np.testing.assert_allclose(result['feature1'].values, [1.5, 0.0, 3.0])
+        np.testing.assert_allclose(result['feature2'].values, [1.0, 2.0, 3.0])
+
+    def test_preprocess_eval_data_imputes_only_originally_missing_values(self):
+        """Test that imputation fills values missing before coercion, not values that fail to parse."""
+        df = pd.DataFrame({
+            'feature1': pd.Series(['1.5', None, 'bad'], dtype=object),
+            'feature2': [np.nan, 2.0, 3.0],
+            'feature3': [np.nan, 5.0, 6.0]
+        })
+
+        result = preprocess_eval_data(
+            df, ['feature1', 'feature2', 'feature3'], {}, {'feature1': 9.0, 'feature2': 7.0}
+        )
+
+        np.testing.assert_allclose(result['feature1'].values, [1.5, 9.0, 0.0])
+        np.testing.assert_allclose(result['feature2'].values, [7.0, 2.0, 3.0])
+        np.testing.assert_allclose(result['feature3'].values, [0.0, 5.0, 6.0])
+
     @patch('src.cursus.steps.scripts.xgboost_model_evaluation.logger')
     def test_log_metrics_summary_binary(self, mock_logger):
         """Test logging metrics summary for binary classification."""
@@ -138,6 +187,15 @@ class TestModelEvaluationHelpers(unittest.TestCase):
         self.assertTrue(any("Average Precision" in arg for arg in call_args))
         self.assertTrue(any("F1 Score" in arg for arg in call_args))
 
+        # Per-metric lines are batched into a single log record
+        metric_records = [
+            call[0][1] for call in mock_logger.info.call_args_list
+            if len(call[0]) > 1 and "METRIC: " in call[0][1]
+        ]
+        self.assertEqual(len(metric_records), 1)
+        self.assertEqual(metric_records[0].count("METRIC: "), len(metrics))
+        self.assertIn("METRIC: auc_roc                   = 0.8500", metric_records[0])
+
     @patch('src.cursus.steps.scripts.xgboost_model_evaluation.logger')
     def test_log_metrics_summary_multiclass(self, mock_logger):
         """Test logging metrics summary for multiclass classification."""
@@ -180,6 +238,25 @@ class TestModelEvaluationHelpers(unittest.TestCase):
         self.assertGreaterEqual(metrics['f1_score'], 0)
         self.assertLessEqual(metrics['f1_score'], 1)
 
+    def test_compute_metrics_binary_threshold_sweep_matches_sklearn(self):
+        """Test that curve-derived threshold metrics match direct sklearn scoring."""
+        from sklearn.metrics import f1_score, precision_score, recall_score
+
+        y_true = np.array([0, 1, 0, 1, 1, 0, 1, 0, 1, 0])
+        # float32 scores, including values exactly on the 0.3/0.5/0.7 thresholds
+        y_score = np.array([0.2, 0.7, 0.1, 0.5, 0.9, 0.3, 0.6, 0.5, 0.3, 0.8], dtype=np.float32)
+        y_prob = np.column_stack([1 - y_score, y_score])
+
+        metrics = compute_metrics_binary(y_true, y_prob)
+
+        self.assertAlmostEqual(metrics['f1_score'], f1_score(y_true, y_score > 0.5))
+        for threshold in [0.3, 0.5, 0.7]:
+            self.assertAlmostEqual(
+                metrics[f'f1_score_at_{threshold}'], f1_score(y_true, y_score >= threshold)
+            )
+        self.assertAlmostEqual(metrics['precision_at_threshold_0.5'], precision_score(y_true, y_score >= 0.5))
+        self.assertAlmostEqual(metrics['recall_at_threshold_0.5'], recall_score(y_true, y_score >= 0.5))
+
     def test_compute_metrics_multiclass(self):
         """Test computing multiclass classification metrics."""
         np.random.seed(42)
@@ -200,6 +277,8 @@ class TestModelEvaluationHelpers(unittest.TestCase):
             self.assertIn(f'auc_roc_class_{i}', metrics)
             self.assertIn(f'f1_score_class_{i}', metrics)
             self.assertIn(f'class_{i}_count', metrics)
+            self.assertEqual(metrics[f'class_{i}_count'], int(np.sum(y_true == i)))
+            self.assertAlmostEqual(metrics[f'class_{i}_ratio'], np.mean(y_true == i))
 
     def test_load_eval_data_csv(self):
         """Test loading evaluation data from CSV."""
@@ -235,6 +314,61 @@ class TestModelEvaluationHelpers(unittest.TestCase):
         
         pd.testing.assert_frame_equal(result, df)
 
+    def test_load_eval_data_picks_first_file_in_sorted_order(self):
+        """Test that the first .csv/.parquet file in sorted path order is loaded."""
+        eval_dir = self.temp_dir / "eval_data"
+        (eval_dir / "b_dir").mkdir(parents=True)
+        (eval_dir / "a_dir" / "nested").mkdir(parents=True)
+        (eval_dir / "a_dir" / "notes.txt").write_text("not data")
+        pd.DataFrame({'id': [1]}).to_csv(eval_dir / "b_dir" / "part.csv", index=False)
+        pd.DataFrame({'id': [2]}).to_csv(eval_dir / "c.csv", index=False)
+        pd.DataFrame({'id': [3]}).to_parquet(eval_dir / "a_dir" / "nested" / "part.parquet", index=False)
+
+        result = load_eval_data(str(eval_dir))
+
+        self.assertEqual(result['id'].tolist(), [3])
+
+    def test_load_eval_data_reads_partitioned_parquet_directory(self):
+        """Test that a data.parquet/ directory of parts is loaded whole, as the sorted glob picked it."""
+        eval_dir = self.temp_dir / "eval_data"
+        dataset_dir = eval_dir / "data.parquet"
+        dataset_dir.mkdir(parents=True)
+        df = pd.DataFrame({
+            'id': [1, 2, 3, 4],
+            'label': [0, 1, 0, 1],
+            'unused': ['w', 'x', 'y', 'z'],
+            'feature1': [0.1, 0.5, 0.9, 0.3]
+        })
+        df.iloc[:2].to_parquet(dataset_dir / "part-0.parquet", index=False)
+        df.iloc[2:].to_parquet(dataset_dir / "part-1.parquet", index=False)
+
+        result = load_eval_data(str(eval_dir))
+        self.assertEqual(sorted(result['id'].tolist()), [1, 2, 3, 4])
+
+        projected = load_eval_data(str(eval_dir), ['feature1'], 'id', 'label')
+        self.assertEqual(list(projected.columns), ['id', 'label', 'feature1'])
+        self.assertEqual(len(projected), 4)
+
+    def test_load_eval_data_projects_columns(self):
+        """Test that only feature, id and label columns are read when features are given."""
+        df = pd.DataFrame({
+            'id': [1, 2, 3],
+            'label': [0, 1, 0],
+            'unused': ['x', 'y', 'z'],
+            'feature1': [0.1, 0.5, 0.9]
+        })
+        for suffix in ("csv", "parquet"):
+            eval_dir = self.temp_dir / f"eval_data_{suffix}"
+            eval_dir.mkdir()
+            if suffix == "csv":
+                df.to_csv(eval_dir / "eval_data.csv", index=False)
+            else:
+                df.to_parquet(eval_dir / "eval_data.parquet", index=False)
+
+            result = load_eval_data(str(eval_dir), ['feature1'], 'id', 'label')
+
+            pd.testing.assert_frame_equal(result, df[['id', 'label', 'feature1']])
+
     def test_load_eval_data_no_files(self):
         """Test loading evaluation data when no files exist."""
         eval_dir = self.temp_dir / "eval_data"
@@ -286,6 +420,39 @@ class TestModelEvaluationHelpers(unittest.TestCase):
         })
         pd.testing.assert_frame_equal(result_df, expected_df)
 
+    def test_save_predictions_mixed_type_ids(self):
+        """Test saving predictions when ids mix Python types."""
+        output_dir = self.temp_dir / "output"
+        output_dir.mkdir()
+
+        ids = np.array(['a', 2, 'c'], dtype=object)
+        y_true = np.array([0, 1, 0])
+        y_prob = np.array([[0.8, 0.2], [0.3, 0.7], [0.9, 0.1]])
+
+        save_predictions(ids, y_true, y_prob, 'id', 'label', str(output_dir))
+
+        result_df = pd.read_csv(output_dir / "eval_predictions.csv")
+        self.assertEqual(list(result_df.columns), ['id', 'label', 'prob_class_0', 'prob_class_1'])
+        self.assertEqual(list(result_df['id'].astype(str)), ['a', '2', 'c'])
+
+    def test_save_predictions_csv_format(self):
+        """Test that the CSV keeps the pandas format: unquoted header and ids, repr-style floats."""
+        output_dir = self.temp_dir / "output"
+        output_dir.mkdir()
+
+        ids = np.array(['a', 'b'], dtype=object)
+        y_true = np.array([0, 1])
+        y_prob = np.array([[1e-9, 1.0], [0.25, 0.75]])
+
+        save_predictions(ids, y_true, y_prob, 'id', 'label', str(output_dir))
+
+        self.assertEqual(
+            (output_dir / "eval_predictions.csv").read_text(),
+            "id,label,prob_class_0,prob_class_1\n"
+            "a,0,1e-09,1.0\n"
+            "b,1,0.25,0.75\n"
+        )
+
     def test_save_metrics(self):
         """Test saving metrics to JSON."""
         output_dir = self.temp_dir / "output"
@@ -339,13 +506,31 @@ class TestModelEvaluationHelpers(unittest.TestCase):
         y_score = np.array([0.2, 0.8, 0.3, 0.9])
         
         plot_and_save_pr_curve(y_true, y_score, str(output_dir))
-        
+
         # Verify plotting functions were called
         mock_plt.figure.assert_called_once()
         mock_plt.plot.assert_called()
         mock_plt.savefig.assert_called_once()
         mock_plt.close.assert_called_once()
 
+    @patch('src.cursus.steps.scripts.xgboost_model_evaluation.plt')
+    def test_plot_curves_reuse_given_axes(self, mock_plt):
+        """Test that plotting onto a given axes reuses it instead of opening a new figure."""
+        output_dir = self.temp_dir / "output"
+        output_dir.mkdir()
+
+        y_true = np.array([0, 1, 0, 1])
+        y_score = np.array([0.2, 0.8, 0.3, 0.9])
+        ax = MagicMock()
+
+        plot_and_save_roc_curve(y_true, y_score, str(output_dir), ax=ax)
+        plot_and_save_pr_curve(y_true, y_score, str(output_dir), ax=ax)
+
+        self.assertEqual(ax.clear.call_count, 2)
+        self.assertEqual(mock_plt.savefig.call_count, 2)
+        mock_plt.figure.assert_not_called()
+        mock_plt.close.assert_not_called()
+
 
 class TestModelEvaluationIntegration(unittest.TestCase):
     """Integration tests for model evaluation functions."""
@@ -376,7 +561,7 @@ class TestModelEvaluationIntegration(unittest.TestCase):
         
         # Mock model
         mock_model = MagicMock()
-        mock_model.predict.return_value = np.array([0.2, 0.8, 0.3, 0.9])
+        mock_model.inplace_predict.return_value = np.array([0.2, 0.8, 0.3, 0.9])
         
         # Mock DMatrix
         mock_dmatrix_instance = MagicMock()
@@ -393,8 +578,13 @@ class TestModelEvaluationIntegration(unittest.TestCase):
             str(output_eval_dir), str(output_metrics_dir)
         )
         
-        # Verify model was called
-        mock_model.predict.assert_called_once_with(mock_dmatrix_instance)
+        # Verify model was called in place on a float32 array, without a DMatrix
+        mock_model.inplace_predict.assert_called_once()
+        X = mock_model.inplace_predict.call_args[0][0]
+        self.assertEqual(X.dtype, np.float32)
+        self.assertEqual(X.shape, (4, 2))
+        mock_dmatrix.assert_not_called()
+        mock_model.predict.assert_not_called()
         
         # Verify output files were created
         self.assertTrue((output_eval_dir / "eval_predictions.csv").exists())
@@ -420,8 +610,9 @@ class TestModelEvaluationIntegration(unittest.TestCase):
         feature_columns = ['feature1', 'feature2']
         hyperparams = {'is_binary': False}
         
-        # Mock model - return multiclass probabilities
+        # Mock model - inplace prediction unsupported, DMatrix path returns multiclass probabilities
         mock_model = MagicMock()
+        mock_model.inplace_predict.side_effect = xgb.core.XGBoostError("not supported")
         mock_model.predict.return_value = np.array([
             [0.7, 0.2, 0.1],
             [0.1, 0.8, 0.1],